@@ -0,0 +1,5 @@
+"""Criterion Closet Picks data pipeline scripts.
+
+Run a script as a module from the repo root (python -m scripts.<name>) or
+directly (python scripts/<name>.py).
+"""
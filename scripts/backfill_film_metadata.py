@@ -429,12 +429,13 @@ def main() -> int:
     catalog = load_json(CATALOG_FILE)
     audit = load_json(args.audit_json)
     issues = audit.get("issues", []) if isinstance(audit, dict) else []
-    repaired_catalog, report = backfill_film_metadata(
-        catalog,
-        issues,
-        TMDBClient(),
-        load_tmdb_overrides(),
-    )
+    with TMDBClient() as client:
+        repaired_catalog, report = backfill_film_metadata(
+            catalog,
+            issues,
+            client,
+            load_tmdb_overrides(),
+        )
     markdown = render_markdown(report)
 
     if not args.dry_run:
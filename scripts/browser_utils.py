@@ -1,13 +1,26 @@
 """
 Playwright-based browser for scraping Criterion.com.
 Replaces cloudscraper to bypass Cloudflare Managed Challenge (Turnstile).
+
+Cookies (including Cloudflare's cf_clearance) are saved to STATE_FILE when a
+browser closes and restored when the next one opens, so a new run or a new
+worker starts with the challenge already solved.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 
 from playwright.sync_api import sync_playwright, Playwright, Browser, BrowserContext, Page
 from playwright_stealth import Stealth
 
+from scripts.utils import DATA_DIR, load_json, log, save_json
+
+STATE_FILE = DATA_DIR / "cache" / "criterion_browser_state.json"
+
+# Subresources a markup-only scrape never reads. Scripts and stylesheets still
+# load: the Cloudflare challenge needs them.
+ASSET_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
 
 @dataclass
 class FetchResult:
@@ -16,6 +29,14 @@ class FetchResult:
     status_code: int
     text: str
     url: str
+    headers: dict[str, str] = field(default_factory=dict)  # lower-cased names
+
+
+def _abort_assets(route) -> None:
+    if route.request.resource_type in ASSET_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
 
 
 class CriterionBrowser:
@@ -26,9 +47,14 @@ class CriterionBrowser:
         with CriterionBrowser() as browser:
             result = browser.fetch("https://www.criterion.com/...", timeout=30)
             # result.status_code, result.text, result.url
+
+    With skip_assets=True, images, media and fonts are never downloaded, for
+    scrapes that only read the page's HTML.
     """
 
-    def __init__(self):
+    def __init__(self, state_file: Path | None = STATE_FILE, skip_assets: bool = False):
+        self._state_file = state_file
+        self._skip_assets = skip_assets
         self._stealth = Stealth()
         self._pw_cm = None
         self._pw: Playwright | None = None
@@ -45,18 +71,44 @@ class CriterionBrowser:
         )
         self._context = self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
+            storage_state=self._load_state(),
         )
         self._page = self._context.new_page()
+        if self._skip_assets:
+            self._page.route("**/*", _abort_assets)
         return self
 
     def __exit__(self, *exc):
         if self._context:
+            self.save_state()
             self._context.close()
         if self._browser:
             self._browser.close()
         if self._pw_cm:
             self._pw_cm.__exit__(*exc)
 
+    def _load_state(self) -> dict | None:
+        """Saved cookies/storage from an earlier browser, if any and readable."""
+        if self._state_file is None or not self._state_file.exists():
+            return None
+        try:
+            return load_json(self._state_file)
+        except Exception as e:
+            log(f"  Ignoring unreadable browser state {self._state_file}: {e}")
+            return None
+
+    def save_state(self) -> None:
+        """Save cookies now, so browsers opened before this one closes share them."""
+        if self._state_file is None:
+            return
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            # Each save_json call writes its own temp file and renames it into
+            # place, so workers closing together can't tear the file
+            save_json(self._state_file, self._context.storage_state())
+        except Exception as e:
+            log(f"  Could not save browser state: {e}")
+
     def fetch(self, url: str, timeout: int = 30) -> FetchResult:
         """
         Navigate to url and return a FetchResult with status_code, text, and final url.
@@ -68,6 +120,7 @@ class CriterionBrowser:
             timeout=timeout * 1000,
         )
         status = response.status if response else 0
+        headers = response.headers if response else {}
         final_url = self._page.url
         html = self._page.content()
-        return FetchResult(status_code=status, text=html, url=final_url)
+        return FetchResult(status_code=status, text=html, url=final_url, headers=headers)
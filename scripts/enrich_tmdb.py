@@ -8,10 +8,14 @@ Output: updated criterion_catalog.json + guests.json
 """
 
 import argparse
+import json
 import re
+import sqlite3
 import sys
 import time
 import unicodedata
+from pathlib import Path
+from urllib.parse import urlencode
 
 import atexit
 
@@ -34,6 +38,7 @@ from scripts.utils import (
     save_json,
     log,
     get_env,
+    retry_after,
     slugify,
     titles_conflict_on_volume,
 )
@@ -53,6 +58,14 @@ def load_suppressed_tmdb_ids() -> set[str]:
 TMDB_BASE = "https://api.themoviedb.org/3"
 TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p"
 
+# Successful TMDB responses are cached on disk: every re-run re-queries the
+# films that are still not fully enriched. The TTL is short enough that a
+# title newly added to TMDB is picked up within a week.
+TMDB_CACHE_FILE = DATA_DIR / "cache" / "tmdb.sqlite"
+TMDB_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+TMDB_MAX_ATTEMPTS = 4
+TMDB_MAX_RETRY_DELAY = 60  # seconds; caps a server-supplied Retry-After
+
 # Map TMDB known_for_department to our profession enum.
 # These values (+ "other" fallback) are the ENTIRE controlled vocabulary for
 # guest.profession site-wide — always single-word, never multi-role labels like
@@ -241,16 +254,42 @@ def build_criterion_url_lookup(picks_raw: list[dict]) -> dict[str, str]:
 
 
 class TMDBClient:
-    """TMDB API client with rate limiting."""
+    """TMDB API client with rate limiting, a keep-alive HTTP session and an
+    optional on-disk response cache (pass cache_path, e.g. TMDB_CACHE_FILE,
+    to enable it). Audit and repair callers leave it off so they see live data."""
 
-    def __init__(self):
+    def __init__(self, cache_path: Path | None = None):
         self.token = get_env("TMDB_READ_ACCESS_TOKEN")
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json",
         }
+        # One pooled session, so consecutive calls reuse the TLS connection
+        # instead of handshaking per request.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self._genre_cache = {}
         self._last_request = 0
+        self._cache = None
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(cache_path)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body TEXT, fetched_at INT)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and the response cache."""
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
     def _rate_limit(self):
         """Ensure at least 50ms between requests (~20 req/s)."""
@@ -259,20 +298,46 @@ class TMDBClient:
             time.sleep(0.05 - elapsed)
         self._last_request = time.time()
 
+    def _cached(self, key: str) -> dict | None:
+        if self._cache is None:
+            return None
+        row = self._cache.execute(
+            "SELECT body FROM responses WHERE key = ? AND fetched_at > ?",
+            (key, int(time.time()) - TMDB_CACHE_TTL_SECONDS),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _store(self, key: str, body: str) -> None:
+        if self._cache is None:
+            return
+        with self._cache:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at) VALUES (?, ?, ?)",
+                (key, body, int(time.time())),
+            )
+
     def _get(self, endpoint: str, params: dict = None) -> dict | None:
-        """Make a GET request to the TMDB API."""
-        self._rate_limit()
+        """Make a GET request to the TMDB API, or answer it from the cache."""
+        key = f"{endpoint}?{urlencode(sorted((params or {}).items()))}"
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
         url = f"{TMDB_BASE}{endpoint}"
         try:
-            resp = requests.get(url, headers=self.headers, params=params, timeout=15)
+            for attempt in range(TMDB_MAX_ATTEMPTS):
+                self._rate_limit()
+                resp = self.session.get(url, params=params, timeout=15)
+                if resp.status_code != 429 or attempt == TMDB_MAX_ATTEMPTS - 1:
+                    break
+                # Rate limited: wait as long as TMDB asks (up to a minute),
+                # else back off 2s, 4s, 8s
+                delay = retry_after(resp)
+                delay = 2 ** (attempt + 1) if delay is None else min(delay, TMDB_MAX_RETRY_DELAY)
+                time.sleep(delay)
             if resp.status_code == 200:
+                self._store(key, resp.text)
                 return resp.json()
-            elif resp.status_code == 429:
-                # Rate limited, wait and retry
-                time.sleep(2)
-                resp = requests.get(url, headers=self.headers, params=params, timeout=15)
-                if resp.status_code == 200:
-                    return resp.json()
             return None
         except Exception as e:
             log(f"  TMDB error: {e}")
@@ -713,9 +778,12 @@ def main():
     parser.add_argument("--limit", type=int, default=0, help="Limit items to enrich")
     parser.add_argument("--force-guests", action="store_true",
                         help="Re-enrich guests missing either profession or photo")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore the on-disk TMDB response cache and fetch everything live")
     args = parser.parse_args()
 
-    client = TMDBClient()
+    client = TMDBClient(cache_path=None if args.no_cache else TMDB_CACHE_FILE)
+    atexit.register(client.close)
 
     # Load manual TMDB corrections from data file
     corrections_file = DATA_DIR / "tmdb_corrections.json"
@@ -7,11 +7,13 @@ Output: updated guests.json + data/transcripts/{video_id}.json
 """
 
 import argparse
-import json
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from tqdm import tqdm
 
@@ -25,6 +27,8 @@ from scripts.utils import (
     log,
     fuzzy_match_name,
     fuzzy_match_score,
+    fuzzy_match_scores,
+    fuzzy_prepare,
     slugify,
 )
 
@@ -32,64 +36,106 @@ from scripts.utils import (
 PLAYLIST_URL = "https://www.youtube.com/playlist?list=PL7D89754A5DAD1E8E"
 SEARCH_URL = "https://www.youtube.com/@CriterionCollection/search?query=closet+picks"
 
+# Concurrent transcript fetches; small enough to stay polite to YouTube.
+TRANSCRIPT_WORKERS = 8
+
+# Whole-listing bound for a yt-dlp playlist/search extraction (seconds).
+YT_DLP_TIMEOUT = 180
 
-def _fetch_yt_dlp_videos(url: str) -> list[dict]:
-    """Fetch video metadata from a YouTube URL via yt-dlp."""
-    cmd = [
-        "yt-dlp",
-        "--flat-playlist",
-        "--dump-json",
-        "--no-warnings",
-        url,
-    ]
 
+def _fetch_yt_dlp_videos(url: str) -> list[dict]:
+    """Fetch video metadata from a YouTube URL via the yt-dlp Python API."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
-        if result.returncode != 0:
-            log(f"  yt-dlp error: {result.stderr[:300]}")
-            return []
-    except subprocess.TimeoutExpired:
-        log("  yt-dlp timed out")
-        return []
-    except FileNotFoundError:
+        from yt_dlp import YoutubeDL
+        from yt_dlp.utils import DownloadError
+    except ImportError:
         log("  yt-dlp not found. Install with: pip install yt-dlp")
         return []
 
+    # In-process equivalent of `yt-dlp --flat-playlist --dump-json`: entries
+    # come back as Python dicts, with no subprocess or JSON round trip.
+    opts = {
+        "extract_flat": "in_playlist",
+        "skip_download": True,
+        "quiet": True,
+        "no_warnings": True,
+        "socket_timeout": 30,
+    }
+    try:
+        with YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+    except DownloadError as e:
+        log(f"  yt-dlp error: {str(e)[:300]}")
+        return []
+
     videos = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
+    for data in (info or {}).get("entries") or []:
+        if not data:
             continue
-        try:
-            data = json.loads(line)
-            # Skip playlist/tab entries
-            if data.get("_type") == "url" and data.get("ie_key") == "YoutubeTab":
-                continue
-            video = {
-                "video_id": data.get("id", ""),
-                "title": data.get("title", ""),
-                "upload_date": data.get("upload_date", ""),
-                "duration": data.get("duration"),
-                "url": data.get("url", f"https://www.youtube.com/watch?v={data.get('id', '')}"),
-            }
-            if video["video_id"]:
-                videos.append(video)
-        except json.JSONDecodeError:
+        # Skip playlist/tab entries
+        if data.get("_type") == "url" and data.get("ie_key") == "YoutubeTab":
             continue
+        video = {
+            "video_id": data.get("id", ""),
+            "title": data.get("title", ""),
+            "upload_date": data.get("upload_date", ""),
+            "duration": data.get("duration"),
+            "url": data.get("url", f"https://www.youtube.com/watch?v={data.get('id', '')}"),
+        }
+        if video["video_id"]:
+            videos.append(video)
 
     return videos
 
 
+def _fetch_yt_dlp_listings(urls: list[str], timeout: float = YT_DLP_TIMEOUT) -> list[list[dict]]:
+    """
+    Run _fetch_yt_dlp_videos for each URL at once, each bounded by timeout.
+
+    The extractions are network-bound and release the GIL, so they overlap on
+    threads. yt-dlp has no whole-run timeout -- socket_timeout only bounds a
+    single read, not a slow paginated extraction -- so a listing still running
+    at the deadline is abandoned and counts as empty, as the old subprocess
+    was killed. Its thread is a daemon, so it cannot keep the process alive.
+    """
+    results: dict[str, list[dict]] = {}
+
+    def run(url: str) -> None:
+        # An unexpected extractor or network error must not take the whole
+        # match run down with it; that listing just counts as empty.
+        try:
+            results[url] = _fetch_yt_dlp_videos(url)
+        except Exception as e:
+            log(f"  yt-dlp failed for {url}: {str(e)[:300]}")
+            results[url] = []
+
+    threads = [threading.Thread(target=run, args=(url,), daemon=True) for url in urls]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + timeout
+    listings = []
+    for url, t in zip(urls, threads):
+        t.join(max(deadline - time.monotonic(), 0))
+        if t.is_alive():
+            log(f"  yt-dlp timed out after {timeout:g}s: {url}")
+            listings.append([])
+        else:
+            listings.append(results[url])
+    return listings
+
+
 def get_playlist_videos(playlist_url: str = PLAYLIST_URL) -> list[dict]:
     """
     Fetch video metadata from the official playlist + channel search.
     Merges and deduplicates by video_id.
     """
+    log("Fetching official playlist and channel search results via yt-dlp...")
+    playlist_videos, search_videos = _fetch_yt_dlp_listings([playlist_url, SEARCH_URL])
+
     seen_ids = set()
     all_videos = []
 
     # Primary: official playlist
-    log("Fetching official playlist via yt-dlp...")
-    playlist_videos = _fetch_yt_dlp_videos(playlist_url)
     log(f"  Official playlist: {len(playlist_videos)} videos")
     for v in playlist_videos:
         if v["video_id"] not in seen_ids:
@@ -97,8 +143,6 @@ def get_playlist_videos(playlist_url: str = PLAYLIST_URL) -> list[dict]:
             seen_ids.add(v["video_id"])
 
     # Secondary: channel search (catches videos not in the playlist)
-    log("Fetching channel search results via yt-dlp...")
-    search_videos = _fetch_yt_dlp_videos(SEARCH_URL)
     log(f"  Channel search: {len(search_videos)} videos")
     for v in search_videos:
         if v["video_id"] not in seen_ids:
@@ -109,6 +153,32 @@ def get_playlist_videos(playlist_url: str = PLAYLIST_URL) -> list[dict]:
     return all_videos
 
 
+# Video-title patterns, most specific first (see parse_guest_name_from_video_title).
+# Pattern 1: "Name's Closet/DVD Picks" (possessive with smart or regular apostrophe).
+# "Mobile" covers episodes shot at the travelling closet, which are still
+# single-guest episodes (unlike the multi-guest Mobile Closet event videos,
+# which are filtered out via EXCLUDED_VIDEO_IDS).
+_POSSESSIVE_TITLE_RE = re.compile(
+    r"^(.+?)(?:'s|'s|\u2019s)\s+(?:Criterion\s+)?(?:Mobile\s+)?(?:Closet\s+|DVD\s+)?(?:Picks?|Favorites?)",
+    re.IGNORECASE,
+)
+# Pattern 2: "Name Picks His/Her/Their Criterion..."
+_PICKS_THEIR_TITLE_RE = re.compile(
+    r"^(.+?)\s+Picks?\s+(?:His|Her|Their)\s+(?:Criterion\s+)?(?:Closet\s+)?(?:Favorites?|Picks?)",
+    re.IGNORECASE,
+)
+# Pattern 3: "Name | Closet Picks" or "Name - Closet Picks"
+_SEPARATOR_TITLE_RE = re.compile(r"^(.+?)\s*[|\-\u2013\u2014]\s*(?:Criterion\s+)?Closet", re.IGNORECASE)
+# Pattern 4: "Criterion Closet Picks: Name" or "Closet Picks: Name"
+_PREFIX_TITLE_RE = re.compile(r"(?:Criterion\s+)?Closet\s+Picks?[:\s]+(.+)", re.IGNORECASE)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_CLOSET_PICKS_TITLE_RE = re.compile(r"closet picks|closet favorites|dvd picks", re.IGNORECASE)
+
+
+# Pure functions called per video x guest in the match loops; cache by input.
+@lru_cache(maxsize=4096)
 def parse_guest_name_from_video_title(title: str) -> str:
     """
     Extract guest name from YouTube video title.
@@ -122,55 +192,44 @@ def parse_guest_name_from_video_title(title: str) -> str:
     """
     title = title.strip()
 
-    # Pattern 1 (most specific): "Name's Closet/DVD Picks" (possessive with smart or regular apostrophe)
-    # "Mobile" covers episodes shot at the travelling closet, which are still
-    # single-guest episodes (unlike the multi-guest Mobile Closet event videos,
-    # which are filtered out via EXCLUDED_VIDEO_IDS).
-    m = re.match(
-        r"^(.+?)(?:'s|'s|\u2019s)\s+(?:Criterion\s+)?(?:Mobile\s+)?(?:Closet\s+|DVD\s+)?(?:Picks?|Favorites?)",
-        title,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1).strip()
-
-    # Pattern 2: "Name Picks His/Her/Their Criterion..."
-    m = re.match(
-        r"^(.+?)\s+Picks?\s+(?:His|Her|Their)\s+(?:Criterion\s+)?(?:Closet\s+)?(?:Favorites?|Picks?)",
-        title,
-        re.IGNORECASE,
+    m = (
+        _POSSESSIVE_TITLE_RE.match(title)
+        or _PICKS_THEIR_TITLE_RE.match(title)
+        or _SEPARATOR_TITLE_RE.match(title)
+        or _PREFIX_TITLE_RE.search(title)
     )
     if m:
         return m.group(1).strip()
 
-    # Pattern 3: "Name | Closet Picks" or "Name - Closet Picks"
-    m = re.match(r"^(.+?)\s*[|\-\u2013\u2014]\s*(?:Criterion\s+)?Closet", title, re.IGNORECASE)
-    if m:
-        return m.group(1).strip()
-
-    # Pattern 4: "Criterion Closet Picks: Name" or "Closet Picks: Name"
-    m = re.search(r"(?:Criterion\s+)?Closet\s+Picks?[:\s]+(.+)", title, re.IGNORECASE)
-    if m:
-        return m.group(1).strip()
-
     return title
 
 
+@lru_cache(maxsize=4096)
 def _normalize_name(name: str) -> str:
     """Normalize a name for matching: lowercase, remove hyphens, extra spaces."""
     name = name.lower().strip()
     name = name.replace("-", " ").replace("'s", "").replace("\u2019s", "")
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE_RE.sub(" ", name)
     return name
 
 
+def _title_name_variants(title: str) -> list[str]:
+    """
+    Names to match a video title against guests: the normalized parsed name,
+    plus each part of a compound name (e.g., "Cate Blanchett and Todd Field"
+    should match "Cate Blanchett").
+    """
+    parsed_name = parse_guest_name_from_video_title(title)
+    variants = [_normalize_name(parsed_name)]
+    if " and " in parsed_name.lower():
+        variants.extend(part.strip() for part in parsed_name.lower().split(" and "))
+    return variants
+
+
 def _is_closet_picks_video(title: str) -> bool:
     """Check if a video title is a Closet Picks episode (not a related video)."""
-    title_lower = title.lower()
     # Must contain "closet picks" or "dvd picks" or "closet favorites"
-    return any(phrase in title_lower for phrase in [
-        "closet picks", "closet favorites", "dvd picks",
-    ])
+    return _CLOSET_PICKS_TITLE_RE.search(title) is not None
 
 
 def match_videos_to_guests(
@@ -188,7 +247,7 @@ def match_videos_to_guests(
     else:
         target_names = {g["name"] for g in guests}
 
-    # First pass: collect all potential matches for each guest
+    # First pass: track the best-scoring video for each guest
     # Skip guests that already have a video ID (set by Criterion page extraction)
     guests_needing_video = []
     for guest in guests:
@@ -199,52 +258,45 @@ def match_videos_to_guests(
 
     log(f"  {len(guests) - len(guests_needing_video)} guests already have video IDs, matching {len(guests_needing_video)}")
 
-    guest_candidates: dict[str, list[tuple[dict, int]]] = {g["slug"]: [] for g in guests_needing_video}
-
-    for video in videos:
-        # Only consider actual Closet Picks videos
-        if not _is_closet_picks_video(video["title"]):
-            continue
-
-        parsed_name = parse_guest_name_from_video_title(video["title"])
-        parsed_norm = _normalize_name(parsed_name)
-
-        for guest in guests_needing_video:
-            if pilot_only and guest["name"] not in target_names:
-                continue
-
-            guest_norm = _normalize_name(guest["name"])
-
-            # Try multiple matching strategies
-            score = fuzzy_match_score(parsed_norm, guest_norm)
-
-            # Also try matching against parts of compound names
-            # e.g., "Cate Blanchett and Todd Field" should match "Cate Blanchett"
-            if " and " in parsed_name.lower():
-                parts = parsed_name.lower().split(" and ")
-                for part in parts:
-                    part_score = fuzzy_match_score(part.strip(), guest_norm)
-                    score = max(score, part_score)
-
-            if score >= 70:
-                guest_candidates[guest["slug"]].append((video, score))
-
-    # Second pass: pick the best video per guest
+    if pilot_only:
+        guests_needing_video = [g for g in guests_needing_video if g["name"] in target_names]
+
+    # guest_slug -> (score, video); a later video only wins with a strictly
+    # higher score, so ties go to the earliest video.
+    best_per_guest: dict[str, tuple[int, dict]] = {}
+    guest_norms = [fuzzy_prepare(_normalize_name(g["name"])) for g in guests_needing_video]
+
+    # Only consider actual Closet Picks videos; classify each title once.
+    closet_videos = [v for v in videos if _is_closet_picks_video(v["title"])]
+
+    for video in closet_videos:
+        # Score each name variant against every guest in one batch call per
+        # variant; keep the best score per guest.
+        rows = _title_name_variants(video["title"])
+
+        best_scores: dict[int, int] = {}
+        for row in rows:
+            for guest_idx, score in fuzzy_match_scores(row, guest_norms, threshold=70):
+                if score > best_scores.get(guest_idx, -1):
+                    best_scores[guest_idx] = score
+
+        for guest_idx, score in best_scores.items():
+            slug = guests_needing_video[guest_idx]["slug"]
+            prev = best_per_guest.get(slug)
+            if prev is None or score > prev[0]:
+                best_per_guest[slug] = (score, video)
+
+    # Second pass: report the best video per guest
     matches = []
     matched_video_ids = set()
 
     for guest in guests_needing_video:
-        if pilot_only and guest["name"] not in target_names:
-            continue
-
-        candidates = guest_candidates[guest["slug"]]
-        if not candidates:
+        best = best_per_guest.get(guest["slug"])
+        if best is None:
             log(f"  No video match for {guest['name']}")
             continue
 
-        # Sort by score descending, take the best
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        best_video, best_score = candidates[0]
+        best_score, best_video = best
         log(f"  Matched: {guest['name']} -> '{best_video['title']}' (score: {best_score})")
         matches.append((best_video, guest))
         matched_video_ids.add(best_video["video_id"])
@@ -317,9 +369,7 @@ def match_second_visit_videos(
                 try:
                     resp = scraper.fetch(criterion_url, timeout=30)
                     if resp.status_code == 200:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(resp.text, "lxml")
-                        page_video_ids = extract_video_ids_from_page(soup)
+                        page_video_ids = extract_video_ids_from_page(resp.text)
                         yt_id = page_video_ids.get("youtube_video_id")
                         vim_id = page_video_ids.get("vimeo_video_id")
 
@@ -343,24 +393,19 @@ def match_second_visit_videos(
                     log(f"    Error fetching Criterion page: {e}")
 
     # Strategy B: Fuzzy title match against unmatched playlist videos
-    unmatched_videos = [v for v in videos if v["video_id"] not in consumed_ids and _is_closet_picks_video(v["title"])]
+    # Parse and normalize each unmatched title once, not once per candidate visit.
+    unmatched_videos = [
+        (v, _title_name_variants(v["title"]))
+        for v in videos
+        if v["video_id"] not in consumed_ids and _is_closet_picks_video(v["title"])
+    ]
 
     for guest, visit_idx in candidates:
         guest_norm = _normalize_name(guest["name"])
         video_matches = []
 
-        for video in unmatched_videos:
-            parsed_name = parse_guest_name_from_video_title(video["title"])
-            parsed_norm = _normalize_name(parsed_name)
-            score = fuzzy_match_score(parsed_norm, guest_norm)
-
-            # Also try compound name parts
-            if " and " in parsed_name.lower():
-                parts = parsed_name.lower().split(" and ")
-                for part in parts:
-                    part_score = fuzzy_match_score(part.strip(), guest_norm)
-                    score = max(score, part_score)
-
+        for video, variants in unmatched_videos:
+            score = max(fuzzy_match_score(variant, guest_norm) for variant in variants)
             if score >= 70:
                 video_matches.append((video, score))
 
@@ -368,15 +413,14 @@ def match_second_visit_videos(
             log(f"  Strategy B: No match for {guest['name']} visit {visit_idx + 1}")
             continue
 
-        # Sort by score, then by upload_date (newest first for visit 2)
-        video_matches.sort(key=lambda x: (x[1], x[0].get("upload_date", "")), reverse=True)
-        best_video, best_score = video_matches[0]
+        # Best score, then newest upload_date (for visit 2)
+        best_video, best_score = max(video_matches, key=lambda x: (x[1], x[0].get("upload_date", "")))
 
         log(f"  Strategy B: {guest['name']} visit {visit_idx + 1} -> '{best_video['title']}' (score: {best_score})")
         results.append((best_video, guest, visit_idx))
         consumed_ids.add(best_video["video_id"])
         # Remove from unmatched so it can't be double-assigned
-        unmatched_videos = [v for v in unmatched_videos if v["video_id"] != best_video["video_id"]]
+        unmatched_videos = [(v, n) for v, n in unmatched_videos if v["video_id"] != best_video["video_id"]]
 
     return results
 
@@ -469,30 +513,50 @@ def main():
     if args.limit:
         matches = matches[:args.limit]
 
-    # Fetch transcripts and update guests
-    success_count = 0
-    for video, guest in tqdm(matches, desc="Fetching transcripts"):
-        video_id = video["video_id"]
+    # Fetch transcripts concurrently (network-bound), once per video even when
+    # a joint episode matched several guests, then update guests in match order.
+    first_guest_by_video: dict[str, dict] = {}
+    for video, guest in matches:
+        first_guest_by_video.setdefault(video["video_id"], guest)
+
+    # Snapshot the transcript cache once instead of stat-ing a file per video;
+    # kept current as new transcripts are saved below.
+    existing_transcripts = {path.stem for path in TRANSCRIPTS_DIR.glob("*.json")}
+
+    def load_or_fetch(item: tuple[str, dict]):
+        video_id, guest = item
         transcript_path = TRANSCRIPTS_DIR / f"{video_id}.json"
 
         # Check if transcript already exists
-        if transcript_path.exists():
+        if video_id in existing_transcripts:
             log(f"  Transcript already exists: {video_id}")
-            transcript = load_json(transcript_path)
+            return load_json(transcript_path)
+
+        log(f"  Fetching transcript: {video_id} ({guest['name']})")
+        transcript = fetch_transcript(video_id)
+        if transcript:
+            save_json(transcript_path, {
+                "video_id": video_id,
+                "guest_name": guest["name"],
+                "segments": transcript,
+            })
+            existing_transcripts.add(video_id)
+            log(f"  Saved transcript: {len(transcript)} segments")
         else:
-            log(f"  Fetching transcript: {video_id} ({guest['name']})")
-            transcript = fetch_transcript(video_id)
-            time.sleep(0.5)
-
-            if transcript:
-                save_json(transcript_path, {
-                    "video_id": video_id,
-                    "guest_name": guest["name"],
-                    "segments": transcript,
-                })
-                log(f"  Saved transcript: {len(transcript)} segments")
-            else:
-                log(f"  No transcript available for {video_id}")
+            log(f"  No transcript available for {video_id}")
+        return transcript
+
+    with ThreadPoolExecutor(max_workers=TRANSCRIPT_WORKERS) as executor:
+        transcripts = dict(zip(first_guest_by_video, tqdm(
+            executor.map(load_or_fetch, first_guest_by_video.items()),
+            total=len(first_guest_by_video),
+            desc="Fetching transcripts",
+        )))
+
+    success_count = 0
+    for video, guest in matches:
+        video_id = video["video_id"]
+        transcript = transcripts[video_id]
 
         # Update guest entry
         guest["youtube_video_id"] = video_id
@@ -519,7 +583,7 @@ def main():
 
     # Report primary matches
     for video, guest in matches:
-        has_transcript = (TRANSCRIPTS_DIR / f"{video['video_id']}.json").exists()
+        has_transcript = video["video_id"] in existing_transcripts
         status = "OK" if has_transcript else "NO TRANSCRIPT"
         log(f"  {guest['name']}: {video['video_id']} [{status}]")
 
@@ -544,7 +608,7 @@ def main():
 
             # Fetch transcript
             transcript_path = TRANSCRIPTS_DIR / f"{video_id}.json"
-            if transcript_path.exists():
+            if video_id in existing_transcripts:
                 log(f"  Transcript already exists: {video_id}")
             else:
                 log(f"  Fetching transcript: {video_id} ({guest['name']} visit {visit_idx + 1})")
@@ -558,6 +622,7 @@ def main():
                         "visit": visit_idx + 1,
                         "segments": transcript,
                     })
+                    existing_transcripts.add(video_id)
                     log(f"  Saved transcript: {len(transcript)} segments")
                 else:
                     log(f"  No transcript available for {video_id}")
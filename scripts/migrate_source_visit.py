@@ -19,7 +19,9 @@ Usage:
 """
 
 import argparse
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -28,6 +30,7 @@ from scripts.utils import (
     PICKS_FILE,
     PICKS_RAW_FILE,
     backfill_pick_order,
+    bucket_picks,
     load_json,
     save_json,
     log,
@@ -51,15 +54,17 @@ def backfill_source_raw(picks_raw: list[dict]) -> int:
 
 def backfill_source_picks(picks: list[dict], picks_raw: list[dict]) -> int:
     """Backfill source field on picks.json entries from picks_raw. Returns count changed."""
-    # Build lookup: (guest_slug, film_title) -> source from picks_raw
+    # Build lookup: (guest_slug, film_title) -> source from picks_raw.
+    # One tuple-keyed dict; on duplicates the later entry wins.
     raw_source = {}
     for rp in picks_raw:
-        key = (rp["guest_slug"], rp.get("film_title", "").lower())
-        raw_source[key] = rp.get("source", "letterboxd")
+        slug = rp["guest_slug"]
+        source = rp.get("source", "letterboxd")
+        raw_source[(slug, rp.get("film_title", "").lower())] = source
         # Also index by film_id for fallback
         film_id = rp.get("film_id", "")
         if film_id:
-            raw_source[(rp["guest_slug"], film_id)] = rp.get("source", "letterboxd")
+            raw_source[(slug, film_id)] = source
 
     changed = 0
     for p in picks:
@@ -77,26 +82,20 @@ def backfill_source_picks(picks: list[dict], picks_raw: list[dict]) -> int:
     return changed
 
 
+_YOUTUBE_ID_RE = re.compile(r"[?&]v=([^&#]+)")
+_VIMEO_ID_RE = re.compile(r"/(\d+)(?:[#?/]|$)")
+
+
 def _extract_video_id_from_url(url: str) -> str | None:
     """Extract YouTube video ID from a timestamp URL."""
-    if not url:
-        return None
-    if "v=" in url:
-        for part in url.split("?")[-1].split("&"):
-            if part.startswith("v="):
-                return part[2:]
-    return None
+    m = _YOUTUBE_ID_RE.search(url) if url else None
+    return m.group(1) if m else None
 
 
 def _extract_vimeo_id_from_url(url: str) -> str | None:
     """Extract Vimeo video ID from a timestamp URL."""
-    if not url:
-        return None
-    for part in url.split("/"):
-        clean = part.split("#")[0]
-        if clean.isdigit():
-            return clean
-    return None
+    m = _VIMEO_ID_RE.search(url) if url else None
+    return m.group(1) if m else None
 
 
 def backfill_visit_index_picks(picks: list[dict], guests: list[dict]) -> int:
@@ -108,21 +107,20 @@ def backfill_visit_index_picks(picks: list[dict], guests: list[dict]) -> int:
     """
     guest_by_slug = {g["slug"]: g for g in guests}
 
-    # Build video_id -> visit_index mapping per guest
-    video_to_visit = {}  # (guest_slug, video_id) -> visit_index
-    multi_visit_slugs = set()
+    # Build video_id -> visit_index mapping per multi-visit guest
+    video_to_visit: dict[str, dict[str, int]] = {}  # guest_slug -> {video_id: visit_index}
     for g in guests:
         visits = g.get("visits", [])
         if len(visits) < 2:
             continue
-        multi_visit_slugs.add(g["slug"])
+        guest_videos = video_to_visit.setdefault(g["slug"], {})
         for i, v in enumerate(visits):
             vid = v.get("youtube_video_id")
             if vid:
-                video_to_visit[(g["slug"], vid)] = i + 1
+                guest_videos[vid] = i + 1
             vim = v.get("vimeo_video_id")
             if vim:
-                video_to_visit[(g["slug"], vim)] = i + 1
+                guest_videos[vim] = i + 1
 
     # Clear existing visit_index so we recompute cleanly
     for p in picks:
@@ -133,8 +131,9 @@ def backfill_visit_index_picks(picks: list[dict], guests: list[dict]) -> int:
     deferred = []  # (index, slug) for multi-visit picks without video URLs
     for i, p in enumerate(picks):
         slug = p["guest_slug"]
+        guest_videos = video_to_visit.get(slug)
 
-        if slug not in multi_visit_slugs:
+        if guest_videos is None:
             p["visit_index"] = 1
             changed += 1
             continue
@@ -144,11 +143,11 @@ def backfill_visit_index_picks(picks: list[dict], guests: list[dict]) -> int:
         vim_url = p.get("vimeo_timestamp_url", "")
 
         vid = _extract_video_id_from_url(yt_url)
-        visit_idx = video_to_visit.get((slug, vid)) if vid else None
+        visit_idx = guest_videos.get(vid) if vid else None
 
         if not visit_idx:
             vim_id = _extract_vimeo_id_from_url(vim_url)
-            visit_idx = video_to_visit.get((slug, vim_id)) if vim_id else None
+            visit_idx = guest_videos.get(vim_id) if vim_id else None
 
         if visit_idx:
             p["visit_index"] = visit_idx
@@ -188,19 +187,16 @@ def override_visit_from_criterion(picks: list[dict], picks_raw: list[dict], gues
     # Build lookup: (guest_slug, film_id) -> visit_index from criterion-sourced raw picks
     criterion_visit = {}
     for rp in picks_raw:
-        if rp.get("source") != "criterion":
-            continue
-        if rp["guest_slug"] not in guests_with_multi_criterion:
-            continue
+        slug = rp["guest_slug"]
         vi = rp.get("visit_index")
-        if not vi:
+        if not vi or slug not in guests_with_multi_criterion or rp.get("source") != "criterion":
             continue
         film_id = rp.get("film_id", "")
         if film_id:
-            criterion_visit[(rp["guest_slug"], film_id)] = vi
+            criterion_visit[(slug, film_id)] = vi
         title = rp.get("film_title", "").lower()
         if title:
-            criterion_visit[(rp["guest_slug"], title)] = vi
+            criterion_visit[(slug, title)] = vi
 
     changed = 0
     for p in picks:
@@ -224,15 +220,8 @@ def update_pick_counts(guests: list[dict], picks: list[dict], picks_raw: list[di
     Display rule: source === 'criterion' OR has a non-empty quote.
     Mirrors getDisplayablePicksForGuest() logic in data.ts.
     """
-    # Build picks.json lookup per guest
-    picks_by_guest: dict[str, list[dict]] = {}
-    for p in picks:
-        picks_by_guest.setdefault(p["guest_slug"], []).append(p)
-
-    # Build raw picks lookup per guest
-    raw_by_guest: dict[str, list[dict]] = {}
-    for p in picks_raw:
-        raw_by_guest.setdefault(p["guest_slug"], []).append(p)
+    picks_by_guest = bucket_picks(picks)
+    raw_by_guest = bucket_picks(picks_raw)
 
     changed = 0
     for g in guests:
@@ -279,16 +268,24 @@ def backfill_visit_index_raw(picks_raw: list[dict], picks: list[dict], guests: l
     guest_by_slug = {g["slug"]: g for g in guests}
     multi_visit_slugs = {g["slug"] for g in guests if len(g.get("visits", [])) >= 2}
 
-    # Build picks.json lookup: (guest_slug, film_id) -> visit_index
+    # One pass over picks.json builds both lookups:
+    #   (guest_slug, film_id or title) -> visit_index
+    #   guest_slug -> set of visit indices attributed in picks.json
     picks_visit = {}
+    picks_visits_per_guest: dict[str, set[int]] = {}
     for p in picks:
+        vi = p.get("visit_index")
+        if not vi:
+            continue
+        slug = p["guest_slug"]
+        picks_visits_per_guest.setdefault(slug, set()).add(vi)
         film_key = p.get("film_slug") or p.get("film_id", "")
-        if film_key and p.get("visit_index"):
-            picks_visit[(p["guest_slug"], film_key)] = p["visit_index"]
+        if film_key:
+            picks_visit[(slug, film_key)] = vi
         # Also by title
         title = p.get("film_title", "").lower()
-        if title and p.get("visit_index"):
-            picks_visit[(p["guest_slug"], title)] = p["visit_index"]
+        if title:
+            picks_visit[(slug, title)] = vi
 
     # Clear existing visit_index, but preserve criterion-sourced picks
     # whose visit_index was set by the scraper from collection page URLs
@@ -325,32 +322,22 @@ def backfill_visit_index_raw(picks_raw: list[dict], picks: list[dict], guests: l
 
     # Second pass: for unattributed raw picks of multi-visit guests,
     # attribute to the visit NOT covered by picks.json entries.
-    if deferred:
-        # Collect attributed visits per guest from picks.json
-        picks_visits_per_guest = {}  # slug -> set of visit indices
-        for p in picks:
-            slug = p["guest_slug"]
-            if slug in multi_visit_slugs and p.get("visit_index"):
-                if slug not in picks_visits_per_guest:
-                    picks_visits_per_guest[slug] = set()
-                picks_visits_per_guest[slug].add(p["visit_index"])
-
-        for idx in deferred:
-            p = picks_raw[idx]
-            slug = p["guest_slug"]
-            guest = guest_by_slug[slug]
-            num_visits = len(guest.get("visits", []))
-            known = picks_visits_per_guest.get(slug, set())
-
-            # If picks.json only has entries from one visit, remaining raw picks
-            # are likely from the other visit
-            if len(known) == 1 and num_visits == 2:
-                other_visit = 1 if 2 in known else 2
-                p["visit_index"] = other_visit
-            else:
-                # Can't determine -- default to 1
-                p["visit_index"] = 1
-            changed += 1
+    for idx in deferred:
+        p = picks_raw[idx]
+        slug = p["guest_slug"]
+        guest = guest_by_slug[slug]
+        num_visits = len(guest.get("visits", []))
+        known = picks_visits_per_guest.get(slug, set())
+
+        # If picks.json only has entries from one visit, remaining raw picks
+        # are likely from the other visit
+        if len(known) == 1 and num_visits == 2:
+            other_visit = 1 if 2 in known else 2
+            p["visit_index"] = other_visit
+        else:
+            # Can't determine -- default to 1
+            p["visit_index"] = 1
+        changed += 1
 
     return changed
 
@@ -402,21 +389,21 @@ def main():
     log(f"Pick count updates: {n} guests updated")
 
     # Stats
-    raw_criterion = sum(1 for p in picks_raw if p.get("source") == "criterion")
-    raw_letterboxd = sum(1 for p in picks_raw if p.get("source") == "letterboxd")
-    log(f"\npicks_raw source distribution: criterion={raw_criterion}, letterboxd={raw_letterboxd}")
+    raw_sources = Counter(p.get("source") for p in picks_raw)
+    log(f"\npicks_raw source distribution: criterion={raw_sources['criterion']}, letterboxd={raw_sources['letterboxd']}")
 
-    picks_criterion = sum(1 for p in picks if p.get("source") == "criterion")
-    picks_letterboxd = sum(1 for p in picks if p.get("source") == "letterboxd")
-    log(f"picks source distribution: criterion={picks_criterion}, letterboxd={picks_letterboxd}")
+    pick_sources = Counter(p.get("source") for p in picks)
+    log(f"picks source distribution: criterion={pick_sources['criterion']}, letterboxd={pick_sources['letterboxd']}")
 
     # Multi-visit stats
     log(f"\nMulti-visit guest attribution:")
     multi_visit_guests = [g for g in guests if len(g.get("visits", [])) >= 2]
+    picks_by_guest = bucket_picks(picks)
+    raw_by_guest = bucket_picks(picks_raw)
     for g in multi_visit_guests:
         slug = g["slug"]
-        guest_picks = [p for p in picks if p["guest_slug"] == slug]
-        guest_raw = [p for p in picks_raw if p["guest_slug"] == slug]
+        guest_picks = picks_by_guest.get(slug, [])
+        guest_raw = raw_by_guest.get(slug, [])
         by_visit_picks = {}
         for p in guest_picks:
             vi = p.get("visit_index", 1)
@@ -5,18 +5,21 @@ tag non-person entities, and build visits arrays.
 
 Idempotent — safe to re-run. Modifies guests.json, picks.json, picks_raw.json in place.
 
-Run: python scripts/normalize_guests.py [--dry-run]
+Run: python -m scripts.normalize_guests [--dry-run] [--quiet]
+ (or python scripts/normalize_guests.py, which puts the repo root on sys.path)
 """
 
 import argparse
-import copy
 import re
 import sys
 import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from scripts.utils import GUESTS_FILE, PICKS_FILE, PICKS_RAW_FILE, load_json, save_json, log
+if not __package__:  # run as a file rather than with -m / imported from the package
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scripts.utils import GUESTS_FILE, PICKS_FILE, PICKS_RAW_FILE, bucket_picks, load_json, save_json, log
 from scripts.schema import Guest, Pick
 
 
@@ -264,30 +267,47 @@ def clean_display_name(name: str) -> str:
     return name
 
 
-def guest_by_slug(guests: list[dict], slug: str) -> dict | None:
+def index_guests(guests: list[dict]) -> dict[str, dict]:
+    """Map slug -> guest. On a duplicate slug the first entry wins."""
+    by_slug: dict[str, dict] = {}
     for g in guests:
-        if g["slug"] == slug:
-            return g
-    return None
-
-
-def remove_guest(guests: list[dict], slug: str) -> dict | None:
-    for i, g in enumerate(guests):
-        if g["slug"] == slug:
-            return guests.pop(i)
-    return None
+        by_slug.setdefault(g["slug"], g)
+    return by_slug
+
+
+def remove_guest(by_slug: dict[str, dict], removed: set[int], slug: str) -> dict | None:
+    """Drop a guest from the index and mark it for the final compaction of
+    the guests list (one filtering pass instead of a list.pop per merge)."""
+    g = by_slug.pop(slug, None)
+    if g is not None:
+        removed.add(id(g))
+    return g
+
+
+_VISIT_KEYS = (
+    "youtube_video_id",
+    "youtube_video_url",
+    "vimeo_video_id",
+    "episode_date",
+    "letterboxd_list_url",
+    "criterion_page_url",
+)
 
 
 def build_visit(guest: dict) -> dict:
     """Extract a visit record from a guest entry."""
-    return {
-        "youtube_video_id": guest.get("youtube_video_id"),
-        "youtube_video_url": guest.get("youtube_video_url"),
-        "vimeo_video_id": guest.get("vimeo_video_id"),
-        "episode_date": guest.get("episode_date"),
-        "letterboxd_list_url": guest.get("letterboxd_list_url"),
-        "criterion_page_url": guest.get("criterion_page_url"),
-    }
+    return {key: guest.get(key) for key in _VISIT_KEYS}
+
+
+def clone_guest(guest: dict) -> dict:
+    """Copy a guest record deeply enough that edits never reach the original.
+
+    Guests are flat JSON apart from `visits`, a list of flat dicts.
+    """
+    clone = dict(guest)
+    if clone.get("visits"):
+        clone["visits"] = [dict(v) for v in clone["visits"]]
+    return clone
 
 
 def merge_guest_fields(primary: dict, secondary: dict):
@@ -297,57 +317,70 @@ def merge_guest_fields(primary: dict, secondary: dict):
             primary[key] = secondary[key]
 
 
-def update_picks_guest_slug(picks: list[dict], old_slug: str, new_slug: str) -> int:
-    """Update guest_slug from old to new. Returns count changed."""
-    count = 0
-    for p in picks:
-        if p.get("guest_slug") == old_slug:
-            p["guest_slug"] = new_slug
-            count += 1
-    return count
+def active_merges(
+    merges: dict[str, str],
+    by_slug: dict[str, dict],
+    detail,
+    kind: str,
+    roles: tuple[str, str],
+) -> list[tuple[str, str]]:
+    """Return the (primary, secondary) slug pairs whose guests both exist.
+
+    Misses (the common case on a re-run) are reported through `detail` and
+    dropped up front. Filtering once per phase is safe because no merge table
+    uses a secondary slug as another entry's primary.
+    """
+    active = []
+    for primary_slug, secondary_slug in merges.items():
+        if primary_slug not in by_slug:
+            detail("  Skip %s merge: %s '%s' not found", kind, roles[0], primary_slug)
+        elif secondary_slug not in by_slug:
+            detail("  Skip %s merge: %s '%s' not found (already merged?)", kind, roles[1], secondary_slug)
+        else:
+            active.append((primary_slug, secondary_slug))
+    return active
+
+
+def update_picks_guest_slug(picks_by_guest: defaultdict[str, list[dict]], old_slug: str, new_slug: str) -> int:
+    """Update guest_slug from old to new, moving the bucket. Returns count changed."""
+    moved = picks_by_guest.pop(old_slug, [])
+    for p in moved:
+        p["guest_slug"] = new_slug
+    if moved:
+        picks_by_guest[new_slug].extend(moved)
+    return len(moved)
+
+
+# Missing, null and unknown confidences all rank 0, the same as "none".
+_CONFIDENCE_RANK = {"high": 3, "medium": 2, "low": 1, "none": 0}
 
 
 def dedup_picks(picks: list[dict]) -> list[dict]:
     """Deduplicate picks by (guest_slug, film_slug/film_id), keeping highest confidence."""
-    confidence_rank = {"high": 3, "medium": 2, "low": 1, "none": 0}
-    seen: dict[tuple, int] = {}
-    result = []
-
-    for i, p in enumerate(picks):
-        film_key = p.get("film_slug") or p.get("film_id", "")
-        key = (p["guest_slug"], film_key)
-
-        conf = confidence_rank.get(p.get("extraction_confidence", "none"), 0)
-
-        if key in seen:
-            existing_idx = seen[key]
-            existing_conf = confidence_rank.get(
-                result[existing_idx].get("extraction_confidence", "none"), 0
-            )
-            if conf > existing_conf:
-                result[existing_idx] = p
-        else:
-            seen[key] = len(result)
-            result.append(p)
+    rank = _CONFIDENCE_RANK.get
+    # key -> (confidence rank, pick); a re-assigned key keeps its first position
+    best: dict[tuple, tuple[int, dict]] = {}
+
+    for p in picks:
+        key = (p["guest_slug"], p.get("film_slug") or p.get("film_id", ""))
+        conf = rank(p.get("extraction_confidence"), 0)
+        prev = best.get(key)
+        if prev is None or conf > prev[0]:
+            best[key] = (conf, p)
 
-    return result
+    return [p for _, p in best.values()]
 
 
 def dedup_picks_raw(picks_raw: list[dict]) -> list[dict]:
     """Deduplicate raw picks by (guest_slug, film_id). Prefer criterion-sourced entries."""
-    seen: dict[tuple, int] = {}
-    result = []
+    best: dict[tuple, dict] = {}
     for p in picks_raw:
         key = (p["guest_slug"], p.get("film_id", ""))
-        if key not in seen:
-            seen[key] = len(result)
-            result.append(p)
-        else:
-            # Prefer criterion-sourced entry over letterboxd
-            existing_idx = seen[key]
-            if p.get("source") == "criterion" and result[existing_idx].get("source") != "criterion":
-                result[existing_idx] = p
-    return result
+        cur = best.get(key)
+        # Prefer criterion-sourced entry over letterboxd
+        if cur is None or (p.get("source") == "criterion" and cur.get("source") != "criterion"):
+            best[key] = p
+    return list(best.values())
 
 
 def recompute_pick_counts(guests: list[dict], picks: list[dict], picks_raw: list[dict]):
@@ -358,47 +391,51 @@ def recompute_pick_counts(guests: list[dict], picks: list[dict], picks_raw: list
     non-empty quote.  Raw criterion-sourced picks that aren't already
     covered by a processed pick also count.
     """
-    # Build per-guest lookups
-    picks_by_guest: dict[str, list[dict]] = {}
+    displayable: Counter[str] = Counter()
+    processed: set[tuple] = set()
     for p in picks:
-        picks_by_guest.setdefault(p["guest_slug"], []).append(p)
-
-    raw_by_guest: dict[str, list[dict]] = {}
-    for p in picks_raw:
-        raw_by_guest.setdefault(p["guest_slug"], []).append(p)
+        slug = p["guest_slug"]
+        processed.add((slug, p.get("film_slug") or p.get("film_id", "")))
+        if p.get("source") == "criterion" or p.get("quote", "").strip():
+            displayable[slug] += 1
+
+    # Raw criterion picks not already in processed
+    displayable.update(
+        rp["guest_slug"]
+        for rp in picks_raw
+        if rp.get("source") == "criterion"
+        and (rp["guest_slug"], rp.get("film_id", "")) not in processed
+    )
 
     for g in guests:
-        slug = g["slug"]
-        guest_picks = picks_by_guest.get(slug, [])
-        guest_raw = raw_by_guest.get(slug, [])
-
-        processed_slugs: set[str] = set()
-        displayable = 0
-        for p in guest_picks:
-            film_key = p.get("film_slug") or p.get("film_id", "")
-            processed_slugs.add(film_key)
-            if p.get("source") == "criterion" or p.get("quote", "").strip():
-                displayable += 1
-
-        # Raw criterion picks not already in processed
-        for rp in guest_raw:
-            film_key = rp.get("film_id", "")
-            if film_key in processed_slugs:
-                continue
-            if rp.get("source") == "criterion":
-                displayable += 1
-
-        g["pick_count"] = displayable
+        g["pick_count"] = displayable[g["slug"]]
 
 
 # ---------------------------------------------------------------------------
 # Main normalization
 # ---------------------------------------------------------------------------
 
-def normalize(dry_run: bool = False):
-    guests: list[Guest] = load_json(GUESTS_FILE)
-    picks: list[Pick] = load_json(PICKS_FILE)
-    picks_raw: list[Pick] = load_json(PICKS_RAW_FILE)
+def _no_log(msg: str, *args) -> None:
+    pass
+
+
+def normalize(dry_run: bool = False, quiet: bool = False):
+    # Per-entry lines are %-formatted by log() only when printed; --quiet skips
+    # them (and their formatting) and keeps the summary.
+    detail = _no_log if quiet else log
+    paths = (GUESTS_FILE, PICKS_FILE, PICKS_RAW_FILE)
+    # The three files are independent; overlap their reads.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        loaded = list(pool.map(load_json, paths))
+    guests: list[Guest] = loaded[0]
+    picks: list[Pick] = loaded[1]
+    picks_raw: list[Pick] = loaded[2]
+    by_slug = index_guests(guests)
+    removed: set[int] = set()  # id() of merged-away guests, compacted after step 5
+    # Picks are re-pointed in place through these buckets, so the lists above
+    # see every reassignment without being rescanned per merge.
+    picks_by_guest = bucket_picks(picks)
+    raw_by_guest = bucket_picks(picks_raw)
 
     stats = {
         "repeat_merges": 0,
@@ -416,28 +453,29 @@ def normalize(dry_run: bool = False):
 
     # --- 0. Slug fixes (do first so everything else uses correct slugs) ---
     for old_slug, new_slug in SLUG_FIXES.items():
-        g = guest_by_slug(guests, old_slug)
+        g = by_slug.pop(old_slug, None)
         if g:
-            log(f"  Slug fix: '{old_slug}' -> '{new_slug}'")
+            detail("  Slug fix: '%s' -> '%s'", old_slug, new_slug)
             g["slug"] = new_slug
-            n = update_picks_guest_slug(picks, old_slug, new_slug)
+            by_slug.setdefault(new_slug, g)
+            n = update_picks_guest_slug(picks_by_guest, old_slug, new_slug)
             stats["picks_reassigned"] += n
-            n = update_picks_guest_slug(picks_raw, old_slug, new_slug)
+            n = update_picks_guest_slug(raw_by_guest, old_slug, new_slug)
             stats["raw_picks_reassigned"] += n
 
     # --- 1. Name cleanup (do first so merges work on clean names) ---
     for g in guests:
-        if g["name"] in NAME_FIXES:
-            old_name = g["name"]
-            g["name"] = NAME_FIXES[old_name]
-            log(f"  Name fix: '{old_name}' -> '{g['name']}'")
+        fixed = NAME_FIXES.get(g["name"])
+        if fixed is not None:
+            detail("  Name fix: '%s' -> '%s'", g['name'], fixed)
+            g["name"] = fixed
             stats["name_fixes"] += 1
 
     # --- 2. Build visits arrays for multi-visit guests ---
     for slug, urls in VISIT_CRITERION_URLS.items():
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if not g:
-            log(f"  Skip visits build: '{slug}' not found")
+            detail("  Skip visits build: '%s' not found", slug)
             continue
 
         if len(urls) < 2:
@@ -471,23 +509,23 @@ def normalize(dry_run: bool = False):
 
         secondary_slug = REPEAT_VISIT_MERGES.get(slug)
         if secondary_slug:
-            secondary = guest_by_slug(guests, secondary_slug)
+            secondary = by_slug.get(secondary_slug)
             if secondary:
-                log(f"  Repeat merge: '{secondary['name']}' -> '{g['name']}'")
+                detail("  Repeat merge: '%s' -> '%s'", secondary['name'], g['name'])
                 visit2 = build_visit(secondary)
                 visit2["criterion_page_url"] = urls[1]
                 merge_guest_fields(g, secondary)
-                n = update_picks_guest_slug(picks, secondary_slug, slug)
+                n = update_picks_guest_slug(picks_by_guest, secondary_slug, slug)
                 stats["picks_reassigned"] += n
-                n = update_picks_guest_slug(picks_raw, secondary_slug, slug)
+                n = update_picks_guest_slug(raw_by_guest, secondary_slug, slug)
                 stats["raw_picks_reassigned"] += n
-                remove_guest(guests, secondary_slug)
+                remove_guest(by_slug, removed, secondary_slug)
 
         # Detect and clear duplicate video IDs across visits
         v1_vid = visit1.get("youtube_video_id")
         v2_vid = visit2.get("youtube_video_id")
         if v1_vid and v1_vid == v2_vid:
-            log(f"  Dedup video: '{g['name']}' visit 2 had same video as visit 1, clearing")
+            detail("  Dedup video: '%s' visit 2 had same video as visit 1, clearing", g['name'])
             visit2["youtube_video_id"] = None
             visit2["youtube_video_url"] = None
 
@@ -501,69 +539,59 @@ def normalize(dry_run: bool = False):
             v["visit_index"] = i + 1
         g["visits"] = visits
         g["criterion_page_url"] = urls[0]
-        log(f"  Built visits for '{g['name']}': {len(urls)} visit(s)")
+        detail("  Built visits for '%s': %s visit(s)", g['name'], len(urls))
         stats["repeat_merges"] += 1
 
     # --- 3. Name-variant merges ---
-    for primary_slug, secondary_slug in NAME_VARIANT_MERGES.items():
-        primary = guest_by_slug(guests, primary_slug)
-        secondary = guest_by_slug(guests, secondary_slug)
+    for primary_slug, secondary_slug in active_merges(
+        NAME_VARIANT_MERGES, by_slug, detail, "name-variant", ("primary", "secondary")
+    ):
+        primary = by_slug[primary_slug]
+        secondary = by_slug[secondary_slug]
 
-        if not primary:
-            log(f"  Skip name-variant merge: primary '{primary_slug}' not found")
-            continue
-        if not secondary:
-            log(f"  Skip name-variant merge: secondary '{secondary_slug}' not found (already merged?)")
-            continue
-
-        log(f"  Name-variant merge: '{secondary['name']}' -> '{primary['name']}'")
+        detail("  Name-variant merge: '%s' -> '%s'", secondary['name'], primary['name'])
         merge_guest_fields(primary, secondary)
 
-        n = update_picks_guest_slug(picks, secondary_slug, primary_slug)
+        n = update_picks_guest_slug(picks_by_guest, secondary_slug, primary_slug)
         stats["picks_reassigned"] += n
-        n = update_picks_guest_slug(picks_raw, secondary_slug, primary_slug)
+        n = update_picks_guest_slug(raw_by_guest, secondary_slug, primary_slug)
         stats["raw_picks_reassigned"] += n
 
-        remove_guest(guests, secondary_slug)
+        remove_guest(by_slug, removed, secondary_slug)
         stats["name_variant_merges"] += 1
 
     # --- 4. Solo-into-pair merges ---
-    for pair_slug, solo_slug in SOLO_INTO_PAIR_MERGES.items():
-        pair = guest_by_slug(guests, pair_slug)
-        solo = guest_by_slug(guests, solo_slug)
-
-        if not pair:
-            log(f"  Skip solo-pair merge: pair '{pair_slug}' not found")
-            continue
-        if not solo:
-            log(f"  Skip solo-pair merge: solo '{solo_slug}' not found (already merged?)")
-            continue
+    for pair_slug, solo_slug in active_merges(
+        SOLO_INTO_PAIR_MERGES, by_slug, detail, "solo-pair", ("pair", "solo")
+    ):
+        pair = by_slug[pair_slug]
+        solo = by_slug[solo_slug]
 
-        log(f"  Solo-pair merge: '{solo['name']}' -> '{pair['name']}'")
+        detail("  Solo-pair merge: '%s' -> '%s'", solo['name'], pair['name'])
         merge_guest_fields(pair, solo)
 
-        n = update_picks_guest_slug(picks, solo_slug, pair_slug)
+        n = update_picks_guest_slug(picks_by_guest, solo_slug, pair_slug)
         stats["picks_reassigned"] += n
-        n = update_picks_guest_slug(picks_raw, solo_slug, pair_slug)
+        n = update_picks_guest_slug(raw_by_guest, solo_slug, pair_slug)
         stats["raw_picks_reassigned"] += n
 
-        remove_guest(guests, solo_slug)
+        remove_guest(by_slug, removed, solo_slug)
         stats["solo_pair_merges"] += 1
 
     # --- 5. New pair entry (john-early + jacqueline-novak) ---
-    existing_pair = guest_by_slug(guests, NEW_PAIR["slug"])
+    existing_pair = by_slug.get(NEW_PAIR["slug"])
     if not existing_pair:
         source_guests = []
         for src_slug in NEW_PAIR["from_slugs"]:
-            g = guest_by_slug(guests, src_slug)
+            g = by_slug.get(src_slug)
             if g:
                 source_guests.append(g)
             else:
-                log(f"  Skip new pair: source '{src_slug}' not found")
+                detail("  Skip new pair: source '%s' not found", src_slug)
 
         if len(source_guests) == len(NEW_PAIR["from_slugs"]):
             # Create new pair entry from first source as template
-            new_guest = copy.deepcopy(source_guests[0])
+            new_guest = clone_guest(source_guests[0])
             new_guest["name"] = NEW_PAIR["name"]
             new_guest["slug"] = NEW_PAIR["slug"]
             new_guest["youtube_video_id"] = NEW_PAIR["shared_video"]
@@ -574,43 +602,47 @@ def normalize(dry_run: bool = False):
                 merge_guest_fields(new_guest, src)
 
             guests.append(new_guest)
+            by_slug[new_guest["slug"]] = new_guest
 
             # Reassign picks from both sources
             for src_slug in NEW_PAIR["from_slugs"]:
-                n = update_picks_guest_slug(picks, src_slug, NEW_PAIR["slug"])
+                n = update_picks_guest_slug(picks_by_guest, src_slug, NEW_PAIR["slug"])
                 stats["picks_reassigned"] += n
-                n = update_picks_guest_slug(picks_raw, src_slug, NEW_PAIR["slug"])
+                n = update_picks_guest_slug(raw_by_guest, src_slug, NEW_PAIR["slug"])
                 stats["raw_picks_reassigned"] += n
-                remove_guest(guests, src_slug)
+                remove_guest(by_slug, removed, src_slug)
 
-            log(f"  New pair: '{NEW_PAIR['name']}' from {NEW_PAIR['from_slugs']}")
+            detail("  New pair: '%s' from %s", NEW_PAIR['name'], NEW_PAIR['from_slugs'])
             stats["new_pairs"] += 1
     else:
-        log(f"  Skip new pair: '{NEW_PAIR['slug']}' already exists")
+        detail("  Skip new pair: '%s' already exists", NEW_PAIR['slug'])
+
+    if removed:
+        guests[:] = [g for g in guests if id(g) not in removed]
 
     # --- 6. Wrong video fixes ---
     for slug, wrong_video in WRONG_VIDEO_FIXES.items():
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if not g:
-            log(f"  Skip wrong video fix: '{slug}' not found")
+            detail("  Skip wrong video fix: '%s' not found", slug)
             continue
 
         if g.get("youtube_video_id") == wrong_video:
-            log(f"  Wrong video fix: '{g['name']}' — nulling video {wrong_video}")
+            detail("  Wrong video fix: '%s' — nulling video %s", g['name'], wrong_video)
             g["youtube_video_id"] = None
             g["youtube_video_url"] = None
             g["vimeo_video_id"] = None
             stats["wrong_video_fixes"] += 1
         elif g.get("youtube_video_id") is None:
-            log(f"  Skip wrong video fix: '{g['name']}' already has no video")
+            detail("  Skip wrong video fix: '%s' already has no video", g['name'])
         else:
-            log(f"  Skip wrong video fix: '{g['name']}' has different video '{g.get('youtube_video_id')}'")
+            detail("  Skip wrong video fix: '%s' has different video '%s'", g['name'], g.get('youtube_video_id'))
 
     # --- 6b. Known video ID fixes ---
     for slug, video_info in KNOWN_VIDEO_IDS.items():
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if not g:
-            log(f"  Skip known video fix: '{slug}' not found")
+            detail("  Skip known video fix: '%s' not found", slug)
             continue
         if g.get("youtube_video_id"):
             continue  # Already has a video, don't overwrite
@@ -619,37 +651,37 @@ def normalize(dry_run: bool = False):
         if yt_id:
             g["youtube_video_id"] = yt_id
             g["youtube_video_url"] = f"https://www.youtube.com/watch?v={yt_id}"
-            log(f"  Known video fix: '{g['name']}' -> {yt_id}")
+            detail("  Known video fix: '%s' -> %s", g['name'], yt_id)
 
     # --- 6c. Known Criterion page URL fixes ---
     for slug, url in KNOWN_CRITERION_URLS.items():
         if not url:
             continue
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if not g:
-            log(f"  Skip known criterion URL: '{slug}' not found")
+            detail("  Skip known criterion URL: '%s' not found", slug)
             continue
         if g.get("criterion_page_url"):
             continue  # Already has a URL, don't overwrite
         g["criterion_page_url"] = url
-        log(f"  Known criterion URL: '{g['name']}' -> {url}")
+        detail("  Known criterion URL: '%s' -> %s", g['name'], url)
 
     # --- 7. Non-person tagging ---
     for slug, guest_type in GUEST_TYPE_TAGS.items():
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if g:
             if g.get("guest_type") != guest_type:
                 g["guest_type"] = guest_type
-                log(f"  Guest type: '{g['name']}' -> {guest_type}")
+                detail("  Guest type: '%s' -> %s", g['name'], guest_type)
                 stats["guest_type_tags"] += 1
         else:
-            log(f"  Skip guest type tag: '{slug}' not found")
+            detail("  Skip guest type tag: '%s' not found", slug)
 
     # --- 8. Fix Criterion page URLs per visit ---
     for slug, urls in VISIT_CRITERION_URLS.items():
-        g = guest_by_slug(guests, slug)
+        g = by_slug.get(slug)
         if not g:
-            log(f"  Skip criterion URL fix: '{slug}' not found")
+            detail("  Skip criterion URL fix: '%s' not found", slug)
             continue
 
         changed = False
@@ -668,7 +700,7 @@ def normalize(dry_run: bool = False):
                     changed = True
 
         if changed:
-            log(f"  Criterion URL fix: '{g['name']}' — {len(urls)} page(s)")
+            detail("  Criterion URL fix: '%s' — %s page(s)", g['name'], len(urls))
 
     # --- 8b. Canonicalize guest names and sync them onto picks ---
     # The guest record is the source of truth for display names; picks carry a
@@ -682,25 +714,30 @@ def normalize(dry_run: bool = False):
             g["name"] = cleaned
         canonical_by_slug[g["slug"]] = cleaned
 
-    for collection, stat_key in ((picks, "picks_name_synced"), (picks_raw, "raw_picks_name_synced")):
-        for p in collection:
-            canon = canonical_by_slug.get(p.get("guest_slug"))
-            if canon and p.get("guest_name") != canon:
-                p["guest_name"] = canon
-                stats[stat_key] += 1
+    # The buckets still hold every pick under its current slug, so the
+    # canonical name is looked up once per guest rather than once per pick.
+    for buckets, stat_key in ((picks_by_guest, "picks_name_synced"), (raw_by_guest, "raw_picks_name_synced")):
+        for slug, bucket in buckets.items():
+            canon = canonical_by_slug.get(slug)
+            if not canon:
+                continue
+            for p in bucket:
+                if p.get("guest_name") != canon:
+                    p["guest_name"] = canon
+                    stats[stat_key] += 1
 
     # --- 9. Dedup picks ---
     before_picks = len(picks)
     picks = dedup_picks(picks)
     after_picks = len(picks)
     if before_picks != after_picks:
-        log(f"  Deduped picks: {before_picks} -> {after_picks}")
+        detail("  Deduped picks: %s -> %s", before_picks, after_picks)
 
     before_raw = len(picks_raw)
     picks_raw = dedup_picks_raw(picks_raw)
     after_raw = len(picks_raw)
     if before_raw != after_raw:
-        log(f"  Deduped raw picks: {before_raw} -> {after_raw}")
+        detail("  Deduped raw picks: %s -> %s", before_raw, after_raw)
 
     # --- 9. Recompute pick counts ---
     recompute_pick_counts(guests, picks, picks_raw)
@@ -723,17 +760,20 @@ def normalize(dry_run: bool = False):
     if dry_run:
         log("\nDry run — no files written.")
     else:
-        save_json(GUESTS_FILE, guests)
-        save_json(PICKS_FILE, picks)
-        save_json(PICKS_RAW_FILE, picks_raw)
+        # Independent files; one file's encoding overlaps another's writes,
+        # which release the GIL. save_json leaves a file whose bytes would not
+        # change untouched, so an idempotent re-run rewrites nothing.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(save_json, paths, (guests, picks, picks_raw)))
         log(f"\nSaved to {GUESTS_FILE}, {PICKS_FILE}, {PICKS_RAW_FILE}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Normalize guest data")
     parser.add_argument("--dry-run", action="store_true", help="Show changes without writing files")
+    parser.add_argument("--quiet", action="store_true", help="Print only the summary, not each change")
     args = parser.parse_args()
-    normalize(dry_run=args.dry_run)
+    normalize(dry_run=args.dry_run, quiet=args.quiet)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,13 @@ Steps:
   12. Normalize guest data - second pass (normalize_guests.py)
   13. Validate (validate.py + test_data.py)
 
+Steps whose data files are disjoint run concurrently: the box-set image
+scrape (catalog only) overlaps the source/visit migration (guests/picks).
+
+A step with a needs-work check (the box-set image scrape) is checked just
+before it would start, against the data as earlier steps left it, and
+skipped without launching a subprocess when there is nothing to do.
+
 Usage:
   python scripts/process_all.py --pilot          # 10-video pilot
   python scripts/process_all.py                   # Full pipeline
@@ -31,42 +38,86 @@ Usage:
 import argparse
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from scripts.utils import log
+from scripts.utils import CATALOG_FILE, load_json, log
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
 
+# Keeps each concurrently-run step's captured output in one contiguous block.
+_OUTPUT_LOCK = threading.Lock()
+
 
-def run_step(name: str, cmd: list[str], step_num: int, total_steps: int) -> bool:
-    """Run a pipeline step as a subprocess."""
+def run_step(name: str, cmd: list[str], step_num: int, total_steps: int, capture: bool = False) -> bool:
+    """Run a pipeline step as a subprocess.
+
+    With capture=True (steps running concurrently) the step's output is
+    collected and printed as one block when it finishes, so it does not
+    interleave with its neighbour's.
+    """
     log(f"\n{'='*60}")
     log(f"  Step {step_num}/{total_steps}: {name}")
     log(f"{'='*60}")
     log(f"  Command: {' '.join(cmd)}")
 
     start = time.time()
+    output = None
+    success = False
     try:
         result = subprocess.run(
             cmd,
             cwd=str(SCRIPTS_DIR.parent),
             timeout=7200,  # 2 hour max per step
+            stdout=subprocess.PIPE if capture else None,
+            stderr=subprocess.STDOUT if capture else None,
+            text=capture,
         )
+        output = result.stdout
         elapsed = time.time() - start
-        if result.returncode == 0:
-            log(f"  Completed in {elapsed:.1f}s")
-            return True
+        success = result.returncode == 0
+        if success:
+            status = f"  Completed in {elapsed:.1f}s"
         else:
-            log(f"  FAILED with return code {result.returncode} after {elapsed:.1f}s")
-            return False
-    except subprocess.TimeoutExpired:
-        log(f"  TIMED OUT after 7200s")
-        return False
+            status = f"  FAILED with return code {result.returncode} after {elapsed:.1f}s"
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else e.stdout
+        status = "  TIMED OUT after 7200s"
     except Exception as e:
-        log(f"  ERROR: {e}")
-        return False
+        status = f"  ERROR: {e}"
+
+    if capture:
+        with _OUTPUT_LOCK:
+            log(f"\n--- Output of step {step_num}: {name} ---")
+            if output:
+                print(output, end="" if output.endswith("\n") else "\n")
+            log(status)
+    else:
+        log(status)
+    return success
+
+
+def box_sets_need_images() -> bool:
+    """Whether step 10 would find any box set to scrape an image for."""
+    from scripts.scrape_box_set_images import entries_needing_images
+    return bool(entries_needing_images(load_json(CATALOG_FILE)))
+
+
+def run_wave(wave: list[tuple[str, list[str], int, bool]], total_steps: int) -> list[tuple[str, bool]]:
+    """Run a group of steps that touch disjoint data files, concurrently."""
+    if len(wave) == 1:
+        name, cmd, num, _ = wave[0]
+        return [(name, run_step(name, cmd, num, total_steps))]
+    log(f"\nRunning steps {', '.join(str(num) for _, _, num, _ in wave)} concurrently")
+    with ThreadPoolExecutor(max_workers=len(wave)) as pool:
+        futures = [
+            pool.submit(run_step, name, cmd, num, total_steps, True)
+            for name, cmd, num, _ in wave
+        ]
+        return [(name, future.result()) for (name, _, _, _), future in zip(wave, futures)]
 
 
 def main():
@@ -99,6 +150,8 @@ def main():
 
     steps = []
     step_num = 0
+    # step_num -> check run just before the step; False means skip it
+    needs_work = {}
 
     # Step 1: Build catalog. Opt-in: its Digital Bits source has served 403 behind
     # a Cloudflare challenge since 2026-08, and the catalog does not need it to
@@ -111,6 +164,7 @@ def main():
             "Build Criterion Catalog",
             [python, str(SCRIPTS_DIR / "build_catalog.py")],
             step_num,
+            False,
         ))
 
     # Step 2: Scrape Criterion.com picks
@@ -123,6 +177,7 @@ def main():
             "Scrape Criterion.com Picks",
             scrape_cmd + limit_flag,
             step_num,
+            False,
         ))
 
     # Step 3: Normalize guest data
@@ -132,6 +187,7 @@ def main():
             "Normalize Guest Data",
             [python, str(SCRIPTS_DIR / "normalize_guests.py")],
             step_num,
+            False,
         ))
 
     # Step 4: Match YouTube + transcripts
@@ -141,6 +197,7 @@ def main():
             "Match YouTube Videos & Fetch Transcripts",
             [python, str(SCRIPTS_DIR / "match_youtube.py")] + pilot_flag + limit_flag,
             step_num,
+            False,
         ))
 
     # Step 5: Backfill episode dates from YouTube API
@@ -150,6 +207,7 @@ def main():
             "Backfill Episode Dates",
             [python, str(SCRIPTS_DIR / "backfill_dates.py")],
             step_num,
+            False,
         ))
 
     # Step 6: Extract quotes
@@ -159,6 +217,7 @@ def main():
             "Extract Quotes via Gemini",
             [python, str(SCRIPTS_DIR / "extract_quotes.py")] + pilot_flag + limit_flag,
             step_num,
+            False,
         ))
 
     # Step 7: Backfill missing films + propagate URLs + flag box sets
@@ -168,6 +227,7 @@ def main():
             "Backfill Films & Propagate URLs",
             [python, str(SCRIPTS_DIR / "backfill_films.py")],
             step_num,
+            False,
         ))
 
     # Step 8: Re-assert the manual spine layer. Runs after backfill_films, whose
@@ -181,6 +241,7 @@ def main():
             "Apply Verified Spines",
             [python, str(SCRIPTS_DIR / "apply_verified_spines.py")],
             step_num,
+            False,
         ))
 
     # Step 9: Group box set films
@@ -190,6 +251,7 @@ def main():
             "Group Box Set Films",
             [python, str(SCRIPTS_DIR / "group_box_sets.py")],
             step_num,
+            False,
         ))
 
     # Step 10: Scrape box set images (only for entries missing posters)
@@ -199,15 +261,20 @@ def main():
             "Scrape Box Set Images",
             [python, str(SCRIPTS_DIR / "scrape_box_set_images.py")],
             step_num,
+            False,
         ))
+        needs_work[step_num] = box_sets_need_images
 
-    # Step 11: Migrate source/visit metadata
+    # Step 11: Migrate source/visit metadata. Runs alongside step 10: that step
+    # reads and writes only the catalog, this one only guests/picks/picks_raw,
+    # so neither sees the other's writes.
     step_num += 1
     if args.from_step <= step_num:
         steps.append((
             "Migrate Source/Visit Metadata",
             [python, str(SCRIPTS_DIR / "migrate_source_visit.py")],
             step_num,
+            True,
         ))
 
     # Step 12: Enrich via TMDB
@@ -217,6 +284,7 @@ def main():
             "Enrich via TMDB",
             [python, str(SCRIPTS_DIR / "enrich_tmdb.py")] + pilot_flag + limit_flag,
             step_num,
+            False,
         ))
 
     # Step 13: Normalize guest data (second pass - after enrichment)
@@ -226,6 +294,7 @@ def main():
             "Normalize Guest Data (Second Pass)",
             [python, str(SCRIPTS_DIR / "normalize_guests.py")],
             step_num,
+            False,
         ))
 
     # Step 14: Validate
@@ -235,6 +304,7 @@ def main():
             "Validate Data",
             [python, str(SCRIPTS_DIR / "validate.py")] + pilot_flag,
             step_num,
+            False,
         ))
 
     total_steps = len(steps)
@@ -246,12 +316,33 @@ def main():
     log(f"Starting pipeline in {mode} mode: {total_steps} steps")
     overall_start = time.time()
 
+    # A step flagged to run with its predecessor joins the predecessor's wave.
+    waves: list[list[tuple[str, list[str], int, bool]]] = []
+    for step in steps:
+        if waves and step[3]:
+            waves[-1].append(step)
+        else:
+            waves.append([step])
+
     results = []
-    for name, cmd, num in steps:
-        success = run_step(name, cmd, num, step_num)
-        results.append((name, success))
-        if not success:
-            log(f"\nStep '{name}' failed. Stopping pipeline.")
+    skipped = set()
+    for wave in waves:
+        runnable = []
+        for name, cmd, num, parallel in wave:
+            check = needs_work.get(num)
+            if check and not check():
+                log(f"\n  Step {num}/{step_num}: {name} -- nothing to do, skipped")
+                results.append((name, True))
+                skipped.add(name)
+            else:
+                runnable.append((name, cmd, num, parallel))
+        if not runnable:
+            continue
+        wave_results = run_wave(runnable, step_num)
+        results.extend(wave_results)
+        failed = [name for name, success in wave_results if not success]
+        if failed:
+            log(f"\nStep '{failed[0]}' failed. Stopping pipeline.")
             log("Use --from-step to resume from this step after fixing the issue.")
             break
 
@@ -261,7 +352,7 @@ def main():
     log(f"  PIPELINE SUMMARY ({mode})")
     log(f"{'='*60}")
     for name, success in results:
-        status = "PASS" if success else "FAIL"
+        status = "SKIP" if name in skipped else "PASS" if success else "FAIL"
         log(f"  [{status}] {name}")
     log(f"\n  Total time: {overall_elapsed:.1f}s")
 
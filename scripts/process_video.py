@@ -10,14 +10,21 @@ Steps:
   4. Enrich film data via TMDB
   5. Enrich guest data via TMDB
 
+The data files are loaded once and written once at the end of the run, so
+several guests can be processed in one batch by repeating --guest-slug or
+--video-id.
+
 Usage:
   python scripts/process_video.py --guest-slug barry-jenkins
   python scripts/process_video.py --video-id R7HLpe65fHY
   python scripts/process_video.py --guest-slug barry-jenkins --skip-enrich
+  python scripts/process_video.py --guest-slug barry-jenkins --guest-slug bong-joon-ho
 """
 
 import argparse
+import atexit
 import sys
+from collections import defaultdict
 
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
 from scripts.utils import (
@@ -31,19 +38,64 @@ from scripts.utils import (
     log,
     slugify,
     get_env,
+    bucket_picks,
 )
 
 
-def find_guest(guests: list[dict], slug: str = None, video_id: str = None) -> dict | None:
-    """Find a guest by slug or video ID (YouTube or Vimeo)."""
+# Clients shared by every guest in a run, created on first use
+_gemini_model = None
+_tmdb_client = None
+_suppressed_tmdb_ids = None
+# Whether the TMDB client uses the on-disk response cache (off with --no-cache)
+_tmdb_use_cache = True
+
+
+def _get_gemini_model():
+    """Lazy-init the Gemini model used for quote extraction."""
+    global _gemini_model
+    if _gemini_model is None:
+        from scripts.extract_quotes import get_gemini_model
+        _gemini_model = get_gemini_model()
+    return _gemini_model
+
+
+def _get_tmdb_client():
+    """Lazy-init the TMDB client; it also caches the genre list it fetches."""
+    global _tmdb_client
+    if _tmdb_client is None:
+        from scripts.enrich_tmdb import TMDB_CACHE_FILE, TMDBClient
+        _tmdb_client = TMDBClient(cache_path=TMDB_CACHE_FILE if _tmdb_use_cache else None)
+        atexit.register(_tmdb_client.close)
+    return _tmdb_client
+
+
+def _get_suppressed_tmdb_ids() -> set[str]:
+    """Load the suppressed-TMDB film_ids once, rather than once per film."""
+    global _suppressed_tmdb_ids
+    if _suppressed_tmdb_ids is None:
+        from scripts.enrich_tmdb import load_suppressed_tmdb_ids
+        _suppressed_tmdb_ids = load_suppressed_tmdb_ids()
+    return _suppressed_tmdb_ids
+
+
+def build_guest_lookup(guests: list[dict]) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Map slug -> guest and video ID (YouTube or Vimeo) -> guest; first entry wins."""
+    by_slug: dict[str, dict] = {}
+    by_video: dict[str, dict] = {}
     for g in guests:
-        if slug and g["slug"] == slug:
-            return g
-        if video_id and g.get("youtube_video_id") == video_id:
-            return g
-        if video_id and g.get("vimeo_video_id") == video_id:
-            return g
-    return None
+        by_slug.setdefault(g["slug"], g)
+        for key in ("youtube_video_id", "vimeo_video_id"):
+            if g.get(key):
+                by_video.setdefault(g[key], g)
+    return by_slug, by_video
+
+
+def find_guest(
+    lookup: tuple[dict[str, dict], dict[str, dict]], slug: str = None, video_id: str = None
+) -> dict | None:
+    """Find a guest by slug or video ID (YouTube or Vimeo) in a build_guest_lookup() table."""
+    by_slug, by_video = lookup
+    return (slug and by_slug.get(slug)) or (video_id and by_video.get(video_id)) or None
 
 
 def step_fetch_transcript(guest: dict) -> bool:
@@ -81,12 +133,19 @@ def step_fetch_transcript(guest: dict) -> bool:
     return True
 
 
-def step_extract_quotes(guest: dict, force: bool = False) -> bool:
-    """Extract quotes for this guest's picks."""
-    from scripts.extract_quotes import (
-        get_gemini_model,
-        extract_quotes_for_guest,
-    )
+def step_extract_quotes(
+    guest: dict,
+    picks: list[dict],
+    picks_by_guest: dict[str, list[dict]],
+    picks_raw_by_guest: dict[str, list[dict]],
+    force: bool = False,
+) -> bool:
+    """Extract quotes for this guest's picks, updating picks (and its
+    picks_by_guest buckets) in place.
+
+    Returns whether any quotes were merged, i.e. whether picks changed.
+    """
+    from scripts.extract_quotes import extract_quotes_for_guest
 
     slug = guest["slug"]
     video_id = guest.get("youtube_video_id") or guest.get("vimeo_video_id")
@@ -101,27 +160,21 @@ def step_extract_quotes(guest: dict, force: bool = False) -> bool:
         log(f"No transcript for {guest['name']}")
         return False
 
-    # Load picks for this guest
-    picks_raw = load_json(PICKS_RAW_FILE)
-    guest_picks = [p for p in picks_raw if p["guest_slug"] == slug]
+    guest_picks = picks_raw_by_guest.get(slug, [])
     if not guest_picks:
         log(f"No raw picks for {guest['name']}")
         return False
 
-    # Load existing enriched picks
-    existing_picks = load_json(PICKS_FILE)
-    existing_index = {(p["guest_slug"], p.get("film_title", "")): p for p in existing_picks}
+    existing_picks = picks_by_guest[slug]
 
     # Check if already processed
-    has_quotes = any(
-        p.get("quote") for p in existing_picks if p["guest_slug"] == slug
-    )
+    has_quotes = any(p.get("quote") for p in existing_picks)
     if has_quotes and not force:
         log(f"Quotes already extracted for {guest['name']} (use --force to re-extract)")
-        return True
+        return False
 
     # Initialize Gemini
-    model = get_gemini_model()
+    model = _get_gemini_model()
     log(f"Extracting quotes for {guest['name']} ({len(guest_picks)} picks)...")
 
     # Load transcript
@@ -138,7 +191,11 @@ def step_extract_quotes(guest: dict, force: bool = False) -> bool:
 
     log(f"Extracted {len(quotes)} quotes")
 
-    # Merge quotes into picks
+    # Merge quotes into picks: a raw pick replaces this guest's existing pick
+    # of the same film where it stands, otherwise it is appended. With
+    # duplicate films the last pick is the one replaced, as it is the one
+    # collapse_duplicate_picks() keeps.
+    existing_by_film = {_film_key(p): p for p in existing_picks}
     quotes_by_title = {q["film_title"].lower(): q for q in quotes}
     for pick in guest_picks:
         title = pick["film_title"]
@@ -156,34 +213,67 @@ def step_extract_quotes(guest: dict, force: bool = False) -> bool:
                     pick["youtube_timestamp_url"] = (
                         f"https://www.youtube.com/watch?v={video_id}&t={quote_match['start_timestamp']}"
                     )
-        existing_index[(slug, title)] = pick
+        key = _film_key(pick)
+        existing = existing_by_film.get(key)
+        if existing is None:
+            existing = existing_by_film[key] = {}
+            picks.append(existing)
+            existing_picks.append(existing)
+        existing.clear()
+        existing.update(pick)
 
-    # Save all picks
-    all_picks = list(existing_index.values())
-    save_json(PICKS_FILE, all_picks)
-    log(f"Saved {len(all_picks)} picks")
     return True
 
 
-def step_enrich_films(guest: dict) -> bool:
-    """Enrich films in this guest's picks via TMDB."""
-    from scripts.enrich_tmdb import TMDBClient, enrich_film
+def _film_key(pick: dict) -> str:
+    """Identify a pick's film within its guest: by film_id where it has one,
+    as different films can share a title (e.g. the two "Roma"s)."""
+    return pick.get("film_id") or pick.get("film_title", "")
 
-    slug = guest["slug"]
-    picks = load_json(PICKS_FILE)
-    catalog = load_json(CATALOG_FILE)
 
-    # Find film spines from this guest's picks
-    guest_spines = set()
+def collapse_duplicate_picks(picks: list[dict], slugs: set[str]) -> int:
+    """Collapse the given guests' picks of the same film, in place.
+
+    Each (guest_slug, film) key keeps its first position and its last pick's
+    content; other guests' picks are left as they are. Returns how many
+    picks were dropped.
+    """
+    by_key = {(p["guest_slug"], _film_key(p)): p for p in picks if p["guest_slug"] in slugs}
+    kept = []
+    seen = set()
     for p in picks:
-        if p["guest_slug"] == slug and p.get("catalog_spine"):
-            guest_spines.add(p["catalog_spine"])
+        if p["guest_slug"] not in slugs:
+            kept.append(p)
+            continue
+        key = (p["guest_slug"], _film_key(p))
+        if key not in seen:
+            seen.add(key)
+            kept.append(by_key[key])
+    dropped = len(picks) - len(kept)
+    picks[:] = kept
+    return dropped
+
+
+def step_enrich_films(
+    guest: dict,
+    picks_by_guest: dict[str, list[dict]],
+    catalog_by_spine: dict[int, list[dict]],
+) -> bool:
+    """Enrich films in this guest's picks via TMDB, updating catalog entries in place."""
+    from scripts.enrich_tmdb import enrich_film
+
+    slug = guest["slug"]
+
+    # Find film spines from this guest's picks, in pick order
+    guest_spines = dict.fromkeys(
+        p["catalog_spine"] for p in picks_by_guest.get(slug, []) if p.get("catalog_spine")
+    )
 
     if not guest_spines:
         log(f"No catalog spines for {guest['name']}'s picks")
         return True  # Not an error, just no films to enrich
 
-    films_to_enrich = [c for c in catalog if c["spine_number"] in guest_spines]
+    films_to_enrich = [c for spine in guest_spines for c in catalog_by_spine.get(spine, [])]
     # Filter to only unenriched
     films_to_enrich = [f for f in films_to_enrich if not (f.get("tmdb_id") and f.get("poster_url"))]
 
@@ -192,63 +282,50 @@ def step_enrich_films(guest: dict) -> bool:
         return True
 
     log(f"Enriching {len(films_to_enrich)} films via TMDB...")
-    client = TMDBClient()
+    client = _get_tmdb_client()
     genres = client.get_genres()
+    suppressed_tmdb_ids = _get_suppressed_tmdb_ids()
 
     count = 0
     for film in films_to_enrich:
         before = (film.get("tmdb_id"), film.get("poster_url"))
-        enrich_film(client, film, genres)
+        enrich_film(client, film, genres, suppressed_tmdb_ids=suppressed_tmdb_ids)
         after = (film.get("tmdb_id"), film.get("poster_url"))
         if before != after:
             count += 1
 
-    save_json(CATALOG_FILE, catalog)
     log(f"Enriched {count} films")
     return True
 
 
-def step_enrich_guest(guest: dict, guests: list[dict]) -> bool:
-    """Enrich guest with TMDB person data."""
+def step_enrich_guest(guest: dict) -> bool:
+    """Enrich guest with TMDB person data, updating it in place."""
     if guest.get("profession") and guest.get("photo_url"):
         log(f"Guest {guest['name']} already enriched")
         return True
 
-    from scripts.enrich_tmdb import TMDBClient, enrich_guest
+    from scripts.enrich_tmdb import enrich_guest
 
     log(f"Enriching guest {guest['name']} via TMDB...")
-    client = TMDBClient()
+    client = _get_tmdb_client()
     enrich_guest(client, guest)
 
-    save_json(GUESTS_FILE, guests)
     log(f"  Profession: {guest.get('profession', '?')}, Photo: {'yes' if guest.get('photo_url') else 'no'}")
     return True
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Process a single video end-to-end")
-    parser.add_argument("--guest-slug", type=str, help="Guest slug to process")
-    parser.add_argument("--video-id", type=str, help="YouTube video ID to process")
-    parser.add_argument("--force", action="store_true", help="Force re-extraction of quotes")
-    parser.add_argument("--skip-enrich", action="store_true", help="Skip TMDB enrichment")
-    parser.add_argument("--skip-quotes", action="store_true", help="Skip quote extraction")
-    args = parser.parse_args()
-
-    if not args.guest_slug and not args.video_id:
-        parser.error("Must provide --guest-slug or --video-id")
-
-    # Load guests
-    guests = load_json(GUESTS_FILE)
-    guest = find_guest(guests, slug=args.guest_slug, video_id=args.video_id)
-
-    if not guest:
-        identifier = args.guest_slug or args.video_id
-        log(f"ERROR: Guest not found: {identifier}")
-        log("Available guests:")
-        for g in guests:
-            log(f"  {g['slug']} ({g['name']})")
-        sys.exit(1)
+def process_guest(
+    guest: dict,
+    picks: list[dict] | None,
+    picks_by_guest: dict[str, list[dict]] | None,
+    picks_raw_by_guest: dict[str, list[dict]] | None,
+    catalog_by_spine: dict[int, list[dict]] | None,
+    args: argparse.Namespace,
+) -> bool:
+    """Run every step for one guest against the shared, in-memory data.
 
+    Returns whether quotes were merged into picks.
+    """
     log(f"Processing: {guest['name']} (slug: {guest['slug']})")
 
     # Step 1: Fetch transcript
@@ -257,23 +334,98 @@ def main():
         log("WARNING: No transcript available, quote extraction will be skipped")
 
     # Step 2: Extract quotes
+    merged = False
     if not args.skip_quotes:
         log("\n--- Step 2: Extract Quotes ---")
-        step_extract_quotes(guest, force=args.force)
+        merged = step_extract_quotes(
+            guest, picks, picks_by_guest, picks_raw_by_guest, force=args.force
+        )
     else:
         log("\n--- Step 2: Extract Quotes (SKIPPED) ---")
 
     # Step 3: Enrich data
     if not args.skip_enrich:
         log("\n--- Step 3: Enrich Films ---")
-        step_enrich_films(guest)
+        step_enrich_films(guest, picks_by_guest, catalog_by_spine)
 
         log("\n--- Step 4: Enrich Guest ---")
-        step_enrich_guest(guest, guests)
+        step_enrich_guest(guest)
     else:
         log("\n--- Steps 3-4: TMDB Enrichment (SKIPPED) ---")
 
     log(f"\nDone processing {guest['name']}")
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process videos end-to-end")
+    parser.add_argument(
+        "--guest-slug", action="append", default=[], help="Guest slug to process (repeatable)"
+    )
+    parser.add_argument(
+        "--video-id", action="append", default=[], help="YouTube video ID to process (repeatable)"
+    )
+    parser.add_argument("--force", action="store_true", help="Force re-extraction of quotes")
+    parser.add_argument("--skip-enrich", action="store_true", help="Skip TMDB enrichment")
+    parser.add_argument("--skip-quotes", action="store_true", help="Skip quote extraction")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore the on-disk TMDB response cache and fetch everything live")
+    args = parser.parse_args()
+
+    if not args.guest_slug and not args.video_id:
+        parser.error("Must provide --guest-slug or --video-id")
+
+    global _tmdb_use_cache
+    _tmdb_use_cache = not args.no_cache
+
+    # Load guests
+    guests = load_json(GUESTS_FILE)
+    guest_lookup = build_guest_lookup(guests)
+    lookups = [{"slug": s} for s in args.guest_slug] + [{"video_id": v} for v in args.video_id]
+    selected = []
+    for lookup in lookups:
+        guest = find_guest(guest_lookup, **lookup)
+        if not guest:
+            identifier = lookup.get("slug") or lookup.get("video_id")
+            log(f"ERROR: Guest not found: {identifier}")
+            log("Available guests:")
+            for g in guests:
+                log(f"  {g['slug']} ({g['name']})")
+            sys.exit(1)
+        if not any(g is guest for g in selected):
+            selected.append(guest)
+
+    # Load each data file once for the whole batch; the steps mutate these
+    picks = load_json(PICKS_FILE) if not (args.skip_quotes and args.skip_enrich) else None
+    picks_raw = load_json(PICKS_RAW_FILE) if not args.skip_quotes else None
+    catalog = load_json(CATALOG_FILE) if not args.skip_enrich else None
+    # Per-guest views, built once so each guest's steps touch only its own picks
+    picks_by_guest = bucket_picks(picks) if picks is not None else None
+    picks_raw_by_guest = bucket_picks(picks_raw) if picks_raw is not None else None
+    # Spine numbers are not unique across the catalog, so each maps to a list
+    catalog_by_spine = defaultdict(list)
+    for entry in catalog or []:
+        catalog_by_spine[entry["spine_number"]].append(entry)
+
+    merged_slugs = set()
+    try:
+        for guest in selected:
+            if process_guest(guest, picks, picks_by_guest, picks_raw_by_guest, catalog_by_spine, args):
+                merged_slugs.add(guest["slug"])
+    finally:
+        # Flush once, even if a later guest fails; save_json leaves files whose
+        # content didn't change untouched. picks.json is only written when
+        # quotes were merged, and only the merged guests' picks are collapsed.
+        if merged_slugs:
+            dropped = collapse_duplicate_picks(picks, merged_slugs)
+            if dropped:
+                log(f"Collapsed {dropped} duplicate picks")
+            save_json(PICKS_FILE, picks)
+            log(f"Saved {len(picks)} picks")
+        if not args.skip_enrich:
+            save_json(CATALOG_FILE, catalog)
+            save_json(GUESTS_FILE, guests)
+            log("Saved catalog and guests")
 
 
 if __name__ == "__main__":
@@ -3,71 +3,212 @@
 Scrape box set images from Criterion.com.
 
 For catalog entries with is_box_set=True and no poster_url, fetches the
-box set page and extracts the product image URL.
+box set page and extracts the product image URL. Pages are fetched by a few
+browser workers in parallel, sharing one RATE_LIMIT_SECONDS token bucket so
+the overall request rate to criterion.com is unchanged.
+
+Fetched pages are kept in data/cache/boxset_html.sqlite for CACHE_TTL_SECONDS,
+so a re-run after a partial failure parses cached pages instead of refetching
+them under the rate limit.
 
 Usage:
   python scripts/scrape_box_set_images.py --dry-run   # Preview which entries need images
   python scripts/scrape_box_set_images.py              # Scrape and save
+  python scripts/scrape_box_set_images.py --refresh    # Ignore cached pages and refetch
 """
 
 import argparse
+import html
+import queue
+import re
+import signal
+import sqlite3
 import sys
+import threading
 import time
+from pathlib import Path
+from typing import NamedTuple
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
 from scripts.utils import (
     CATALOG_FILE,
+    DATA_DIR,
+    TokenBucket,
     load_json,
     save_json,
     log,
 )
 
-RATE_LIMIT_SECONDS = 1.5
+RATE_LIMIT_SECONDS = 1.5  # aggregate across all workers
+WORKERS = 4
+SAVE_EVERY = 10
+CACHE_FILE = DATA_DIR / "cache" / "boxset_html.sqlite"
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+_BOX_ART_IMG_RE = re.compile(
+    r'<[a-z][^>]*\sclass="(?:[^"]*\s)?product-box-art(?:\s[^"]*)?"[^>]*>\s*<img\b[^>]*?\ssrc="([^"]*)"',
+    re.IGNORECASE,
+)
 
+# lxml is fed UTF-8 bytes: a str holding an XML encoding declaration is
+# rejected outright, and undeclared bytes would otherwise be read as latin-1.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
 
-def scrape_box_set_image(url: str, scraper) -> str | None:
-    """Fetch a Criterion box set page and extract the product image URL."""
-    try:
-        resp = scraper.fetch(url, timeout=15)
 
-        # If redirected to /shop/browse, the URL is stale
-        if "/shop/browse" in resp.url or resp.status_code != 200:
-            return None
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the CSS select_one() lookups, in fallback order. Each
+# takes the first match only, so a first <img> without a src falls through to
+# the next selector rather than to a later <img>.
+_IMAGE_XPATHS = [
+    etree.XPath(f"(//*[{_has_class('product-box-art')}]//img)[1]/@src"),
+    etree.XPath(f"(//*[{_has_class('boxset-hero')}]//img)[1]/@src"),
+    etree.XPath("(//meta[@property='og:image'])[1]/@content"),
+]
+
+
+class CachedPage(NamedTuple):
+    """A cached fetch, shaped like browser_utils.FetchResult."""
+
+    status_code: int
+    text: str
+    url: str
+
+
+class BoxSetCache:
+    """Persistent url -> fetched page store backed by sqlite."""
+
+    def __init__(self, path: Path = CACHE_FILE, ttl: int = CACHE_TTL_SECONDS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, html TEXT, final_url TEXT, status INT, fetched_at INT)"
+        )
+
+    def __enter__(self):
+        return self
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+    def __exit__(self, *exc):
+        self._conn.close()
 
-        # Try .product-box-art img first (box set pages)
-        img = soup.select_one(".product-box-art img")
-        if img and img.get("src"):
-            return img["src"]
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached page for url, or None if missing or older than the TTL."""
+        row = self._conn.execute(
+            "SELECT status, html, final_url FROM pages WHERE url = ? AND fetched_at > ?",
+            (url, int(time.time()) - self.ttl),
+        ).fetchone()
+        return CachedPage(*row) if row else None
 
-        # Fallback: .boxset-hero img
-        img = soup.select_one(".boxset-hero img")
-        if img and img.get("src"):
-            return img["src"]
+    def put(self, url: str, page) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, html, final_url, status, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, page.text, page.url, page.status_code, int(time.time())),
+            )
 
-        # Fallback: meta og:image
-        meta = soup.select_one('meta[property="og:image"]')
-        if meta and meta.get("content"):
-            return meta["content"]
 
+def extract_box_set_image(page) -> str | None:
+    """Extract the product image URL from a fetched Criterion box set page."""
+    # If redirected to /shop/browse, the URL is stale
+    if "/shop/browse" in page.url or page.status_code != 200:
         return None
-    except Exception as e:
-        log(f"  Error fetching {url}: {e}")
+
+    # Fast path: box set pages put the product image directly inside the
+    # .product-box-art container, so skip building a tree when it's there.
+    match = _BOX_ART_IMG_RE.search(page.text)
+    if match and match[1]:
+        return html.unescape(match[1])
+
+    if not page.text.strip():
         return None
+    tree = lxml.html.fromstring(page.text.encode(), parser=_HTML_PARSER)
 
+    # .product-box-art img first (box set pages), then .boxset-hero img,
+    # then meta og:image
+    for xpath in _IMAGE_XPATHS:
+        value = xpath(tree)
+        if value and value[0]:
+            return str(value[0])
 
-def main():
-    parser = argparse.ArgumentParser(description="Scrape box set images")
-    parser.add_argument("--dry-run", action="store_true", help="Preview without saving")
-    args = parser.parse_args()
+    return None
 
-    catalog = load_json(CATALOG_FILE)
 
-    # Find box set entries needing images
-    needs_image = [
+def fetch_worker(entries: queue.Queue, results: queue.Queue, bucket: TokenBucket) -> None:
+    """Fetch queued entries' pages, posting (entry, page or None) to results.
+
+    Each worker drives its own browser: Playwright's sync API is bound to the
+    thread that started it. A final None tells the consumer this worker is done.
+    """
+    from scripts.browser_utils import CriterionBrowser
+
+    try:
+        # Only the markup is parsed, so don't download the page's images
+        with CriterionBrowser(skip_assets=True) as scraper:
+            while True:
+                try:
+                    entry = entries.get_nowait()
+                except queue.Empty:
+                    return
+                bucket.acquire()
+                try:
+                    page = scraper.fetch(entry["criterion_url"], timeout=15)
+                except Exception as e:
+                    log(f"  Error fetching {entry['criterion_url']}: {e}")
+                    page = None
+                results.put((entry, page))
+    except Exception as e:
+        log(f"  Browser worker failed: {e}")
+    finally:
+        results.put(None)
+
+
+def fetch_pages(entries: list[dict], workers: int, interval: float):
+    """Yield (entry, page or None) as pages arrive, rate-limited across workers.
+
+    If no worker browser starts (or workers is 0), the entries left are
+    fetched by a single browser; if that cannot start either, RuntimeError.
+    """
+    todo: queue.Queue = queue.Queue()
+    for entry in entries:
+        todo.put(entry)
+    results: queue.Queue = queue.Queue()
+    bucket = TokenBucket(interval)
+
+    def start(count: int) -> int:
+        for _ in range(count):
+            threading.Thread(target=fetch_worker, args=(todo, results, bucket), daemon=True).start()
+        return count
+
+    running = start(max(0, min(workers, len(entries))))
+    serial = False
+    while True:
+        while running:
+            item = results.get()
+            if item is None:
+                running -= 1
+            else:
+                yield item
+
+        if todo.empty():
+            return
+        if serial:
+            raise RuntimeError(f"No browser could be started; {todo.qsize()} box set pages not fetched")
+        log("  No browser worker started; fetching the rest serially")
+        serial = True
+        running = start(1)
+
+
+def entries_needing_images(catalog: list[dict]) -> list[dict]:
+    """Box set entries with a Criterion box set URL but no poster yet."""
+    return [
         entry for entry in catalog
         if entry.get("is_box_set")
         and not entry.get("poster_url")
@@ -75,6 +216,26 @@ def main():
         and "/boxsets/" in entry["criterion_url"]
     ]
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape box set images")
+    parser.add_argument("--dry-run", action="store_true", help="Preview without saving")
+    parser.add_argument("--refresh", action="store_true", help="Refetch pages even if cached")
+    parser.add_argument(
+        "--workers", type=int, default=WORKERS, help=f"Concurrent browsers (default: {WORKERS})"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=RATE_LIMIT_SECONDS,
+        help=f"Seconds between requests across all workers (default: {RATE_LIMIT_SECONDS})",
+    )
+    args = parser.parse_args()
+
+    catalog = load_json(CATALOG_FILE)
+
+    needs_image = entries_needing_images(catalog)
+
     log(f"Found {len(needs_image)} box set entries needing images")
 
     if args.dry_run:
@@ -83,38 +244,60 @@ def main():
         log("(dry run)")
         return
 
-    from scripts.browser_utils import CriterionBrowser
-
-    with CriterionBrowser() as scraper:
-        found = 0
-        failed = 0
+    found = 0
+    failed = 0
+    done = 0
+    unsaved = 0
 
-        for i, entry in enumerate(needs_image):
-            url = entry["criterion_url"]
-            log(f"  [{i + 1}/{len(needs_image)}] {entry['film_id']}")
+    def record(entry, image_url):
+        nonlocal found, failed, done, unsaved
+        done += 1
+        log(f"  [{done}/{len(needs_image)}] {entry['film_id']}")
+        if image_url:
+            entry["poster_url"] = image_url
+            # These come off the Criterion product page, so record the origin
+            # the same way scrape_criterion_images.py does.
+            entry["poster_source"] = "criterion"
+            found += 1
+            unsaved += 1
+            log(f"    Found: {image_url[:80]}...")
+        else:
+            failed += 1
+            log(f"    No image found")
 
-            image_url = scrape_box_set_image(url, scraper)
-
-            if image_url:
-                entry["poster_url"] = image_url
-                # These come off the Criterion product page, so record the origin
-                # the same way scrape_criterion_images.py does.
-                entry["poster_source"] = "criterion"
-                found += 1
-                log(f"    Found: {image_url[:80]}...")
-            else:
-                failed += 1
-                log(f"    No image found")
-
-            if i < len(needs_image) - 1:
-                time.sleep(RATE_LIMIT_SECONDS)
+        # Checkpoint so even a killed run keeps most of what it found
+        if unsaved >= SAVE_EVERY:
+            save_json(CATALOG_FILE, catalog)
+            unsaved = 0
 
-        log(f"\nDone: {found} images found, {failed} failed")
+    # SIGTERM becomes SystemExit so the finally below still saves
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    try:
+        with BoxSetCache() as cache:
+            to_fetch = []
+            for entry in needs_image:
+                page = None if args.refresh else cache.get(entry["criterion_url"])
+                if page is None:
+                    to_fetch.append(entry)
+                else:
+                    record(entry, extract_box_set_image(page))
+            cached = done
 
-        if found > 0:
+            for entry, page in fetch_pages(to_fetch, args.workers, args.rate):
+                # Only 200s are cached: a stale URL still lands on /shop/browse with
+                # a 200, while other statuses (e.g. a Cloudflare challenge) are
+                # worth retrying on the next run.
+                if page is not None and page.status_code == 200:
+                    cache.put(entry["criterion_url"], page)
+                record(entry, extract_box_set_image(page) if page is not None else None)
+    finally:
+        # Also runs on Ctrl-C / SIGTERM, so an interrupted run keeps its finds
+        if unsaved:
             save_json(CATALOG_FILE, catalog)
             log(f"Saved {CATALOG_FILE}")
 
+    log(f"\nDone: {found} images found, {failed} failed ({cached} from cache)")
+
 
 if __name__ == "__main__":
     main()
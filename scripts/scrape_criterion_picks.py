@@ -15,16 +15,23 @@ Usage:
   python scripts/scrape_criterion_picks.py --videos-only # Extract YouTube video IDs from collection pages
   python scripts/scrape_criterion_picks.py --guest "Cate Blanchett"  # Single guest
   python scripts/scrape_criterion_picks.py --limit 10    # Limit collections
+  python scripts/scrape_criterion_picks.py --workers 1   # One browser, no parallel fetches
+
+Collection pages are fetched by WORKERS browsers in parallel, sharing one
+REQUEST_DELAY token bucket, so the overall request rate to criterion.com is
+unchanged while page loads overlap.
 
 Output: updates data/guests.json + data/picks_raw.json
 """
 
 import argparse
+import queue
 import re
 import sys
-import time
+import threading
+from contextlib import closing
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
 
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
@@ -34,13 +41,16 @@ from scripts.utils import (
     GUESTS_FILE,
     PICKS_RAW_FILE,
     VISIT_CRITERION_URLS,
+    TokenBucket,
     load_json,
     save_json,
     log,
+    retry_after,
     slugify,
     make_film_id,
-    fuzzy_match_score,
     fuzzy_match_name,
+    fuzzy_match_scores,
+    fuzzy_prepare,
     titles_conflict_on_volume,
 )
 
@@ -48,8 +58,27 @@ CRITERION_BASE = "https://www.criterion.com"
 CLOSET_PICKS_INDEX = f"{CRITERION_BASE}/closet-picks"
 CHECKPOINT_FILE = DATA_DIR / ".criterion_scrape_progress.json"
 
-# Rate limit between requests (seconds)
+# Rate limit between requests (seconds), aggregate across all workers
 REQUEST_DELAY = 1.5
+WORKERS = 4
+# Attempts per page while Criterion answers 429/503 (backing off between them)
+MAX_ATTEMPTS = 4
+RETRY_STATUSES = frozenset({429, 503})
+
+# Everything parsed off a Criterion page lives in an <a>, so the rest of the
+# multi-hundred-KB DOM is never built.
+_ANCHORS = SoupStrainer("a")
+# Pagination is found by its container's class, which a strained soup drops;
+# most collections fit on one page and have no such container at all.
+_PAGINATION_RE = re.compile(r'class="(?:[^"]*\s)?(?:pagination|paginator)(?:[\s"])')
+
+# Criterion URL shapes: /shop/collection/{id}-{slug}, /films/{id}-{slug}, ...
+_URL_ORIGIN_RE = re.compile(r"^https?://[^/]+")
+_COLLECTION_PATH_RE = re.compile(r"/shop/collection/\d+-")
+_COLLECTION_SLUG_NAME_RE = re.compile(r"/shop/collection/\d+-(.*?)(?:-s-closet|-closet)")
+_FILM_PATH_RE = re.compile(r"/films/(\d+)-(.+?)/?$")
+_BOXSET_PATH_RE = re.compile(r"/boxsets/(\d+)-(.+?)/?$")
+_FILM_ID_RE = re.compile(r"/films/(\d+)")
 
 
 class CollectionUnavailable(Exception):
@@ -74,78 +103,191 @@ def create_scraper():
     return CriterionBrowser()
 
 
-# ---------------------------------------------------------------------------
-# YouTube video extraction
-# ---------------------------------------------------------------------------
+class _ThrottledScraper:
+    """Takes a token from the shared bucket before every fetch.
 
-def extract_youtube_video_id(soup: BeautifulSoup) -> str | None:
-    """
-    Extract YouTube video ID from a Criterion collection page.
-    Looks for YouTube embed iframes in the parsed HTML.
+    A 429 or 503 pauses the whole bucket -- every worker, not just this one --
+    for as long as Retry-After asks, else 2s, 4s, 8s, then the page is retried.
     """
-    # Look for YouTube embeds in iframes
-    for iframe in soup.select('iframe[src*="youtube.com/embed/"]'):
-        src = iframe.get("src", "")
-        m = re.search(r"youtube\.com/embed/([a-zA-Z0-9_-]{11})", src)
-        if m:
-            return m.group(1)
 
-    # Also check for youtube-nocookie.com embeds
-    for iframe in soup.select('iframe[src*="youtube-nocookie.com/embed/"]'):
-        src = iframe.get("src", "")
-        m = re.search(r"youtube-nocookie\.com/embed/([a-zA-Z0-9_-]{11})", src)
-        if m:
-            return m.group(1)
+    def __init__(self, scraper, bucket: TokenBucket):
+        self._scraper = scraper
+        self._bucket = bucket
 
-    # Fallback: regex search in raw HTML for any youtube embed URL
-    raw_html = str(soup)
-    m = re.search(r"youtube(?:-nocookie)?\.com/embed/([a-zA-Z0-9_-]{11})", raw_html)
-    if m:
-        return m.group(1)
+    def fetch(self, url: str, timeout: int = 30):
+        for attempt in range(MAX_ATTEMPTS):
+            self._bucket.acquire()
+            resp = self._scraper.fetch(url, timeout=timeout)
+            if resp.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                return resp
+            delay = retry_after(resp)
+            delay = delay if delay is not None else 2 ** (attempt + 1)
+            log(f"    HTTP {resp.status_code} for {url}, retrying in {delay:g}s")
+            self._bucket.pause(delay)
 
-    return None
 
+def _scrape_worker(jobs: queue.Queue, results: queue.Queue, bucket: TokenBucket, func) -> None:
+    """Run func(scraper, item) on queued items, posting (index, result, error).
 
-def extract_vimeo_video_id(soup: BeautifulSoup) -> str | None:
+    Each worker drives its own browser: Playwright's sync API is bound to the
+    thread that started it. A final None tells the consumer this worker is done.
     """
-    Extract Vimeo video ID from a Criterion collection page.
-    Looks for Vimeo embed iframes in the parsed HTML.
+    from scripts.browser_utils import CriterionBrowser
+
+    try:
+        # Only the markup is parsed, so don't download the page's images
+        with CriterionBrowser(skip_assets=True) as browser:
+            scraper = _ThrottledScraper(browser, bucket)
+            while True:
+                try:
+                    index, item = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results.put((index, func(scraper, item), None))
+                except Exception as e:
+                    results.put((index, None, e))
+    except Exception as e:
+        log(f"  Browser worker failed: {e}")
+    finally:
+        results.put(None)
+
+
+def scrape_concurrently(scraper, func, items: list, workers: int = WORKERS, interval: float = REQUEST_DELAY):
     """
-    # Fancybox lightbox links (used by Criterion collection pages)
-    for a in soup.select('a[data-fancybox][href*="vimeo.com"]'):
-        href = a.get("href", "")
-        m = re.search(r"vimeo\.com/(?:video/)?(\d+)", href)
-        if m:
-            return m.group(1)
+    Yield (item, result, error) for func(scraper, item) over items, in input order.
 
-    # Look for Vimeo embeds in iframes (src)
-    for iframe in soup.select('iframe[src*="player.vimeo.com/video/"]'):
-        src = iframe.get("src", "")
-        m = re.search(r"player\.vimeo\.com/video/(\d+)", src)
-        if m:
-            return m.group(1)
+    Pages are fetched by up to `workers` browsers in parallel, sharing one
+    `interval` token bucket so the overall request rate to criterion.com stays
+    what a single serial scraper would send. With one worker, `scraper` itself
+    is used on this thread and no extra browser is started.
+    """
+    bucket = TokenBucket(interval)
+
+    if workers <= 1 or len(items) <= 1:
+        throttled = _ThrottledScraper(scraper, bucket)
+        for item in items:
+            try:
+                yield item, func(throttled, item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    # Hand the workers this browser's cookies (cf_clearance included) so each
+    # starts past the Cloudflare challenge rather than solving it again.
+    scraper.save_state()
+
+    jobs: queue.Queue = queue.Queue()
+    for job in enumerate(items):
+        jobs.put(job)
+    results: queue.Queue = queue.Queue()
+
+    workers = min(workers, len(items))
+    threads = [
+        threading.Thread(target=_scrape_worker, args=(jobs, results, bucket, func), daemon=True)
+        for _ in range(workers)
+    ]
+    for t in threads:
+        t.start()
+
+    # Results arrive in completion order; hold them back until the earlier
+    # items are done so callers merge (and checkpoint) in a stable order.
+    pending: dict[int, tuple] = {}
+    next_index = 0
+    running = workers
+    try:
+        while running:
+            done = results.get()
+            if done is None:
+                running -= 1
+                continue
+            index, result, error = done
+            pending[index] = (result, error)
+            while next_index in pending:
+                yield (items[next_index], *pending.pop(next_index))
+                next_index += 1
+
+        # Every browser has stopped. If none could start, the jobs are still
+        # queued: run them here on `scraper` rather than drop them.
+        if not jobs.empty():
+            log("  No browser worker started; scraping the rest serially")
+        throttled = _ThrottledScraper(scraper, bucket)
+        while True:
+            try:
+                index, item = jobs.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                pending[index] = (func(throttled, item), None)
+            except Exception as e:
+                pending[index] = (None, e)
+            while next_index in pending:
+                yield (items[next_index], *pending.pop(next_index))
+                next_index += 1
+    finally:
+        # Closed early (the caller raised): hand out no more jobs, then wait
+        # for each worker to finish its page and close its own browser.
+        while True:
+            try:
+                jobs.get_nowait()
+            except queue.Empty:
+                break
+        for t in threads:
+            t.join()
 
-    # Also check lazy-loaded iframes (data-src)
-    for iframe in soup.select('iframe[data-src*="player.vimeo.com/video/"]'):
-        src = iframe.get("data-src", "")
-        m = re.search(r"player\.vimeo\.com/video/(\d+)", src)
+
+# ---------------------------------------------------------------------------
+# YouTube video extraction
+# ---------------------------------------------------------------------------
+
+# Video IDs are read straight off the page source: no tree is needed for them.
+# Each tuple is in priority order; the last pattern is a catch-all anywhere in
+# the page. Chromium serializes attributes double-quoted.
+_YOUTUBE_ID_RES = (
+    re.compile(r'<iframe\b[^>]*?\ssrc="[^"]*youtube\.com/embed/([a-zA-Z0-9_-]{11})', re.IGNORECASE),
+    re.compile(r'<iframe\b[^>]*?\ssrc="[^"]*youtube-nocookie\.com/embed/([a-zA-Z0-9_-]{11})', re.IGNORECASE),
+    re.compile(r"youtube(?:-nocookie)?\.com/embed/([a-zA-Z0-9_-]{11})"),
+)
+_VIMEO_ID_RES = (
+    re.compile(r'<a\b(?=[^>]*\sdata-fancybox[\s=>])[^>]*?\shref="[^"]*vimeo\.com/(?:video/)?(\d+)', re.IGNORECASE),
+    re.compile(r'<iframe\b[^>]*?\ssrc="[^"]*player\.vimeo\.com/video/(\d+)', re.IGNORECASE),
+    re.compile(r'<iframe\b[^>]*?\sdata-src="[^"]*player\.vimeo\.com/video/(\d+)', re.IGNORECASE),
+    re.compile(r"vimeo\.com/(?:video/)?(\d+)"),
+)
+
+
+def _first_match(patterns: tuple[re.Pattern, ...], html: str) -> str | None:
+    """Group 1 of the first pattern that matches, trying patterns in order."""
+    for pattern in patterns:
+        m = pattern.search(html)
         if m:
             return m.group(1)
+    return None
 
-    # Fallback: regex search in raw HTML (broadened to match vimeo.com/ URLs too)
-    raw_html = str(soup)
-    m = re.search(r"vimeo\.com/(?:video/)?(\d+)", raw_html)
-    if m:
-        return m.group(1)
 
-    return None
+def extract_youtube_video_id(html: str) -> str | None:
+    """
+    Extract YouTube video ID from a Criterion collection page's HTML.
+    Prefers a YouTube embed iframe, then a youtube-nocookie.com one, then any
+    embed URL anywhere in the page.
+    """
+    return _first_match(_YOUTUBE_ID_RES, html)
 
 
-def extract_video_ids(soup: BeautifulSoup) -> dict[str, str | None]:
-    """Extract both YouTube and Vimeo video IDs from a page."""
+def extract_vimeo_video_id(html: str) -> str | None:
+    """
+    Extract Vimeo video ID from a Criterion collection page's HTML.
+    Prefers the fancybox lightbox link Criterion collection pages use, then an
+    embed iframe (src, then lazy-loaded data-src), then any vimeo.com URL.
+    """
+    return _first_match(_VIMEO_ID_RES, html)
+
+
+def extract_video_ids(html: str) -> dict[str, str | None]:
+    """Extract both YouTube and Vimeo video IDs from a page's HTML."""
     return {
-        "youtube_video_id": extract_youtube_video_id(soup),
-        "vimeo_video_id": extract_vimeo_video_id(soup),
+        "youtube_video_id": extract_youtube_video_id(html),
+        "vimeo_video_id": extract_vimeo_video_id(html),
     }
 
 
@@ -169,7 +311,21 @@ def _apply_video_ids_to_target(target: dict, video_ids: dict, label: str) -> boo
     return updated
 
 
-def extract_videos_from_criterion_pages(scraper, existing_guests: list[dict]) -> int:
+def _fetch_video_ids(scraper, url: str) -> dict[str, str | None]:
+    """Fetch one Criterion page and extract its video IDs (none on a non-200)."""
+    resp = scraper.fetch(url, timeout=30)
+    if resp.status_code != 200:
+        log(f"    HTTP {resp.status_code} for {url}")
+        return {"youtube_video_id": None, "vimeo_video_id": None}
+    return extract_video_ids(resp.text)
+
+
+def extract_videos_from_criterion_pages(
+    scraper,
+    existing_guests: list[dict],
+    workers: int = WORKERS,
+    interval: float = REQUEST_DELAY,
+) -> int:
     """
     For guests with criterion_page_url but no video IDs (YouTube or Vimeo),
     fetch the collection page and extract video IDs.
@@ -194,44 +350,24 @@ def extract_videos_from_criterion_pages(scraper, existing_guests: list[dict]) ->
         log("No guests need video extraction from Criterion pages")
         return 0
 
-    # Deduplicate by URL (same page shouldn't be fetched twice)
-    seen_urls: dict[str, dict] = {}
-    deduped_targets: list[tuple[dict, str, dict, str]] = []
-    for guest, url, target, label in targets:
-        if url not in seen_urls:
-            seen_urls[url] = None  # Will be populated with video_ids
-            deduped_targets.append((guest, url, target, label))
-        else:
-            deduped_targets.append((guest, url, target, label))
+    # Fetch each page once, however many guests/visits point at it
+    urls = list(dict.fromkeys(t[1] for t in targets))
+    log(f"Checking {len(urls)} unique Criterion pages for video embeds...")
 
-    log(f"Checking {len(set(t[1] for t in deduped_targets))} unique Criterion pages for video embeds...")
-    updated_guests = set()
+    # Every URL gets an entry, a failure included (as no IDs), so nothing is
+    # refetched. Closing the generator stops the worker browsers.
+    video_ids_by_url: dict[str, dict] = {}
+    with closing(scrape_concurrently(scraper, _fetch_video_ids, urls, workers, interval)) as fetched:
+        for url, video_ids, error in tqdm(fetched, total=len(urls), desc="Extracting video IDs"):
+            if error is not None:
+                log(f"    Error for {url}: {error}")
+                video_ids = {"youtube_video_id": None, "vimeo_video_id": None}
+            video_ids_by_url[url] = video_ids
 
-    for guest, url, target, label in tqdm(deduped_targets, desc="Extracting video IDs"):
-        # Use cached result if we already fetched this URL
-        if url in seen_urls and seen_urls[url] is not None:
-            video_ids = seen_urls[url]
-        else:
-            log(f"  Checking {label}: {url}")
-            try:
-                resp = scraper.fetch(url, timeout=30)
-                if resp.status_code != 200:
-                    log(f"    HTTP {resp.status_code}")
-                    seen_urls[url] = {"youtube_video_id": None, "vimeo_video_id": None}
-                    time.sleep(REQUEST_DELAY)
-                    continue
-            except Exception as e:
-                log(f"    Error: {e}")
-                seen_urls[url] = {"youtube_video_id": None, "vimeo_video_id": None}
-                time.sleep(REQUEST_DELAY)
-                continue
-
-            soup = BeautifulSoup(resp.text, "lxml")
-            video_ids = extract_video_ids(soup)
-            seen_urls[url] = video_ids
-            time.sleep(REQUEST_DELAY)
-
-        if _apply_video_ids_to_target(target, video_ids, label):
+    updated_guests = set()
+    for guest, url, target, label in targets:
+        video_ids = video_ids_by_url.get(url)
+        if video_ids and _apply_video_ids_to_target(target, video_ids, label):
             updated_guests.add(guest["slug"])
 
     return len(updated_guests)
@@ -241,6 +377,19 @@ def extract_videos_from_criterion_pages(scraper, existing_guests: list[dict]) ->
 # Index scraping
 # ---------------------------------------------------------------------------
 
+# Overlay text the index's <a> tags pick up from child elements
+_WATCH_SHOP_PREFIX_RE = re.compile(r"^W[a-z]*ch\s*&\s*shop\s*(now\s*)?", re.IGNORECASE)
+_WATCH_SHOP_SUFFIX_RE = re.compile(r"\s*W[a-z]*ch\s*&\s*shop\s*(now\s*)?$", re.IGNORECASE)
+_QUICK_SHOP_PREFIX_RE = re.compile(r"^Quick\s*Shop\s*", re.IGNORECASE)
+_QUICK_SHOP_SUFFIX_RE = re.compile(r"\s*Quick\s*Shop\s*$", re.IGNORECASE)
+
+_POSSESSIVE_GUEST_NAME_RE = re.compile(
+    r"^(.+?)(?:['\u2019]s)\s+(?:Second\s+)?Closet\s+Picks?", re.IGNORECASE
+)
+_BARE_GUEST_NAME_RE = re.compile(r"^(.+?)\s+Closet\s+Picks?", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _clean_link_text(text: str) -> str:
     """
     Clean up link text from Criterion index page.
@@ -249,10 +398,10 @@ def _clean_link_text(text: str) -> str:
     """
     # Remove common overlay text (with optional trailing words like "now")
     # Broadened to catch misspellings: "Waych", "Watch&" etc.
-    text = re.sub(r"^W[a-z]*ch\s*&\s*shop\s*(now\s*)?", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s*W[a-z]*ch\s*&\s*shop\s*(now\s*)?$", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^Quick\s*Shop\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s*Quick\s*Shop\s*$", "", text, flags=re.IGNORECASE)
+    text = _WATCH_SHOP_PREFIX_RE.sub("", text)
+    text = _WATCH_SHOP_SUFFIX_RE.sub("", text)
+    text = _QUICK_SHOP_PREFIX_RE.sub("", text)
+    text = _QUICK_SHOP_SUFFIX_RE.sub("", text)
     return text.strip()
 
 
@@ -269,16 +418,12 @@ def parse_guest_name_from_link_text(text: str) -> str:
     text = _clean_link_text(text)
 
     # Pattern: "Name's Closet Picks" (smart or straight apostrophe)
-    m = re.match(
-        r"^(.+?)(?:['\u2019]s)\s+(?:Second\s+)?Closet\s+Picks?",
-        text,
-        re.IGNORECASE,
-    )
+    m = _POSSESSIVE_GUEST_NAME_RE.match(text)
     if m:
         return m.group(1).strip()
 
     # Pattern: "Name Closet Picks" (no possessive -- rare)
-    m = re.match(r"^(.+?)\s+Closet\s+Picks?", text, re.IGNORECASE)
+    m = _BARE_GUEST_NAME_RE.match(text)
     if m:
         name = m.group(1).strip()
         # Avoid capturing random words
@@ -290,6 +435,26 @@ def parse_guest_name_from_link_text(text: str) -> str:
     return ""
 
 
+def _index_visit_urls() -> tuple[dict[str, str], dict[tuple[str, str], int]]:
+    """
+    Invert VISIT_CRITERION_URLS once: collection URL -> canonical guest slug,
+    and (slug, URL) -> 1-based visit_index. The first listing wins, as a scan
+    of the dict in order would find it.
+    """
+    url_to_slug: dict[str, str] = {}
+    visit_index: dict[tuple[str, str], int] = {}
+    for slug, urls in VISIT_CRITERION_URLS.items():
+        for i, url in enumerate(urls, start=1):
+            url_to_slug.setdefault(url, slug)
+            visit_index.setdefault((slug, url), i)
+    return url_to_slug, visit_index
+
+
+_URL_TO_CANONICAL_SLUG, _VISIT_URL_INDEX = _index_visit_urls()
+_MULTI_VISIT_SLUGS = frozenset(slug for slug, urls in VISIT_CRITERION_URLS.items() if len(urls) >= 2)
+_MULTI_VISIT_URLS = frozenset(url for slug in _MULTI_VISIT_SLUGS for url in VISIT_CRITERION_URLS[slug])
+
+
 # Non-guest collection URLs to skip (promos, sale pages, etc.)
 SKIP_COLLECTION_URLS = {
     "https://www.criterion.com/shop/collection/498-4k-discs",
@@ -314,7 +479,7 @@ def scrape_index(scraper) -> list[dict]:
         log(f"  Error fetching index: {e}")
         return []
 
-    soup = BeautifulSoup(resp.text, "lxml")
+    soup = BeautifulSoup(resp.text, "lxml", parse_only=_ANCHORS)
 
     # Collection links match: /shop/collection/{id}-{slug}
     for a in soup.select('a[href*="/shop/collection/"]'):
@@ -324,7 +489,7 @@ def scrape_index(scraper) -> list[dict]:
         # Normalize to path only
         path = href
         if path.startswith("http"):
-            path = re.sub(r"^https?://[^/]+", "", path)
+            path = _URL_ORIGIN_RE.sub("", path)
 
         # Skip duplicates
         if path in seen_paths:
@@ -332,13 +497,13 @@ def scrape_index(scraper) -> list[dict]:
         seen_paths.add(path)
 
         # Must match the collection URL pattern
-        if not re.match(r"/shop/collection/\d+-", path):
+        if not _COLLECTION_PATH_RE.match(path):
             continue
 
         # If link text is empty (e.g., older visit links with just "Watch & shop"),
         # extract guest name from URL slug
         if not text or len(text) < 3:
-            m = re.match(r"/shop/collection/\d+-(.*?)(?:-s-closet|-closet)", path)
+            m = _COLLECTION_SLUG_NAME_RE.match(path)
             if m:
                 text = m.group(1).replace("-", " ").title()
             else:
@@ -355,11 +520,7 @@ def scrape_index(scraper) -> list[dict]:
 
         # Resolve canonical slug via VISIT_CRITERION_URLS for multi-visit guests
         # (e.g., "yorgos-lanthimos-ariane-labed" -> "yorgos-lanthimos")
-        coll_slug = slugify(guest_name)
-        for canonical_slug, urls in VISIT_CRITERION_URLS.items():
-            if full_url in urls:
-                coll_slug = canonical_slug
-                break
+        coll_slug = _URL_TO_CANONICAL_SLUG.get(full_url) or slugify(guest_name)
 
         collections.append({
             "name": guest_name,
@@ -413,14 +574,14 @@ def scrape_collection_page(scraper, collection_url: str) -> tuple[list[dict], di
         # A collection that redirects off /shop/collection/ is not live yet. Its
         # landing page (/shop/browse) lists the whole catalog, so parsing it would
         # attribute the catalog's first page to this guest.
-        if not re.search(r"/shop/collection/\d+-", resp.url):
+        if not _COLLECTION_PATH_RE.search(resp.url):
             raise CollectionUnavailable(f"{collection_url} redirected to {resp.url}")
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        soup = BeautifulSoup(resp.text, "lxml", parse_only=_ANCHORS)
 
         # Extract video IDs from the first page only (no extra HTTP request)
         if page == 1:
-            video_ids = extract_video_ids(soup)
+            video_ids = extract_video_ids(resp.text)
 
         page_films = _extract_films_from_page(soup, seen_film_ids)
 
@@ -433,8 +594,12 @@ def scrape_collection_page(scraper, collection_url: str) -> tuple[list[dict], di
         films.extend(page_films)
 
         # Check for next page -- look for pagination links
-        pagination = soup.select(".pagination a, .paginator a, nav.pagination a")
         has_next = False
+        if _PAGINATION_RE.search(resp.text):
+            full_soup = BeautifulSoup(resp.text, "lxml")
+            pagination = full_soup.select(".pagination a, .paginator a, nav.pagination a")
+        else:
+            pagination = []
         for link in pagination:
             link_text = link.get_text(strip=True).lower()
             link_href = link.get("href", "")
@@ -444,13 +609,16 @@ def scrape_collection_page(scraper, collection_url: str) -> tuple[list[dict], di
 
         if has_next:
             page += 1
-            time.sleep(REQUEST_DELAY)
         else:
             break
 
     return films, video_ids
 
 
+def _scrape_collection(scraper, coll: dict) -> tuple[list[dict], dict[str, str | None]]:
+    return scrape_collection_page(scraper, coll["collection_url"])
+
+
 def _extract_films_from_page(soup: BeautifulSoup, seen_film_ids: set) -> list[dict]:
     """
     Extract film data from a Criterion collection page.
@@ -482,10 +650,10 @@ def _extract_films_from_page(soup: BeautifulSoup, seen_film_ids: set) -> list[di
         # Skip non-film links (e.g. /films/ without ID)
         path = href
         if path.startswith("http"):
-            path = re.sub(r"^https?://[^/]+", "", path)
+            path = _URL_ORIGIN_RE.sub("", path)
 
         # Match film URL pattern: /films/{id}-{slug}
-        m = re.match(r"/films/(\d+)-(.+?)/?$", path)
+        m = _FILM_PATH_RE.match(path)
         if not m:
             continue
 
@@ -523,9 +691,9 @@ def _extract_films_from_page(soup: BeautifulSoup, seen_film_ids: set) -> list[di
 
         path = href
         if path.startswith("http"):
-            path = re.sub(r"^https?://[^/]+", "", path)
+            path = _URL_ORIGIN_RE.sub("", path)
 
-        m = re.match(r"/boxsets/(\d+)-(.+?)/?$", path)
+        m = _BOXSET_PATH_RE.match(path)
         if not m:
             continue
 
@@ -592,7 +760,7 @@ def _clean_film_title(raw_text: str) -> str:
     or has extra whitespace. Do basic cleanup here.
     """
     # Collapse whitespace
-    title = re.sub(r"\s+", " ", raw_text).strip()
+    title = _WHITESPACE_RE.sub(" ", raw_text).strip()
     return title
 
 
@@ -600,27 +768,67 @@ def _clean_film_title(raw_text: str) -> str:
 # Film matching
 # ---------------------------------------------------------------------------
 
-def match_films_to_catalog(films: list[dict], catalog: list[dict]) -> list[dict]:
+# Minimum fuzzy_match_score for a title-only catalog match
+FUZZY_TITLE_THRESHOLD = 75
+
+
+class CatalogMatcher:
+    """
+    Catalog lookups for match_films_to_catalog, built once per run.
+
+    Each collection is matched against the same catalog, so the ID/title
+    dicts and the fuzzy-prepared titles are built here once, and a title's
+    fuzzy result is remembered -- popular films recur across many guests.
+    """
+
+    def __init__(self, catalog: list[dict]):
+        # Criterion film ID (from the catalog's criterion URL) -> entry
+        self.by_criterion_id: dict[str, dict] = {}
+        # Lower-cased title -> first entry with that title
+        self.by_title: dict[str, dict] = {}
+        for cat in catalog:
+            if cat.get("criterion_url"):
+                m = _FILM_ID_RE.search(cat["criterion_url"])
+                if m:
+                    self.by_criterion_id[m.group(1)] = cat
+            self.by_title.setdefault(cat["title"].lower(), cat)
+
+        self._catalog = catalog
+        self._prepared_titles = [fuzzy_prepare(cat["title"]) for cat in catalog]
+        self._fuzzy_matches: dict[str, tuple[dict, int] | None] = {}
+
+    def fuzzy_match(self, title: str) -> tuple[dict, int] | None:
+        """Best-scoring catalog entry for title, ties going to the earliest entry."""
+        if title not in self._fuzzy_matches:
+            # Titles that number themselves differently are never the same
+            # release -- "World Cinema Project No. 3" scores 98 against
+            # "...No. 5" -- so a volume conflict disqualifies the candidate.
+            candidates = [
+                (i, score)
+                for i, score in fuzzy_match_scores(title, self._prepared_titles, FUZZY_TITLE_THRESHOLD)
+                if not titles_conflict_on_volume(title, self._catalog[i]["title"])
+            ]
+            if candidates:
+                i, score = max(candidates, key=lambda c: (c[1], -c[0]))
+                self._fuzzy_matches[title] = (self._catalog[i], score)
+            else:
+                self._fuzzy_matches[title] = None
+        return self._fuzzy_matches[title]
+
+
+def match_films_to_catalog(
+    films: list[dict], catalog: list[dict], matcher: CatalogMatcher | None = None
+) -> list[dict]:
     """
     Match scraped Criterion films to our catalog.
     Strategy:
       1. Match by Criterion film URL (if catalog has criterion_url)
       2. Exact title match
       3. Fuzzy title match
+    Pass a CatalogMatcher built from catalog to reuse its lookups across calls.
     """
-    # Build a lookup by criterion URL for fast matching
-    url_lookup = {}
-    for cat in catalog:
-        if cat.get("criterion_url"):
-            url_lookup[cat["criterion_url"]] = cat
-
-    # Build a lookup by film slug from the criterion URL in catalog
-    slug_lookup = {}
-    for cat in catalog:
-        if cat.get("criterion_url"):
-            m = re.search(r"/films/(\d+)", cat["criterion_url"])
-            if m:
-                slug_lookup[m.group(1)] = cat
+    if matcher is None:
+        matcher = CatalogMatcher(catalog)
 
     for film in films:
         film["catalog_spine"] = None
@@ -628,14 +836,13 @@ def match_films_to_catalog(films: list[dict], catalog: list[dict]) -> list[dict]
         film["match_method"] = None
         film["film_id"] = None
 
-        crit_url = film.get("criterion_film_url", "")
         crit_id = film.get("criterion_film_id", "")
         title = film["title"]
 
         # 1. Match by criterion film ID (extracted from URL)
         # Skip for box sets — /boxsets/ IDs are a different namespace than /films/ IDs
-        if crit_id and crit_id in slug_lookup and not film.get("is_box_set"):
-            cat = slug_lookup[crit_id]
+        if crit_id and crit_id in matcher.by_criterion_id and not film.get("is_box_set"):
+            cat = matcher.by_criterion_id[crit_id]
             film["catalog_spine"] = cat["spine_number"]
             film["catalog_title"] = cat["title"]
             film["match_method"] = "criterion_url"
@@ -643,32 +850,18 @@ def match_films_to_catalog(films: list[dict], catalog: list[dict]) -> list[dict]
             continue
 
         # 2. Exact title match
-        matched = False
-        for cat in catalog:
-            if cat["title"].lower() == title.lower():
-                film["catalog_spine"] = cat["spine_number"]
-                film["catalog_title"] = cat["title"]
-                film["match_method"] = "exact"
-                film["film_id"] = cat["film_id"]
-                matched = True
-                break
-        if matched:
+        cat = matcher.by_title.get(title.lower())
+        if cat is not None:
+            film["catalog_spine"] = cat["spine_number"]
+            film["catalog_title"] = cat["title"]
+            film["match_method"] = "exact"
+            film["film_id"] = cat["film_id"]
             continue
 
-        # 3. Fuzzy title match. Titles that number themselves differently are
-        # never the same release — "World Cinema Project No. 3" scores 98 against
-        # "...No. 5" — so a volume conflict disqualifies the candidate outright.
-        best_score = 0
-        best_match = None
-        for cat in catalog:
-            if titles_conflict_on_volume(title, cat["title"]):
-                continue
-            score = fuzzy_match_score(title, cat["title"])
-            if score > best_score and score >= 75:
-                best_score = score
-                best_match = cat
-
-        if best_match:
+        # 3. Fuzzy title match
+        match = matcher.fuzzy_match(title)
+        if match:
+            best_match, best_score = match
             film["catalog_spine"] = best_match["spine_number"]
             film["catalog_title"] = best_match["title"]
             film["match_method"] = f"fuzzy_{best_score}"
@@ -684,34 +877,78 @@ def match_films_to_catalog(films: list[dict], catalog: list[dict]) -> list[dict]
 # Guest matching and merging
 # ---------------------------------------------------------------------------
 
-def find_existing_guest(guest_name: str, guest_slug: str, existing_guests: list[dict]) -> dict | None:
-    """Find an existing guest by slug or fuzzy name match."""
+# Minimum fuzzy_match_name score for a collection to match an existing guest
+GUEST_NAME_THRESHOLD = 85
+
+
+def _first_name_match(name: str, prepared_names: list[str]) -> int | None:
+    """Index of the first fuzzy_prepare()d name scoring GUEST_NAME_THRESHOLD."""
+    hits = fuzzy_match_scores(name, prepared_names, GUEST_NAME_THRESHOLD)
+    return min((i for i, _ in hits), default=None)
+
+
+class GuestIndex:
+    """
+    find_existing_guest's lookups over a guest list, built once per run.
+
+    Guests appended to the list during a run must also be add()ed here.
+    """
+
+    def __init__(self, guests: list[dict]):
+        self.by_slug: dict[str, dict] = {}
+        self.guests: list[dict] = []
+        self.prepared_names: list[str] = []
+        # One entry per part of each joint guest ("A and B")
+        self.joint_guests: list[dict] = []
+        self.joint_parts: list[str] = []
+        for g in guests:
+            self.add(g)
+
+    def add(self, guest: dict) -> None:
+        self.by_slug.setdefault(guest["slug"], guest)
+        self.guests.append(guest)
+        self.prepared_names.append(fuzzy_prepare(guest["name"]))
+        if " and " in guest["name"]:
+            for part in guest["name"].split(" and "):
+                self.joint_guests.append(guest)
+                self.joint_parts.append(fuzzy_prepare(part.strip()))
+
+
+def find_existing_guest(
+    guest_name: str, guest_slug: str, existing_guests: list[dict], index: GuestIndex | None = None
+) -> dict | None:
+    """Find an existing guest by slug or fuzzy name match.
+
+    Each fuzzy pass scores every guest in one rapidfuzz call and, as a
+    guest-by-guest scan would, takes the first guest in list order that clears
+    GUEST_NAME_THRESHOLD. Pass a GuestIndex over existing_guests to reuse its
+    lookups across calls.
+    """
+    if index is None:
+        index = GuestIndex(existing_guests)
+
     # Exact slug match
-    for g in existing_guests:
-        if g["slug"] == guest_slug:
-            return g
+    if guest_slug in index.by_slug:
+        return index.by_slug[guest_slug]
 
     # Fuzzy name match
-    for g in existing_guests:
-        if fuzzy_match_name(g["name"], guest_name, threshold=85):
-            return g
+    i = _first_name_match(guest_name, index.prepared_names)
+    if i is not None:
+        return index.guests[i]
 
     # Handle joint collections: "Cate Blanchett and Todd Field" should match "Cate Blanchett"
     # Check if any existing guest name is contained in the collection name
     if " and " in guest_name:
         parts = [p.strip() for p in guest_name.split(" and ")]
         for part in parts:
-            for g in existing_guests:
-                if fuzzy_match_name(g["name"], part, threshold=85):
-                    return g
+            i = _first_name_match(part, index.prepared_names)
+            if i is not None:
+                return index.guests[i]
 
     # Reverse: check if collection name is a substring match of existing guest
-    for g in existing_guests:
-        if " and " in g["name"]:
-            parts = [p.strip() for p in g["name"].split(" and ")]
-            for part in parts:
-                if fuzzy_match_name(part, guest_name, threshold=85):
-                    return g
+    i = _first_name_match(guest_name, index.joint_parts)
+    if i is not None:
+        return index.joint_guests[i]
 
     return None
 
@@ -722,8 +959,9 @@ def update_index_only(collections: list[dict], existing_guests: list[dict]) -> i
     Returns count of updated guests.
     """
     updated = 0
+    index = GuestIndex(existing_guests)
     for coll in collections:
-        guest = find_existing_guest(coll["name"], coll["slug"], existing_guests)
+        guest = find_existing_guest(coll["name"], coll["slug"], existing_guests, index)
         if guest and not guest.get("criterion_page_url"):
             guest["criterion_page_url"] = coll["collection_url"]
             updated += 1
@@ -761,10 +999,13 @@ def scrape_all_collections(
     limit: int = 0,
     guest_filter: str | None = None,
     resume: bool = True,
+    workers: int = WORKERS,
+    interval: float = REQUEST_DELAY,
 ) -> tuple[list[dict], list[dict]]:
     """
     Scrape film picks from Criterion collection pages.
-    Merges into existing guests and picks data.
+    Pages are fetched in parallel (see scrape_concurrently) but merged in
+    collection order. Merges into existing guests and picks data.
     Saves progress incrementally.
     """
     new_guests = []
@@ -788,6 +1029,9 @@ def scrape_all_collections(
     if limit:
         collections = collections[:limit]
 
+    matcher = CatalogMatcher(catalog)
+    guest_index = GuestIndex(existing_guests)
+
     # Build lookup for existing picks: (guest_slug, film_id) -> index in existing_picks
     existing_pick_index: dict[tuple, int] = {}
     for i, p in enumerate(existing_picks):
@@ -795,149 +1039,152 @@ def scrape_all_collections(
         existing_pick_index[key] = i
 
     # Always re-scrape multi-visit URLs together so visit_index is assigned correctly
-    multi_visit_slugs = {slug for slug, urls in VISIT_CRITERION_URLS.items() if len(urls) >= 2}
-    multi_visit_urls = {url for urls in VISIT_CRITERION_URLS.values() if len(urls) >= 2 for url in urls}
-    completed_urls -= multi_visit_urls
+    completed_urls -= _MULTI_VISIT_URLS
     for p in existing_picks:
-        if p["guest_slug"] in multi_visit_slugs:
+        if p["guest_slug"] in _MULTI_VISIT_SLUGS:
             p["visit_index"] = None
 
-    for coll in tqdm(collections, desc="Scraping Criterion collections"):
-        url = coll["collection_url"]
+    # Skip already-completed collections (resume support)
+    pending = [c for c in collections if c["collection_url"] not in completed_urls]
+    scraped = scrape_concurrently(
+        scraper,
+        _scrape_collection,
+        pending,
+        workers,
+        interval,
+    )
 
-        # Skip already-completed collections (resume support)
-        if url in completed_urls:
-            continue
+    # Closing the generator stops the worker browsers, however the loop exits
+    try:
+        for coll, page, error in tqdm(scraped, total=len(pending), desc="Scraping Criterion collections"):
+            url = coll["collection_url"]
 
-        log(f"  Scraping: {coll['name']} ({url})")
+            log(f"  Scraped: {coll['name']} ({url})")
 
-        try:
-            films, video_ids = scrape_collection_page(scraper, url)
-        except CollectionUnavailable as e:
-            # Not checkpointed: retry on the next run, once Criterion publishes it.
-            log(f"    SKIP (collection not live): {e}")
-            time.sleep(REQUEST_DELAY)
-            continue
-        log(f"    Found {len(films)} films")
-
-        if not films:
-            # Mark as completed even if empty (don't retry empty pages)
-            completed_urls.add(url)
-            save_checkpoint({"completed_urls": list(completed_urls)})
-            time.sleep(REQUEST_DELAY)
-            continue
+            if isinstance(error, CollectionUnavailable):
+                # Not checkpointed: retry on the next run, once Criterion publishes it.
+                log(f"    SKIP (collection not live): {error}")
+                continue
+            if error is not None:
+                raise error
+            films, video_ids = page
+            log(f"    Found {len(films)} films")
+
+            if not films:
+                # Mark as completed even if empty (don't retry empty pages)
+                completed_urls.add(url)
+                save_checkpoint({"completed_urls": list(completed_urls)})
+                continue
 
-        # Match films to catalog
-        films = match_films_to_catalog(films, catalog)
-        matched = sum(1 for f in films if f["catalog_spine"])
-        log(f"    Matched {matched}/{len(films)} to catalog")
-
-        guest_name = coll["name"]
-        guest_slug = coll["slug"]
-
-        # Check if guest already exists
-        existing_guest = find_existing_guest(guest_name, guest_slug, existing_guests)
-
-        if existing_guest:
-            # Update criterion_page_url
-            if not existing_guest.get("criterion_page_url"):
-                existing_guest["criterion_page_url"] = url
-            # Apply discovered video IDs if guest has none
-            _apply_video_ids_to_target(existing_guest, video_ids, guest_name)
-            # Use the existing slug for consistency
-            guest_slug = existing_guest["slug"]
-            guest_name = existing_guest["name"]
-
-            # Determine visit_index from collection URL for multi-visit guests
-            visit_index = 1
-            for i, visit in enumerate(existing_guest.get("visits", [])):
-                if visit.get("criterion_page_url") == url:
-                    visit_index = i + 1
-                    break
+            # Match films to catalog
+            films = match_films_to_catalog(films, catalog, matcher)
+            matched = sum(1 for f in films if f["catalog_spine"])
+            log(f"    Matched {matched}/{len(films)} to catalog")
+
+            guest_name = coll["name"]
+            guest_slug = coll["slug"]
+
+            # Check if guest already exists
+            existing_guest = find_existing_guest(guest_name, guest_slug, existing_guests, guest_index)
+
+            if existing_guest:
+                # Update criterion_page_url
+                if not existing_guest.get("criterion_page_url"):
+                    existing_guest["criterion_page_url"] = url
+                # Apply discovered video IDs if guest has none
+                _apply_video_ids_to_target(existing_guest, video_ids, guest_name)
+                # Use the existing slug for consistency
+                guest_slug = existing_guest["slug"]
+                guest_name = existing_guest["name"]
+
+                # Determine visit_index from collection URL for multi-visit guests
+                visit_index = 1
+                for i, visit in enumerate(existing_guest.get("visits", [])):
+                    if visit.get("criterion_page_url") == url:
+                        visit_index = i + 1
+                        break
+                else:
+                    # Fallback: check VISIT_CRITERION_URLS when visits array doesn't exist yet
+                    visit_index = _VISIT_URL_INDEX.get((guest_slug, url), 1)
             else:
-                # Fallback: check VISIT_CRITERION_URLS when visits array doesn't exist yet
-                slug_urls = VISIT_CRITERION_URLS.get(guest_slug, [])
-                if url in slug_urls:
-                    visit_index = slug_urls.index(url) + 1
-        else:
-            # New guest (not in Letterboxd data)
-            visit_index = 1
-            new_guest = {
-                "name": guest_name,
-                "slug": guest_slug,
-                "profession": None,
-                "photo_url": None,
-                "youtube_video_id": video_ids.get("youtube_video_id"),
-                "youtube_video_url": (
-                    f"https://www.youtube.com/watch?v={video_ids['youtube_video_id']}"
-                    if video_ids.get("youtube_video_id") else None
-                ),
-                "vimeo_video_id": video_ids.get("vimeo_video_id"),
-                "episode_date": None,
-                "letterboxd_list_url": None,
-                "criterion_page_url": url,
-                "pick_count": len(films),
-            }
-            existing_guests.append(new_guest)
-            new_guests.append(new_guest)
-
-        # Add or update picks
-        for film in films:
-            film_id = film.get("film_id", make_film_id(film["title"], None))
-            key = (guest_slug, film_id)
-
-            if key in existing_pick_index:
-                # Update existing entry with Criterion metadata
-                idx = existing_pick_index[key]
-                existing = existing_picks[idx]
-                if not existing.get("criterion_film_url"):
-                    existing["criterion_film_url"] = film.get("criterion_film_url", "")
-                existing["source"] = "criterion"
-                slug_urls = VISIT_CRITERION_URLS.get(guest_slug, [])
-                if len(slug_urls) >= 2 or (existing_guest and len(existing_guest.get("visits", [])) >= 2):
-                    # Keep the earliest visit_index (lowest number) for overlapping films
-                    if not existing.get("visit_index") or visit_index < existing["visit_index"]:
-                        existing["visit_index"] = visit_index
-                continue
+                # New guest (not in Letterboxd data)
+                visit_index = 1
+                new_guest = {
+                    "name": guest_name,
+                    "slug": guest_slug,
+                    "profession": None,
+                    "photo_url": None,
+                    "youtube_video_id": video_ids.get("youtube_video_id"),
+                    "youtube_video_url": (
+                        f"https://www.youtube.com/watch?v={video_ids['youtube_video_id']}"
+                        if video_ids.get("youtube_video_id") else None
+                    ),
+                    "vimeo_video_id": video_ids.get("vimeo_video_id"),
+                    "episode_date": None,
+                    "letterboxd_list_url": None,
+                    "criterion_page_url": url,
+                    "pick_count": len(films),
+                }
+                existing_guests.append(new_guest)
+                guest_index.add(new_guest)
+                new_guests.append(new_guest)
+
+            # Add or update picks
+            for film in films:
+                film_id = film.get("film_id", make_film_id(film["title"], None))
+                key = (guest_slug, film_id)
+
+                if key in existing_pick_index:
+                    # Update existing entry with Criterion metadata
+                    idx = existing_pick_index[key]
+                    existing = existing_picks[idx]
+                    if not existing.get("criterion_film_url"):
+                        existing["criterion_film_url"] = film.get("criterion_film_url", "")
+                    existing["source"] = "criterion"
+                    if guest_slug in _MULTI_VISIT_SLUGS or (existing_guest and len(existing_guest.get("visits", [])) >= 2):
+                        # Keep the earliest visit_index (lowest number) for overlapping films
+                        if not existing.get("visit_index") or visit_index < existing["visit_index"]:
+                            existing["visit_index"] = visit_index
+                    continue
 
-            pick = {
-                "guest_slug": guest_slug,
-                "guest_name": guest_name,
-                "film_title": film["title"],
-                "film_year": None,
-                "film_id": film_id,
-                "catalog_spine": film.get("catalog_spine"),
-                "catalog_title": film.get("catalog_title"),
-                "match_method": film.get("match_method"),
-                "letterboxd_url": "",
-                "criterion_film_url": film.get("criterion_film_url", ""),
-                "source": "criterion",
-                "visit_index": visit_index,
-                "is_box_set": film.get("is_box_set", False),
-                "box_set_name": film.get("box_set_name"),
-                "quote": "",
-                "start_timestamp": None,
-                "youtube_timestamp_url": "",
-                "extraction_confidence": "none",
-            }
-            existing_picks.append(pick)
-            new_picks.append(pick)
-            existing_pick_index[key] = len(existing_picks) - 1
-
-        # Update pick_count for existing guest
-        if existing_guest:
-            guest_picks = [p for p in existing_picks if p["guest_slug"] == guest_slug]
-            existing_guest["pick_count"] = len(guest_picks)
-
-        # Save progress incrementally
-        completed_urls.add(url)
-        save_checkpoint({"completed_urls": list(completed_urls)})
-
-        # Save data after each collection (so interrupted runs keep progress)
-        save_json(GUESTS_FILE, existing_guests)
-        save_json(PICKS_RAW_FILE, existing_picks)
+                pick = {
+                    "guest_slug": guest_slug,
+                    "guest_name": guest_name,
+                    "film_title": film["title"],
+                    "film_year": None,
+                    "film_id": film_id,
+                    "catalog_spine": film.get("catalog_spine"),
+                    "catalog_title": film.get("catalog_title"),
+                    "match_method": film.get("match_method"),
+                    "letterboxd_url": "",
+                    "criterion_film_url": film.get("criterion_film_url", ""),
+                    "source": "criterion",
+                    "visit_index": visit_index,
+                    "is_box_set": film.get("is_box_set", False),
+                    "box_set_name": film.get("box_set_name"),
+                    "quote": "",
+                    "start_timestamp": None,
+                    "youtube_timestamp_url": "",
+                    "extraction_confidence": "none",
+                }
+                existing_picks.append(pick)
+                new_picks.append(pick)
+                existing_pick_index[key] = len(existing_picks) - 1
+
+            # Update pick_count for existing guest
+            if existing_guest:
+                guest_picks = [p for p in existing_picks if p["guest_slug"] == guest_slug]
+                existing_guest["pick_count"] = len(guest_picks)
+
+            # Save progress incrementally
+            completed_urls.add(url)
+            save_checkpoint({"completed_urls": list(completed_urls)})
 
-        time.sleep(REQUEST_DELAY)
+            # Save data after each collection (so interrupted runs keep progress)
+            save_json(GUESTS_FILE, existing_guests)
+            save_json(PICKS_RAW_FILE, existing_picks)
+    finally:
+        scraped.close()
 
     return new_guests, new_picks
 
@@ -977,6 +1224,18 @@ def main():
         action="store_true",
         help="Don't resume from checkpoint; re-scrape all collections",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help=f"Concurrent browsers (default: {WORKERS})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=REQUEST_DELAY,
+        help=f"Seconds between requests across all workers (default: {REQUEST_DELAY})",
+    )
     parser.add_argument(
         "--primary",
         action="store_true",
@@ -1037,7 +1296,9 @@ def main():
 
         # Videos-only mode: extract YouTube/Vimeo video IDs from Criterion pages
         if args.videos_only:
-            updated = extract_videos_from_criterion_pages(scraper, existing_guests)
+            updated = extract_videos_from_criterion_pages(
+                scraper, existing_guests, args.workers, args.rate
+            )
             save_json(GUESTS_FILE, existing_guests)
             log(f"Updated {updated} guests with Criterion page video IDs")
             log(f"Saved {len(existing_guests)} guests to {GUESTS_FILE}")
@@ -1053,6 +1314,8 @@ def main():
             limit=args.limit,
             guest_filter=args.guest,
             resume=not args.no_resume,
+            workers=args.workers,
+            interval=args.rate,
         )
 
         # Final save (redundant with incremental but ensures clean state)
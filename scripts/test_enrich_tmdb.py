@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Fixture tests for scripts.enrich_tmdb.TMDBClient."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.enrich_tmdb import TMDB_MAX_ATTEMPTS, TMDB_MAX_RETRY_DELAY, TMDBClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = "{}"
+
+    def json(self):
+        return {}
+
+
+@mock.patch.dict("os.environ", {"TMDB_READ_ACCESS_TOKEN": "test-token"})
+class RateLimitRetryTests(unittest.TestCase):
+    def make_client(self, responses):
+        client = TMDBClient(cache_path=None)
+        client._rate_limit = lambda: None
+        client.session.get = mock.Mock(side_effect=responses)
+        return client
+
+    def test_retry_after_is_capped_and_last_attempt_does_not_sleep(self):
+        responses = [FakeResponse(429, {"retry-after": "86400"})] * TMDB_MAX_ATTEMPTS
+        with self.make_client(responses) as client, mock.patch("scripts.enrich_tmdb.time.sleep") as sleep:
+            self.assertIsNone(client._get("/movie/1"))
+        self.assertEqual(client.session.get.call_count, TMDB_MAX_ATTEMPTS)
+        self.assertEqual(
+            [c.args[0] for c in sleep.call_args_list],
+            [TMDB_MAX_RETRY_DELAY] * (TMDB_MAX_ATTEMPTS - 1),
+        )
+
+    def test_backs_off_without_retry_after(self):
+        responses = [FakeResponse(429), FakeResponse(429), FakeResponse(200)]
+        with self.make_client(responses) as client, mock.patch("scripts.enrich_tmdb.time.sleep") as sleep:
+            self.assertEqual(client._get("/movie/1"), {})
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [2, 4])
+
+    def test_negative_or_nan_retry_after_backs_off_instead(self):
+        responses = [
+            FakeResponse(429, {"retry-after": "-3"}),
+            FakeResponse(429, {"retry-after": "nan"}),
+            FakeResponse(200),
+        ]
+        with self.make_client(responses) as client, mock.patch("scripts.enrich_tmdb.time.sleep") as sleep:
+            self.assertEqual(client._get("/movie/1"), {})
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [2, 4])
+
+
+@mock.patch.dict("os.environ", {"TMDB_READ_ACCESS_TOKEN": "test-token"})
+class ResponseCacheTests(unittest.TestCase):
+    def test_cache_is_off_by_default(self):
+        with TMDBClient() as client:
+            self.assertIsNone(client._cache)
+
+    def test_cached_response_is_reused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with TMDBClient(cache_path=Path(tmp) / "tmdb.sqlite") as client:
+                client._rate_limit = lambda: None
+                client.session.get = mock.Mock(return_value=FakeResponse(200))
+                client._get("/movie/1")
+                client._get("/movie/1")
+            self.assertEqual(client.session.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
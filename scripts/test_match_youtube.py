@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Fixture tests for scripts.match_youtube."""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts import match_youtube
+from scripts.match_youtube import match_videos_to_guests
+from scripts.utils import fuzzy_match_score, fuzzy_match_scores, fuzzy_prepare
+
+
+def _video(video_id, title, upload_date=""):
+    return {"video_id": video_id, "title": title, "upload_date": upload_date}
+
+
+def _guest(name, slug, **extra):
+    return {"name": name, "slug": slug, **extra}
+
+
+class FuzzyMatchScoresTests(unittest.TestCase):
+    def test_batch_scores_agree_with_pairwise_scores(self):
+        choices = ["Barry Jenkins", "Bong Joon-ho", "Cate Blanchett", "Café Society", ""]
+        prepared = [fuzzy_prepare(c) for c in choices]
+        for query in ["barry jenkins", "Bong Joon Ho", "cate blanchett and todd field", "Cafe"]:
+            expected = {
+                i: fuzzy_match_score(query, c)
+                for i, c in enumerate(choices)
+                if fuzzy_match_score(query, c) >= 70
+            }
+            self.assertEqual(dict(fuzzy_match_scores(query, prepared, threshold=70)), expected)
+
+    def test_half_point_score_rounding_down_misses_odd_threshold(self):
+        # 62.5 rounds (half to even) to 62, so it must not pass a threshold of 63.
+        self.assertEqual(fuzzy_match_score("aaaaabbb", "aaaaaccc"), 62)
+        prepared = [fuzzy_prepare("aaaaaccc")]
+        self.assertEqual(fuzzy_match_scores("aaaaabbb", prepared, threshold=63), [])
+        self.assertEqual(fuzzy_match_scores("aaaaabbb", prepared, threshold=62), [(0, 62)])
+
+    def test_empty_query_scores_nothing(self):
+        self.assertEqual(fuzzy_match_scores("", [fuzzy_prepare("Barry Jenkins")]), [])
+
+    def test_punctuation_only_query_scores_like_pairwise(self):
+        choices = ["??", "Barry Jenkins"]
+        prepared = [fuzzy_prepare(c) for c in choices]
+        expected = {i: fuzzy_match_score("!!", c) for i, c in enumerate(choices)}
+        self.assertEqual(expected, {0: 100, 1: 0})
+        self.assertEqual(dict(fuzzy_match_scores("!!", prepared)), expected)
+        self.assertEqual(fuzzy_match_scores("!!", prepared, threshold=70), [(0, 100)])
+
+
+class MatchVideosToGuestsTests(unittest.TestCase):
+    def test_matches_best_video_per_guest(self):
+        videos = [
+            _video("aaaaaaaaaaa", "Barry Jenkins's Closet Picks"),
+            _video("bbbbbbbbbbb", "Bong Joon Ho's DVD Picks"),
+            _video("ccccccccccc", "Barry Jenkins Interview"),  # not a Closet Picks video
+        ]
+        guests = [_guest("Barry Jenkins", "barry-jenkins"), _guest("Bong Joon-ho", "bong-joon-ho")]
+
+        matches, matched_ids = match_videos_to_guests(videos, guests)
+
+        self.assertEqual(
+            [(v["video_id"], g["slug"]) for v, g in matches],
+            [("aaaaaaaaaaa", "barry-jenkins"), ("bbbbbbbbbbb", "bong-joon-ho")],
+        )
+        self.assertEqual(matched_ids, {"aaaaaaaaaaa", "bbbbbbbbbbb"})
+
+    def test_higher_score_wins_and_ties_keep_earliest_video(self):
+        videos = [
+            _video("ggggggggggg", "Barry Jenkin's Closet Picks"),
+            _video("hhhhhhhhhhh", "Barry Jenkins's Closet Picks"),
+            _video("iiiiiiiiiii", "Barry Jenkins's Criterion Closet Picks"),
+        ]
+        guests = [_guest("Barry Jenkins", "barry-jenkins")]
+
+        matches, _ = match_videos_to_guests(videos, guests)
+
+        self.assertEqual([v["video_id"] for v, _ in matches], ["hhhhhhhhhhh"])
+
+    def test_compound_title_matches_each_guest(self):
+        videos = [_video("ddddddddddd", "Cate Blanchett and Todd Field's Closet Picks")]
+        guests = [_guest("Cate Blanchett", "cate-blanchett"), _guest("Todd Field", "todd-field")]
+
+        matches, _ = match_videos_to_guests(videos, guests)
+
+        self.assertEqual({g["slug"] for _, g in matches}, {"cate-blanchett", "todd-field"})
+
+    def test_spelling_variant_sharing_no_token_still_matches(self):
+        # "jon hamm" vs "john ham" shares no whole token but clears the fuzzy
+        # threshold, so it must still be matched.
+        self.assertGreaterEqual(fuzzy_match_score("jon hamm", "john ham"), 70)
+        videos = [_video("fffffffffff", "Jon Hamm's Closet Picks")]
+        guests = [_guest("John Ham", "john-ham")]
+
+        matches, matched_ids = match_videos_to_guests(videos, guests)
+
+        self.assertEqual([g["slug"] for _, g in matches], ["john-ham"])
+        self.assertEqual(matched_ids, {"fffffffffff"})
+
+    def test_accented_name_matches_ascii_spelling(self):
+        videos = [_video("ggggggggggg", "Björk's Closet Picks")]
+        guests = [_guest("Bjork", "bjork")]
+
+        matches, _ = match_videos_to_guests(videos, guests)
+
+        self.assertEqual([g["slug"] for _, g in matches], ["bjork"])
+
+    def test_skips_guests_with_video_and_non_pilot_guests(self):
+        videos = [
+            _video("aaaaaaaaaaa", "Barry Jenkins's Closet Picks"),
+            _video("eeeeeeeeeee", "Jane Doe's Closet Picks"),
+        ]
+        guests = [
+            _guest("Barry Jenkins", "barry-jenkins", youtube_video_id="zzzzzzzzzzz"),
+            _guest("Jane Doe", "jane-doe"),
+        ]
+
+        self.assertEqual(match_videos_to_guests(videos, guests)[0][0][1]["slug"], "jane-doe")
+        self.assertEqual(match_videos_to_guests(videos, guests, pilot_only=True), ([], set()))
+
+
+class FetchYtDlpListingsTests(unittest.TestCase):
+    def test_listing_past_the_deadline_counts_as_empty(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fake_fetch(url):
+            if url == "slow":
+                release.wait()
+            return [_video("aaaaaaaaaaa", url)]
+
+        with mock.patch.object(match_youtube, "_fetch_yt_dlp_videos", fake_fetch):
+            listings = match_youtube._fetch_yt_dlp_listings(["fast", "slow"], timeout=0.2)
+
+        self.assertEqual(listings, [[_video("aaaaaaaaaaa", "fast")], []])
+
+    def test_listing_that_raises_counts_as_empty(self):
+        def fake_fetch(url):
+            if url == "broken":
+                raise OSError("connection reset")
+            return [_video("aaaaaaaaaaa", url)]
+
+        with mock.patch.object(match_youtube, "_fetch_yt_dlp_videos", fake_fetch):
+            listings = match_youtube._fetch_yt_dlp_listings(["broken", "ok"], timeout=5)
+
+        self.assertEqual(listings, [[], [_video("aaaaaaaaaaa", "ok")]])
+
+
+if __name__ == "__main__":
+    unittest.main()
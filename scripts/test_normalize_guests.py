@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Fixture tests for scripts.normalize_guests."""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts import normalize_guests
+from scripts.normalize_guests import dedup_picks, dedup_picks_raw, recompute_pick_counts
+from scripts.utils import load_json, save_json
+
+
+def pick_row(guest_slug, film_id, **overrides):
+    return {"guest_slug": guest_slug, "film_id": film_id, **overrides}
+
+
+class DedupPicksTests(unittest.TestCase):
+    def test_keeps_highest_confidence_in_first_seen_position(self):
+        picks = [
+            pick_row("a", "f1", extraction_confidence="low", n=1),
+            pick_row("a", "f2", extraction_confidence="medium", n=2),
+            pick_row("a", "f1", extraction_confidence="high", n=3),
+            pick_row("a", "f2", extraction_confidence="medium", n=4),  # tie keeps earlier
+            pick_row("b", "f1", n=5),
+        ]
+
+        self.assertEqual([p["n"] for p in dedup_picks(picks)], [3, 2, 5])
+
+
+class DedupPicksRawTests(unittest.TestCase):
+    def test_prefers_first_criterion_entry_in_first_seen_position(self):
+        picks_raw = [
+            pick_row("a", "f1", source="letterboxd", n=1),
+            pick_row("a", "f2", source="criterion", n=2),
+            pick_row("a", "f1", source="criterion", n=3),
+            pick_row("a", "f1", source="criterion", n=4),
+            pick_row("a", "f2", source="letterboxd", n=5),
+        ]
+
+        self.assertEqual([p["n"] for p in dedup_picks_raw(picks_raw)], [3, 2])
+
+
+class RecomputePickCountsTests(unittest.TestCase):
+    def test_counts_displayable_and_uncovered_raw_criterion_picks(self):
+        guests = [{"slug": "a"}, {"slug": "b"}, {"slug": "c"}]
+        picks = [
+            pick_row("a", "f1", source="criterion"),
+            pick_row("a", "f2", quote="Loved it"),
+            pick_row("a", "f3", quote="  "),  # blank quote, not criterion
+            pick_row("b", "f1", film_slug="f1-slug", quote="x"),
+        ]
+        picks_raw = [
+            pick_row("a", "f3", source="criterion"),  # covered by a processed pick
+            pick_row("a", "f4", source="criterion"),
+            pick_row("a", "f5", source="letterboxd"),
+            pick_row("b", "f1", source="criterion"),  # processed key is the film_slug
+        ]
+
+        recompute_pick_counts(guests, picks, picks_raw)
+
+        self.assertEqual([g["pick_count"] for g in guests], [3, 2, 0])
+
+
+class MergeTableTests(unittest.TestCase):
+    def test_no_secondary_slug_is_also_a_primary(self):
+        # active_merges() filters each phase once up front; that is only sound
+        # while no merge folds away a slug another entry merges into.
+        tables = (normalize_guests.NAME_VARIANT_MERGES, normalize_guests.SOLO_INTO_PAIR_MERGES)
+        secondaries = frozenset().union(*(t.values() for t in tables))
+        primaries = frozenset().union(*(t.keys() for t in tables))
+
+        self.assertFalse(secondaries & primaries)
+        self.assertEqual(len(secondaries), sum(len(t) for t in tables))
+
+
+class NormalizeRerunTests(unittest.TestCase):
+    def _run(self, paths, **kwargs):
+        with mock.patch.multiple(normalize_guests, **paths), contextlib.redirect_stdout(io.StringIO()):
+            normalize_guests.normalize(**kwargs)
+
+    def test_rerun_with_nothing_to_change_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {
+                "GUESTS_FILE": Path(tmp) / "guests.json",
+                "PICKS_FILE": Path(tmp) / "picks.json",
+                "PICKS_RAW_FILE": Path(tmp) / "picks_raw.json",
+            }
+            save_json(paths["GUESTS_FILE"], [
+                {"name": "Seth Rogen and Evan Goldberg", "slug": "seth-rogen-evan-goldberg"},
+                {"name": "Seth Rogen", "slug": "seth-rogen"},
+            ])
+            save_json(paths["PICKS_FILE"], [pick_row("seth-rogen", "f1", guest_name="Seth Rogen", quote="q")])
+            save_json(paths["PICKS_RAW_FILE"], [pick_row("seth-rogen", "f1", guest_name="Seth Rogen")])
+
+            self._run(paths)
+            self.assertEqual(
+                [g["slug"] for g in load_json(paths["GUESTS_FILE"])], ["seth-rogen-evan-goldberg"]
+            )
+            mtimes = {name: path.stat().st_mtime_ns for name, path in paths.items()}
+
+            self._run(paths)
+            self.assertEqual({name: path.stat().st_mtime_ns for name, path in paths.items()}, mtimes)
+
+    def test_non_canonical_key_order_is_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {
+                "GUESTS_FILE": Path(tmp) / "guests.json",
+                "PICKS_FILE": Path(tmp) / "picks.json",
+                "PICKS_RAW_FILE": Path(tmp) / "picks_raw.json",
+            }
+            save_json(paths["GUESTS_FILE"], [{"name": "Seth Rogen", "slug": "seth-rogen"}])
+            save_json(paths["PICKS_RAW_FILE"], [])
+            # Written around save_json, so the keys stay out of schema order.
+            paths["PICKS_FILE"].write_text(
+                '[{"quote": "q", "film_id": "f1", "guest_slug": "seth-rogen", "guest_name": "Seth Rogen"}]'
+            )
+
+            self._run(paths)
+
+            self.assertEqual(
+                list(load_json(paths["PICKS_FILE"])[0]), ["guest_slug", "guest_name", "film_id", "quote"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
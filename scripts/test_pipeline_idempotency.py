@@ -85,6 +85,56 @@ class TestSaveJsonCanonicalizes(unittest.TestCase):
             written = load_json(p)
         self.assertEqual(list(written[0]), ["quote", "guest_slug"])  # untouched
 
+    def test_failed_save_leaves_previous_file_intact(self):
+        import tempfile, os
+        from scripts.utils import save_json, load_json
+        with tempfile.TemporaryDirectory() as d:
+            p = os.path.join(d, "picks.json")
+            save_json(p, [{"guest_slug": "a"}])
+            with self.assertRaises(TypeError):
+                save_json(p, [{"guest_slug": "b"}, object()])  # unserializable mid-list
+            self.assertEqual(load_json(p), [{"guest_slug": "a"}])
+            self.assertEqual(os.listdir(d), ["picks.json"])  # no stray .tmp
+
+    def test_identical_save_does_not_rewrite_file(self):
+        import tempfile, os
+        from scripts.utils import save_json, load_json
+        with tempfile.TemporaryDirectory() as d:
+            p = os.path.join(d, "picks.json")
+            save_json(p, [{"guest_slug": "a"}])
+            os.utime(p, ns=(0, 0))
+            save_json(p, [{"guest_slug": "a"}])
+            self.assertEqual(os.stat(p).st_mtime_ns, 0)
+            save_json(p, [{"guest_slug": "b"}])
+            self.assertNotEqual(os.stat(p).st_mtime_ns, 0)
+            self.assertEqual(load_json(p), [{"guest_slug": "b"}])
+            self.assertEqual(os.listdir(d), ["picks.json"])
+
+    def test_concurrent_saves_each_land_whole(self):
+        import tempfile, os, threading
+        from scripts.utils import save_json, load_json
+        with tempfile.TemporaryDirectory() as d:
+            p = os.path.join(d, "state.json")
+            payloads = [{"writer": n, "cookies": ["x" * 1000] * 50} for n in range(8)]
+            threads = [threading.Thread(target=save_json, args=(p, payload)) for payload in payloads]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertIn(load_json(p), payloads)
+            self.assertEqual(os.listdir(d), ["state.json"])
+
+    def test_save_keeps_target_permissions(self):
+        import tempfile, os, stat
+        from scripts.utils import save_json, load_json
+        with tempfile.TemporaryDirectory() as d:
+            p = os.path.join(d, "state.json")
+            save_json(p, {"cookies": []})
+            os.chmod(p, 0o600)
+            save_json(p, {"cookies": ["a"]})
+            self.assertEqual(stat.S_IMODE(os.stat(p).st_mode), 0o600)
+            self.assertEqual(load_json(p), {"cookies": ["a"]})
+
 
 class TestTmdbSuppression(unittest.TestCase):
     def test_suppressed_film_is_noop_without_network(self):
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Fixture tests for scripts.process_video's quote merge."""
+
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts import process_video
+from scripts.utils import bucket_picks, save_json
+
+
+def _pick(slug, title, **extra):
+    return {"guest_slug": slug, "film_title": title, **extra}
+
+
+class QuoteMergeTests(unittest.TestCase):
+    def run_extract(self, guest, picks, picks_raw, quotes):
+        fake_module = types.SimpleNamespace(extract_quotes_for_guest=lambda *args: quotes)
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(sys.modules, {"scripts.extract_quotes": fake_module}), \
+                mock.patch.object(process_video, "TRANSCRIPTS_DIR", Path(tmp)), \
+                mock.patch.object(process_video, "_get_gemini_model", lambda: None):
+            save_json(Path(tmp) / f"{guest['youtube_video_id']}.json", {"segments": [{"text": "x"}]})
+            self.assertTrue(process_video.step_extract_quotes(
+                guest, picks, bucket_picks(picks), bucket_picks(picks_raw)
+            ))
+
+    def test_duplicates_collapse_only_for_merged_guests(self):
+        guest = {"slug": "ann", "name": "Ann", "youtube_video_id": "aaaaaaaaaaa"}
+        picks = [
+            _pick("ann", "Ran", n=1),
+            _pick("bob", "Ikiru", n=2),
+            _pick("ann", "Ran", n=3),
+            _pick("bob", "Ikiru", n=4),
+        ]
+        picks_raw = [_pick("ann", "Ran", n=5), _pick("ann", "Yojimbo", n=6)]
+        quotes = [{"film_title": "Ran", "quote": "Epic.", "start_timestamp": 0, "confidence": "high"}]
+
+        self.run_extract(guest, picks, picks_raw, quotes)
+        dropped = process_video.collapse_duplicate_picks(picks, {"ann"})
+
+        # Each of the merged guest's films keeps its first position and its
+        # latest content; the raw pick (with its quote) wins, new titles are
+        # appended, and other guests' picks are left alone.
+        self.assertEqual(dropped, 1)
+        self.assertEqual([(p["guest_slug"], p["film_title"], p["n"]) for p in picks], [
+            ("ann", "Ran", 5),
+            ("bob", "Ikiru", 2),
+            ("bob", "Ikiru", 4),
+            ("ann", "Yojimbo", 6),
+        ])
+        self.assertEqual(picks[0]["quote"], "Epic.")
+
+    def test_different_films_sharing_a_title_are_kept(self):
+        guest = {"slug": "guillermo-del-toro", "name": "Guillermo del Toro", "youtube_video_id": "ggggggggggg"}
+        picks = [
+            _pick("guillermo-del-toro", "Roma", film_id="roma-1972", n=1),
+            _pick("guillermo-del-toro", "Roma", film_id="roma-2018", n=2),
+        ]
+        picks_raw = [
+            _pick("guillermo-del-toro", "Roma", film_id="roma-1972", n=3),
+            _pick("guillermo-del-toro", "Roma", film_id="roma-2018", n=4),
+        ]
+        quotes = [{"film_title": "Roma", "quote": "Both.", "start_timestamp": 0, "confidence": "high"}]
+
+        self.run_extract(guest, picks, picks_raw, quotes)
+        dropped = process_video.collapse_duplicate_picks(picks, {"guillermo-del-toro"})
+
+        self.assertEqual(dropped, 0)
+        self.assertEqual([(p["film_id"], p["n"]) for p in picks], [("roma-1972", 3), ("roma-2018", 4)])
+
+    def test_guest_with_quotes_merges_nothing(self):
+        guest = {"slug": "ann", "name": "Ann", "youtube_video_id": "aaaaaaaaaaa"}
+        picks = [_pick("ann", "Ran", quote="Epic.")]
+        picks_raw = [_pick("ann", "Ran")]
+
+        fake_module = types.SimpleNamespace(extract_quotes_for_guest=mock.Mock())
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(sys.modules, {"scripts.extract_quotes": fake_module}), \
+                mock.patch.object(process_video, "TRANSCRIPTS_DIR", Path(tmp)):
+            save_json(Path(tmp) / "aaaaaaaaaaa.json", {"segments": [{"text": "x"}]})
+            merged = process_video.step_extract_quotes(
+                guest, picks, bucket_picks(picks), bucket_picks(picks_raw)
+            )
+
+        self.assertFalse(merged)
+        fake_module.extract_quotes_for_guest.assert_not_called()
+        self.assertEqual(picks, [_pick("ann", "Ran", quote="Epic.")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Fixture tests for scripts.scrape_box_set_images."""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.scrape_box_set_images import (
+    BoxSetCache,
+    CachedPage,
+    TokenBucket,
+    extract_box_set_image,
+    fetch_pages,
+)
+
+URL = "https://www.criterion.com/boxsets/1-example-box"
+PAGE = '<div class="product-box-art"><img src="https://s3.example.com/box.jpg"></div>'
+
+
+class ExtractBoxSetImageTests(unittest.TestCase):
+    def test_falls_back_through_selectors_in_order(self):
+        hero = '<div class="boxset-hero"><img src="hero.jpg"></div>'
+        og = '<meta property="og:image" content="og.jpg">'
+
+        self.assertEqual(extract_box_set_image(CachedPage(200, og + hero + PAGE, URL)), "https://s3.example.com/box.jpg")
+        self.assertEqual(extract_box_set_image(CachedPage(200, og + hero, URL)), "hero.jpg")
+        self.assertEqual(extract_box_set_image(CachedPage(200, og, URL)), "og.jpg")
+        self.assertIsNone(extract_box_set_image(CachedPage(200, "<p>nothing</p>", URL)))
+
+    def test_fast_path_agrees_with_tree_lookup(self):
+        direct = '<div class="x product-box-art">\n<img data-src="lazy.jpg" src="box.jpg?w=1&amp;h=2"></div>'
+        nested = '<div class="product-box-art"><a><img src="nested.jpg"></a></div>'
+
+        self.assertEqual(extract_box_set_image(CachedPage(200, direct, URL)), "box.jpg?w=1&h=2")
+        self.assertEqual(extract_box_set_image(CachedPage(200, nested, URL)), "nested.jpg")
+
+    def test_stale_or_failed_pages_have_no_image(self):
+        self.assertIsNone(extract_box_set_image(CachedPage(200, PAGE, "https://www.criterion.com/shop/browse")))
+        self.assertIsNone(extract_box_set_image(CachedPage(403, PAGE, URL)))
+
+
+class BoxSetCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "cache" / "boxset_html.sqlite"
+
+    def test_page_survives_reopening_until_ttl_expires(self):
+        with BoxSetCache(self.path) as cache:
+            self.assertIsNone(cache.get(URL))
+            cache.put(URL, CachedPage(200, PAGE, URL))
+        with BoxSetCache(self.path) as cache:
+            self.assertEqual(cache.get(URL), CachedPage(200, PAGE, URL))
+            cache.ttl = -1
+            self.assertIsNone(cache.get(URL))
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_spaces_acquisitions_by_interval(self):
+        bucket = TokenBucket(0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+
+class FakeBrowser:
+    """Stands in for the CriterionBrowser class each fetch worker opens."""
+
+    fail_to_start = False
+
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        if self.fail_to_start:
+            raise RuntimeError("Executable doesn't exist")
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def fetch(self, url, timeout=15):
+        if url.endswith("broken"):
+            raise TimeoutError("Timeout 15000ms exceeded")
+        return CachedPage(200, PAGE, url)
+
+
+@mock.patch("scripts.browser_utils.CriterionBrowser", FakeBrowser)
+class FetchPagesTests(unittest.TestCase):
+    def setUp(self):
+        FakeBrowser.fail_to_start = False
+
+    def test_every_entry_comes_back_once_with_failures_as_none(self):
+        entries = [{"criterion_url": f"{URL}-{n}"} for n in range(5)]
+        entries.append({"criterion_url": f"{URL}-broken"})
+
+        results = list(fetch_pages(entries, workers=3, interval=0))
+
+        pages = {entry["criterion_url"]: page for entry, page in results}
+        self.assertEqual(len(results), len(entries))
+        self.assertEqual(set(pages), {e["criterion_url"] for e in entries})
+        self.assertIsNone(pages[f"{URL}-broken"])
+        self.assertEqual(pages[f"{URL}-0"], CachedPage(200, PAGE, f"{URL}-0"))
+
+    def test_zero_workers_fetches_serially(self):
+        entries = [{"criterion_url": f"{URL}-{n}"} for n in range(3)]
+
+        results = list(fetch_pages(entries, workers=0, interval=0))
+
+        self.assertEqual([entry for entry, _ in results], entries)
+
+    def test_every_browser_failing_raises_instead_of_hanging(self):
+        FakeBrowser.fail_to_start = True
+
+        with self.assertRaises(RuntimeError):
+            list(fetch_pages([{"criterion_url": URL}] * 4, workers=3, interval=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,29 @@
 """Fixture tests for scripts.scrape_criterion_picks."""
 
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from scripts.scrape_criterion_picks import CollectionUnavailable, scrape_collection_page
+from scripts.utils import VISIT_CRITERION_URLS
+
+from scripts.scrape_criterion_picks import (
+    MAX_ATTEMPTS,
+    CollectionUnavailable,
+    extract_video_ids,
+    extract_videos_from_criterion_pages,
+    GuestIndex,
+    find_existing_guest,
+    match_films_to_catalog,
+    scrape_all_collections,
+    scrape_index,
+    scrape_collection_page,
+    scrape_concurrently,
+)
 
 COLLECTION_URL = "https://www.criterion.com/shop/collection/989-a-guest-s-closet-picks"
 
@@ -26,6 +43,16 @@ COLLECTION_HTML = """
 </body></html>
 """
 
+PAGINATED_HTML = """
+<html><body>
+  <div class="grid"><a href="/films/612-purple-noon"><figure><img alt="Purple Noon">
+    <figcaption><dl><dt>Purple Noon</dt><dd>Ren&eacute; Cl&eacute;ment</dd></dl></figcaption>
+  </figure></a></div>
+  <ul class="pagination"><li><a href="?page=2">2</a></li></ul>
+  <script>var player = "https://player.vimeo.com/video/123456";</script>
+</body></html>
+"""
+
 
 class FakeScraper:
     """Stands in for CriterionBrowser, returning a canned FetchResult."""
@@ -46,9 +73,39 @@ class FakeScraper:
             status_code = self.status_code
             text = self.html
             url = self.final_url
+            headers = {"retry-after": "0"}
 
         return Result()
 
+    def save_state(self):
+        pass
+
+
+_open_lock = threading.Lock()
+
+
+class FakeBrowser(FakeScraper):
+    """Stands in for the CriterionBrowser class each parallel worker opens."""
+
+    fail_to_start = False
+    threads = set()
+    open_count = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(COLLECTION_HTML, COLLECTION_URL)
+
+    def __enter__(self):
+        if self.fail_to_start:
+            raise RuntimeError("Executable doesn't exist")
+        FakeBrowser.threads.add(threading.get_ident())
+        with _open_lock:
+            FakeBrowser.open_count += 1
+        return self
+
+    def __exit__(self, *exc):
+        with _open_lock:
+            FakeBrowser.open_count -= 1
+
 
 class ScrapeCollectionPageTest(unittest.TestCase):
     def test_redirect_to_browse_raises_instead_of_returning_catalog_films(self):
@@ -80,6 +137,239 @@ class ScrapeCollectionPageTest(unittest.TestCase):
         with self.assertRaises(CollectionUnavailable):
             scrape_collection_page(scraper, COLLECTION_URL)
 
+    def test_paginated_page_is_followed_and_unparsed_markup_still_searched(self):
+        scraper = FakeScraper(PAGINATED_HTML, COLLECTION_URL)
+
+        films, video_ids = scrape_collection_page(scraper, COLLECTION_URL)
+
+        self.assertEqual(scraper.fetched, [COLLECTION_URL, COLLECTION_URL + "?page=2"])
+        self.assertEqual([(f["title"], f["director"]) for f in films], [("Purple Noon", "René Clément")])
+        self.assertEqual(video_ids["vimeo_video_id"], "123456")
+
+
+class ScrapeIndexTest(unittest.TestCase):
+    def test_visit_urls_resolve_to_their_canonical_slug(self):
+        slug, urls = next((s, u) for s, u in VISIT_CRITERION_URLS.items() if len(u) >= 2)
+        html = (
+            f'<a href="{urls[1]}">Watch &amp; shopSomeone Else and Friend\u2019s Closet Picks</a>'
+            '<a href="/shop/collection/989-a-guest-s-closet-picks">A Guest\u2019s Closet Picks</a>'
+        )
+        scraper = FakeScraper(html, "https://www.criterion.com/closet-picks")
+
+        collections = scrape_index(scraper)
+
+        self.assertEqual(
+            [(c["name"], c["slug"]) for c in collections],
+            [("Someone Else and Friend", slug), ("A Guest", "a-guest")],
+        )
+
+
+class ExtractVideosFromCriterionPagesTest(unittest.TestCase):
+    def test_each_page_is_fetched_once_for_all_its_targets(self):
+        other_url = "https://www.criterion.com/shop/collection/990-b-guest-s-closet-picks"
+        guests = [
+            {"name": "A Guest", "slug": "a-guest", "criterion_page_url": COLLECTION_URL,
+             "visits": [{"criterion_page_url": COLLECTION_URL}, {"criterion_page_url": other_url}]},
+            {"name": "B Guest", "slug": "b-guest", "criterion_page_url": other_url},
+        ]
+        html = '<iframe src="https://player.vimeo.com/video/123"></iframe>'
+        scraper = FakeScraper(html, COLLECTION_URL)
+
+        updated = extract_videos_from_criterion_pages(scraper, guests, workers=1, interval=0)
+
+        self.assertEqual(scraper.fetched, [COLLECTION_URL, other_url])
+        self.assertEqual(updated, 2)
+        self.assertEqual(guests[0]["visits"][1]["vimeo_video_id"], "123")
+
+    def test_failed_page_is_not_refetched_for_later_targets(self):
+        guests = [
+            {"name": "A Guest", "slug": "a-guest", "criterion_page_url": COLLECTION_URL,
+             "visits": [{"criterion_page_url": COLLECTION_URL}]},
+        ]
+        scraper = FakeScraper("", COLLECTION_URL, raises=TimeoutError("Timeout 30000ms exceeded"))
+
+        updated = extract_videos_from_criterion_pages(scraper, guests, workers=1, interval=0)
+
+        self.assertEqual((updated, scraper.fetched), (0, [COLLECTION_URL]))
+
+
+class ExtractVideoIdsTest(unittest.TestCase):
+    def test_embeds_win_over_earlier_bare_urls(self):
+        html = (
+            '<p>https://vimeo.com/111 youtube.com/embed/AAAAAAAAAAA</p>'
+            '<iframe data-src="https://player.vimeo.com/video/222"></iframe>'
+            '<iframe src="https://www.youtube-nocookie.com/embed/BBBBBBBBBBB"></iframe>'
+            '<iframe width="560" src="https://www.youtube.com/embed/CCCCCCCCCCC?rel=0"></iframe>'
+            '<a data-fancybox="video" href="https://vimeo.com/333">Watch</a>'
+        )
+
+        self.assertEqual(
+            extract_video_ids(html), {"youtube_video_id": "CCCCCCCCCCC", "vimeo_video_id": "333"}
+        )
+
+    def test_bare_urls_are_the_fallback(self):
+        html = '<script>"https://vimeo.com/video/444"; "youtube.com/embed/DDDDDDDDDDD"</script>'
+
+        self.assertEqual(
+            extract_video_ids(html), {"youtube_video_id": "DDDDDDDDDDD", "vimeo_video_id": "444"}
+        )
+
+
+class MatchFilmsToCatalogTest(unittest.TestCase):
+    CATALOG = [
+        {"spine_number": 1, "film_id": "purple-noon", "title": "Purple Noon",
+         "criterion_url": "https://www.criterion.com/films/612-purple-noon"},
+        {"spine_number": 2, "film_id": "purple-noon-dupe", "title": "purple noon"},
+        {"spine_number": 3, "film_id": "wcp-3", "title": "World Cinema Project No. 3"},
+        {"spine_number": 4, "film_id": "wcp-5", "title": "World Cinema Project No. 5"},
+    ]
+
+    def match(self, **film):
+        return match_films_to_catalog([{"title": "", **film}], self.CATALOG)[0]
+
+    def test_criterion_id_then_first_exact_title(self):
+        self.assertEqual(self.match(title="x", criterion_film_id="612")["match_method"], "criterion_url")
+        self.assertEqual(self.match(title="PURPLE NOON")["film_id"], "purple-noon")
+
+    def test_fuzzy_match_skips_conflicting_volumes(self):
+        film = self.match(title="World Cinema Project No 5")
+
+        self.assertEqual((film["film_id"], film["match_method"]), ("wcp-5", "fuzzy_100"))
+        self.assertEqual(self.match(title="Nothing Alike At All")["film_id"], "nothing-alike-at-all")
+
+
+class FindExistingGuestTest(unittest.TestCase):
+    GUESTS = [
+        {"name": "Cate Blanchett and Todd Field", "slug": "cate-blanchett-todd-field"},
+        {"name": "Barry Jenkins", "slug": "barry-jenkins"},
+        {"name": "Barry Jenkin", "slug": "barry-jenkin"},
+        {"name": "Todd Field", "slug": "todd-field"},
+    ]
+
+    def find(self, name, slug="no-such-slug"):
+        found = find_existing_guest(name, slug, self.GUESTS)
+        return found and found["slug"]
+
+    def test_passes_run_in_order_and_take_the_first_guest(self):
+        self.assertEqual(self.find("Anyone", "todd-field"), "todd-field")
+        self.assertEqual(self.find("Barry Jenkins"), "barry-jenkins")
+        self.assertEqual(self.find("Barry Jenkinss"), "barry-jenkins")
+        self.assertEqual(self.find("Jane Doe and Barry Jenkins"), "barry-jenkins")
+        self.assertEqual(self.find("Cate Blanchett"), "cate-blanchett-todd-field")
+        self.assertIsNone(self.find("Jane Doe"))
+
+    def test_guests_added_to_a_shared_index_are_found(self):
+        guests = list(self.GUESTS)
+        index = GuestIndex(guests)
+        jane = {"name": "Jane Doe and John Roe", "slug": "jane-doe-john-roe"}
+        guests.append(jane)
+        index.add(jane)
+
+        self.assertIs(find_existing_guest("Jane Doe", "jane-doe", guests, index), jane)
+        self.assertIs(find_existing_guest("Anyone", "jane-doe-john-roe", guests, index), jane)
+
+
+class ScrapeConcurrentlyTest(unittest.TestCase):
+    def test_single_worker_reuses_scraper_and_reports_errors_in_order(self):
+        scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL)
+
+        def fetch_status(s, url):
+            if url.endswith("bad"):
+                raise CollectionUnavailable(url)
+            return s.fetch(url).status_code
+
+        urls = ["https://a", "https://bad", "https://c"]
+        results = list(scrape_concurrently(scraper, fetch_status, urls, workers=1, interval=0))
+
+        self.assertEqual([(item, result) for item, result, _ in results],
+                         [("https://a", 200), ("https://bad", None), ("https://c", 200)])
+        self.assertIsInstance(results[1][2], CollectionUnavailable)
+        self.assertEqual(scraper.fetched, ["https://a", "https://c"])
+
+    def test_rate_limited_page_is_retried_then_returned(self):
+        scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL, status_code=429)
+
+        def fetch_status(s, url):
+            return s.fetch(url).status_code
+
+        results = list(scrape_concurrently(scraper, fetch_status, [COLLECTION_URL], interval=0))
+
+        self.assertEqual(results, [(COLLECTION_URL, 429, None)])
+        self.assertEqual(scraper.fetched, [COLLECTION_URL] * MAX_ATTEMPTS)
+
+
+@mock.patch("scripts.browser_utils.CriterionBrowser", FakeBrowser)
+class ScrapeConcurrentlyThreadedTest(unittest.TestCase):
+    def setUp(self):
+        FakeBrowser.fail_to_start = False
+        FakeBrowser.threads = set()
+        FakeBrowser.open_count = 0
+
+    def test_results_come_back_in_input_order_with_errors_in_place(self):
+        # Earlier items take longest, so they finish last.
+        delays = {f"https://{n}": (6 - n) * 0.02 for n in range(6)}
+
+        def fetch_status(s, url):
+            time.sleep(delays[url])
+            if url == "https://2":
+                raise CollectionUnavailable(url)
+            return s.fetch(url).status_code
+
+        main_scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL)
+        results = list(scrape_concurrently(main_scraper, fetch_status, list(delays), workers=3, interval=0))
+
+        self.assertEqual([item for item, _, _ in results], list(delays))
+        self.assertEqual([r for _, r, _ in results], [200, 200, None, 200, 200, 200])
+        self.assertIsInstance(results[2][2], CollectionUnavailable)
+        self.assertEqual(main_scraper.fetched, [], "workers use their own browsers")
+        self.assertGreater(len(FakeBrowser.threads), 1)
+
+    def test_every_browser_failing_falls_back_to_the_main_scraper(self):
+        FakeBrowser.fail_to_start = True
+        main_scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL)
+
+        results = list(scrape_concurrently(
+            main_scraper, lambda s, url: s.fetch(url).status_code, ["https://a", "https://b"],
+            workers=3, interval=0,
+        ))
+
+        self.assertEqual(results, [("https://a", 200, None), ("https://b", 200, None)])
+        self.assertEqual(main_scraper.fetched, ["https://a", "https://b"])
+
+    def test_closing_early_closes_every_worker_browser(self):
+        urls = [f"https://{n}" for n in range(20)]
+        fetched = []
+
+        def fetch_status(s, url):
+            fetched.append(url)
+            time.sleep(0.01)
+            return s.fetch(url).status_code
+
+        main_scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL)
+        scraped = scrape_concurrently(main_scraper, fetch_status, urls, workers=3, interval=0)
+        next(scraped)
+        scraped.close()
+
+        self.assertEqual(FakeBrowser.open_count, 0)
+        self.assertLess(len(fetched), len(urls), "no job is started after the close")
+
+    def test_merge_error_closes_every_worker_browser(self):
+        collections = [
+            {"name": f"Guest {n}", "slug": f"guest-{n}", "collection_url": f"{COLLECTION_URL}-{n}"}
+            for n in range(6)
+        ]
+        main_scraper = FakeScraper(COLLECTION_HTML, COLLECTION_URL)
+
+        with mock.patch("scripts.scrape_criterion_picks.match_films_to_catalog",
+                        side_effect=RuntimeError("bad catalog")), \
+                mock.patch("scripts.scrape_criterion_picks.save_checkpoint"), \
+                mock.patch("scripts.scrape_criterion_picks.save_json"):
+            with self.assertRaises(RuntimeError):
+                scrape_all_collections(main_scraper, [], collections, [], [], resume=False,
+                                       workers=3, interval=0)
+
+        self.assertEqual(FakeBrowser.open_count, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,11 @@ File paths, JSON I/O, slugification, fuzzy matching, env loading.
 """
 
 import json
+import math
 import os
 import re
+import stat
+import threading
 import time
 import unicodedata
 from collections import defaultdict
@@ -13,7 +16,13 @@ from pathlib import Path
 from functools import wraps
 
 from dotenv import load_dotenv
-from thefuzz import fuzz
+from rapidfuzz import fuzz as rf_fuzz, process
+from thefuzz.utils import full_process
+
+try:  # optional: orjson parses/serializes the multi-MB data files several times faster
+    import orjson
+except ImportError:
+    orjson = None
 
 try:  # importable as `schema` (scripts/ on path) or `scripts.schema` (repo root on path)
     from schema import CANONICALIZERS
@@ -45,11 +54,16 @@ VALIDATION_DIR.mkdir(parents=True, exist_ok=True)
 # JSON I/O
 # ---------------------------------------------------------------------------
 
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
 def load_json(path: Path) -> list | dict:
     """Load JSON from a file. Returns empty list if file doesn't exist."""
     path = Path(path)
     if not path.exists():
         return []
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -60,14 +74,98 @@ def save_json(path: Path, data: list | dict, indent: int = 2) -> None:
     For the four canonical data files, records are written with keys in a fixed
     order (see scripts.schema.CANONICALIZERS) so re-runs that change no values
     produce an empty diff.
+
+    The write is atomic: data goes to a sibling .tmp file (unique to the
+    writing thread) that is fsynced and then renamed over the target, so a
+    crash mid-save leaves the previous file intact rather than a truncated
+    one, and concurrent saves each land whole -- the last rename wins. The
+    target keeps its permission bits. If the new bytes equal the existing
+    file's, the file is not rewritten at all.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     canon = CANONICALIZERS.get(path.name)
     if canon and isinstance(data, list):
-        data = [canon(r) if isinstance(r, dict) else r for r in data]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+        data = (canon(r) if isinstance(r, dict) else r for r in data)
+    # One temp file per writing thread, so concurrent saves of the same path
+    # (e.g. parallel browser workers saving cookies) never share one.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        if orjson is not None and indent == 2:
+            # Matches json.dump(indent=2, ensure_ascii=False) for what the data
+            # files hold: strings, ints, bools, null and plain decimal floats.
+            # Exponent-form and non-finite floats are spelled differently.
+            with open(tmp, "wb") as f:
+                if isinstance(data, dict):
+                    f.write(orjson.dumps(data, option=_ORJSON_OPTIONS))
+                else:
+                    _write_json_array(f, data)
+                unchanged = _finish_tmp(f, tmp, path)
+        else:
+            if not isinstance(data, (list, dict)):
+                data = list(data)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+                unchanged = _finish_tmp(f, tmp, path)
+        if unchanged:
+            tmp.unlink()
+            return
+        try:
+            # The rename would otherwise swap in the temp file's own mode.
+            os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+def _finish_tmp(f, tmp: Path, path: Path) -> bool:
+    """Flush a save_json temp file; True if it matches `path` byte for byte.
+
+    An identical file is left untouched (no rewrite, mtime preserved), so the
+    fsync is only paid for content that is actually replaced.
+    """
+    f.flush()
+    try:
+        if path.stat().st_size == tmp.stat().st_size and path.read_bytes() == tmp.read_bytes():
+            return True
+    except FileNotFoundError:
+        pass
+    os.fsync(f.fileno())
+    return False
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename by fsyncing its directory (a no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_json_array(f, rows) -> None:
+    """Write an indent-2 JSON array one record at a time.
+
+    Only one record is serialized in memory at once, and canonicalized records
+    never exist as a second full copy of the list. JSON strings cannot contain
+    raw newlines, so re-indenting a record's lines is safe.
+    """
+    f.write(b"[")
+    first = True
+    for row in rows:
+        f.write(b"\n  " if first else b",\n  ")
+        f.write(orjson.dumps(row, option=_ORJSON_OPTIONS).replace(b"\n", b"\n  "))
+        first = False
+    f.write(b"]" if first else b"\n]")
 
 
 # ---------------------------------------------------------------------------
@@ -97,12 +195,18 @@ def make_film_id(title: str, year: int | None) -> str:
 # Fuzzy Matching
 # ---------------------------------------------------------------------------
 
+def _token_sort_score(text1: str, text2: str) -> int:
+    """thefuzz's token_sort_ratio, scored by rapidfuzz without its wrapper."""
+    # thefuzz rounds rapidfuzz's float score; two strings that both process to
+    # "" score 100 there too, so no empty-string special case here.
+    return int(round(rf_fuzz.token_sort_ratio(fuzzy_prepare(text1), fuzzy_prepare(text2))))
+
+
 def fuzzy_match_name(name1: str, name2: str, threshold: int = 80) -> bool:
     """Check if two names match using fuzzy matching (token sort ratio)."""
     if not name1 or not name2:
         return False
-    score = fuzz.token_sort_ratio(name1.lower().strip(), name2.lower().strip())
-    return score >= threshold
+    return _token_sort_score(name1, name2) >= threshold
 
 
 def fuzzy_match_title(
@@ -115,8 +219,7 @@ def fuzzy_match_title(
     """Check if two film titles match, optionally considering year."""
     if not title1 or not title2:
         return False
-    score = fuzz.token_sort_ratio(title1.lower().strip(), title2.lower().strip())
-    if score >= threshold:
+    if _token_sort_score(title1, title2) >= threshold:
         # If both years are known, they must match (or be within 1 year)
         if year1 and year2:
             return abs(year1 - year2) <= 1
@@ -128,7 +231,46 @@ def fuzzy_match_score(text1: str, text2: str) -> int:
     """Return the token sort ratio score between two strings."""
     if not text1 or not text2:
         return 0
-    return fuzz.token_sort_ratio(text1.lower().strip(), text2.lower().strip())
+    return _token_sort_score(text1, text2)
+
+
+def fuzzy_prepare(text: str) -> str:
+    """Pre-process a string exactly as fuzzy_match_score does before scoring.
+
+    Lets callers that score one side against many prepare that side once.
+    """
+    if not text:
+        return ""
+    return full_process(text.lower().strip(), force_ascii=True)
+
+
+def fuzzy_match_scores(
+    text: str, prepared_choices: list[str], threshold: int = 0
+) -> list[tuple[int, int]]:
+    """Score one string against many in a single native rapidfuzz call.
+
+    `prepared_choices` must already have been through fuzzy_prepare(). Returns
+    (choice_index, score) for every choice scoring at least `threshold`, with
+    scores identical to fuzzy_match_score(text, choice) for non-empty choices.
+    As there, a query that processes to "" (e.g. punctuation only) scores 100
+    against choices that do too. An empty `text` matches nothing.
+    """
+    if not text:
+        return []
+    query = fuzzy_prepare(text)
+    # thefuzz rounds rapidfuzz's float score, so 69.5 may count as 70: cut off
+    # half a point low, then re-check after rounding (round-half-to-even
+    # makes 74.5 a 74, which must not pass a threshold of 75).
+    results = process.extract(
+        query,
+        prepared_choices,
+        scorer=rf_fuzz.token_sort_ratio,
+        processor=None,
+        score_cutoff=max(threshold - 0.5, 0),
+        limit=None,
+    )
+    scored = ((index, int(round(score))) for _, score, index in results)
+    return [(index, score) for index, score in scored if score >= threshold]
 
 
 # Standalone volume numbers: Arabic digits, or Roman numerals of two or more
@@ -176,6 +318,18 @@ def titles_conflict_on_volume(title1: str, title2: str) -> bool:
 # Picks
 # ---------------------------------------------------------------------------
 
+def bucket_picks(picks: list[dict]) -> defaultdict[str, list[dict]]:
+    """Group picks by guest_slug in one pass, keeping file order.
+
+    Buckets hold the same dicts as the list, so edits through a bucket are
+    edits to the list.
+    """
+    by_guest: defaultdict[str, list[dict]] = defaultdict(list)
+    for p in picks:
+        by_guest[p.get("guest_slug")].append(p)
+    return by_guest
+
+
 def backfill_pick_order(rows: list[dict]) -> int:
     """
     Number each guest visit's picks 1..N in file order, returning how many changed.
@@ -237,12 +391,54 @@ def rate_limit(min_interval: float = 1.0):
     return decorator
 
 
+class TokenBucket:
+    """Hands out one token every `interval` seconds, shared across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no token for the next `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+def retry_after(resp) -> float | None:
+    """Seconds from a response's Retry-After header, if it holds a finite,
+    non-negative number (anything else would make time.sleep raise).
+
+    Works for requests responses (case-insensitive headers) and Playwright
+    ones (lowercased header names) alike.
+    """
+    try:
+        delay = float(resp.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+    return delay if math.isfinite(delay) and delay >= 0 else None
+
+
 # ---------------------------------------------------------------------------
 # Logging helpers
 # ---------------------------------------------------------------------------
 
-def log(msg: str) -> None:
-    """Print a timestamped log message."""
+def log(msg: str, *args) -> None:
+    """Print a timestamped log message.
+
+    With args, msg is a %-format string, so callers that may skip a line can
+    pass the values without building the string up front.
+    """
+    if args:
+        msg = msg % args
     ts = time.strftime("%H:%M:%S")
     print(f"[{ts}] {msg}")
 